@@ -0,0 +1,129 @@
+"""
+Font and sound loading off the main thread.
+
+Game.__init__ starts an AssetManager, shows a loading bar while the worker
+thread works through the preload entries of C.FONTS / C.SOUNDS, then hands the
+fonts to Screen.  Entries marked preload=False are loaded synchronously the
+first time they are requested.  Every load is timed; report() lists them,
+slowest first (main.py --asset-timings).
+"""
+
+import threading
+import time
+
+import pygame
+from pygame import mixer
+
+import constants as C
+import sound_cache
+import tracing
+
+
+class AssetManager:
+    """Loads fonts and sounds in the background and caches them by registry key."""
+
+    def __init__(self, audio=True):
+        self.fonts = {}
+        self.sounds = {}        # key -> mixer.Sound, or None if the file is missing / broken
+        self.timings = {}       # 'sound:apple_eat' -> seconds spent loading
+        self._lock = threading.Lock()
+        self._init_lock = threading.Lock()   # font / mixer subsystems start on first use
+        self._mixer_failed = not audio       # audio=False (headless): every sound is None
+        self._queue = ([('font', name) for name, spec in C.FONTS.items() if spec[4]]
+                       + [('sound', key) for key, spec in C.SOUNDS.items() if spec[2] and audio])
+        self._done = 0
+        self._thread = None
+
+    # ------------------------------------------------------------------ background loading
+    def start(self):
+        """Begin loading the preload entries on a daemon thread."""
+        self._thread = threading.Thread(target=self._worker, name='assets', daemon=True)
+        self._thread.start()
+
+    def ensure_mixer(self):
+        """Initialise the mixer on first use; False if there is no usable audio device."""
+        with self._init_lock:
+            if mixer.get_init() is None and not self._mixer_failed:
+                try:
+                    mixer.init()
+                except pygame.error as e:
+                    print(f"Warning: Could not initialise audio, continuing without sound: {e}")
+                    self._mixer_failed = True
+            return mixer.get_init() is not None
+
+    def _worker(self):
+        for kind, name in self._queue:
+            if name not in (self.fonts if kind == 'font' else self.sounds):
+                self._load(kind, name)
+            with self._lock:
+                self._done += 1
+
+    @property
+    def progress(self):
+        """Fraction of preload entries finished, 0.0 – 1.0."""
+        return self._done / len(self._queue) if self._queue else 1.0
+
+    def ready(self):
+        return self._done >= len(self._queue)
+
+    def wait(self):
+        if self._thread is not None:
+            self._thread.join()
+
+    # ------------------------------------------------------------------ access
+    def font(self, name):
+        """Font for a C.FONTS key, loading it now if it isn't cached yet."""
+        if name not in self.fonts:
+            self._load('font', name)
+        return self.fonts[name]
+
+    def sound(self, key):
+        """mixer.Sound for a C.SOUNDS key (None if unavailable), loading it now if needed.
+        Asking for a preload entry the worker hasn't reached yet just loads it here too."""
+        if key not in self.sounds:
+            self._load('sound', key)
+        return self.sounds[key]
+
+    # ------------------------------------------------------------------ loaders
+    def _load(self, kind, name):
+        start = time.perf_counter()
+        asset = self._load_font(name) if kind == 'font' else self._load_sound(name)
+        end = time.perf_counter()
+        elapsed = end - start
+        tracing.complete(f'{kind}:{name}', 'assets', start, end)
+        with self._lock:
+            (self.fonts if kind == 'font' else self.sounds)[name] = asset
+            self.timings[f'{kind}:{name}'] = elapsed
+
+    def _load_font(self, name):
+        family, size, bold, fallback_size, _ = C.FONTS[name]
+        with self._init_lock:
+            if not pygame.font.get_init():
+                pygame.font.init()
+        try:
+            return pygame.font.SysFont(family, size, bold=bold)
+        except pygame.error:
+            return pygame.font.Font(None, fallback_size)
+
+    def _load_sound(self, key):
+        path, volume = C.SOUNDS[key][:2]
+        if path is None:
+            return None   # missing file already reported by constants.get_sound_file_path
+        if not self.ensure_mixer():
+            return None
+        try:
+            sound = sound_cache.load_sound(path)
+        except pygame.error as e:
+            print(f"Warning: Could not load sound '{key}' ({path}): {e}")
+            return None
+        if volume != 1.0:
+            sound.set_volume(volume)
+        return sound
+
+    def report(self):
+        """Per-asset load times, slowest first, as printable lines."""
+        with self._lock:
+            rows = sorted(self.timings.items(), key=lambda kv: kv[1], reverse=True)
+        lines = [f'{name:<28}{seconds * 1000:8.1f} ms' for name, seconds in rows]
+        lines.append(f'{"total":<28}{sum(t for _, t in rows) * 1000:8.1f} ms')
+        return lines
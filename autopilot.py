@@ -0,0 +1,321 @@
+"""
+Path-planning autopilot for load tests and demos (main.py --autopilot,
+batch_runner.py --policy autopilot).
+
+Autopilot(game) returns the direction to steer this tick:
+
+  1. Keep walking the current plan while it still holds: the head is where
+     the plan put it, the target has not moved and none of the remaining
+     steps has become blocked.  Checking the rest of a path is a few lookups
+     per step, so most ticks never search at all.
+  2. Otherwise breadth-first search from the head to the apple – or into the
+     exit portal once the level is cleared.  The search is time-expanded: the
+     step taken t ticks from now is blocked by static obstacles (read from
+     the game's OccupancyGrid), by body segments that will not have moved
+     away by then, and by every cell a moving obstacle is predicted to
+     overlap within C.AUTOPILOT_MOVER_MARGIN ticks of t – its velocity
+     extrapolated in a straight line, wrapped like the board, for up to
+     C.AUTOPILOT_HORIZON ticks.
+  3. A path is only taken if the snake still has room where it ends: the
+     flood fill from the target must reach the snake's future tail or at
+     least as many cells as the snake is long.
+  4. Failing that, chase the tail (always a safe way to stall until the
+     board opens up), and failing that, take the move into the most open
+     space.  A tail path is kept for route() but not walked on: the next
+     tick looks for the apple again.
+
+The time spent deciding is kept per tick (`plan_us`, `plan_hist`, `last_ms`);
+the live game also charges it to an 'autopilot' column of the F3 overlay.
+Board-sized boards only – not the endless world.
+"""
+
+import math
+from collections import deque
+from time import perf_counter
+
+import constants as C
+from batch_runner import Histogram, RunningStats
+from occupancy import STATIC, OccupancyGrid
+
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))   # up, down, left, right
+_REVERSE = (1, 0, 3, 2)
+
+
+class Autopilot:
+    """Steers a Game along BFS paths to the apple, re-searching only when the plan breaks."""
+
+    def __init__(self, horizon=None, margin=None):
+        self.horizon = C.AUTOPILOT_HORIZON if horizon is None else horizon
+        self.margin = C.AUTOPILOT_MOVER_MARGIN if margin is None else margin
+        self.mode = 'idle'        # what the last decision was: apple, door, tail, survival, exit
+        self.counts = {'searched': 0, 'reused': 0, 'tail': 0, 'survival': 0}
+        self.plan_us = RunningStats()   # decision time per tick, microseconds
+        self.plan_hist = Histogram()
+        self.last_ms = 0.0
+        self._plan = deque()      # (cell, direction index) still to walk; cell = y * width + x
+        self._expect = None       # cell the head should be on next tick if the plan was followed
+        self._target = None
+        self._snake = None
+        self._board = None
+        self._neighbours = None
+        self._static = None
+        self._static_key = None
+
+    # ---------------------------------------------------------------- interface
+    def __call__(self, game):
+        """Direction (dx, dy) to steer this tick, or None to carry on."""
+        start = perf_counter()
+        direction = self._decide(game)
+        us = round((perf_counter() - start) * 1e6)
+        self.last_ms = us / 1000
+        self.plan_us.add(us)
+        self.plan_hist.add(us)
+        return direction
+
+    def drive(self, game):
+        """Decide and steer `game` (Game.run() calls this once per tick)."""
+        direction = self(game)
+        if direction is not None:
+            game.steer(direction)
+
+    def route(self):
+        """The moves still planned after this tick's: [(cell the head will be on, (dx, dy))]."""
+        steps, cell = [], self._expect
+        for nxt, direction in self._plan:
+            steps.append((cell, DIRECTIONS[direction]))
+            cell = nxt
+        return steps
+
+    def debug_lines(self):
+        """Text for the F3 overlay."""
+        counts = '  '.join(f'{k} {v}' for k, v in self.counts.items())
+        return [f'autopilot {self.mode}  {self.last_ms:.2f} ms  '
+                f'(avg {self.plan_us.mean / 1000:.2f}, p99 {(self.plan_hist.quantile(0.99) or 0) / 1000:.2f})',
+                f'  {counts}']
+
+    def report(self):
+        """One-line summary of the decision times so far."""
+        if not self.plan_us.n:
+            return 'Autopilot: no ticks planned'
+        hist = self.plan_hist
+        return (f'Autopilot: {self.plan_us.n} ticks, decision time mean {self.plan_us.mean / 1000:.3f} ms, '
+                f'p50 {hist.quantile(0.5) / 1000:.3f}, p99 {hist.quantile(0.99) / 1000:.3f}, '
+                f'max {self.plan_us.max / 1000:.3f} ms; '
+                + ', '.join(f'{k} {v}' for k, v in self.counts.items()))
+
+    # ---------------------------------------------------------------- decision
+    def _decide(self, game):
+        if game.level_exiting:
+            self._forget('exit')
+            return None   # the portal animation moves the snake
+        if game.occupancy is None:
+            game.occupancy = OccupancyGrid()   # Game.step() keeps it current from now on
+            game.occupancy.sync(game)
+        self._prepare(game)
+
+        target = self._goal(game)
+        if game.snake is not self._snake or target != self._target:
+            self._snake, self._target = game.snake, target
+            self._plan.clear()
+        if self._plan and self.mode != 'tail' and self._head == self._expect and self._plan_holds():
+            self.counts['reused'] += 1
+            return self._advance()
+
+        if target is not None:
+            self.counts['searched'] += 1
+            path = self._search(*target)
+            if path and self._roomy(path):
+                self._plan = deque(path)
+                self.mode = 'door' if target[1] is not None else 'apple'
+                return self._advance()
+        self._plan.clear()
+
+        path = self._search(frozenset((self._body[-1],)), None)
+        if path:
+            self.counts['tail'] += 1
+            self.mode = 'tail'
+            self._plan = deque(path)
+            return self._advance()
+        self.counts['survival'] += 1
+        self.mode = 'survival'
+        return self._most_space()
+
+    def _forget(self, mode):
+        self.mode = mode
+        self._plan.clear()
+        self._target = None
+
+    def _advance(self):
+        cell, direction = self._plan.popleft()
+        self._expect = cell
+        return DIRECTIONS[direction]
+
+    # ---------------------------------------------------------------- per-tick state
+    def _prepare(self, game):
+        """Board tables, static cells, body clearing times and mover snapshot for this tick."""
+        w, h = C.GRID_WIDTH, C.GRID_HEIGHT
+        if self._board != (w, h, C.WALL_COLLISION):
+            self._board = (w, h, C.WALL_COLLISION)
+            self._neighbours = [self._cell_neighbours(i % w, i // w, w, h) for i in range(w * h)]
+            self._static_key = None
+        # Static cells only change when obstacles come or go
+        key = tuple(map(id, game.obstacles))
+        if key != self._static_key:
+            self._static_key = key
+            game.occupancy.sync(game)   # no-op unless the game was reset since its last step
+            self._static = game.occupancy.planes[STATIC].ravel().tolist()
+
+        snake = game.snake
+        self._body = body = [y * w + x for x, y in snake.positions]
+        self._head = body[0]
+        self._length = max(snake.length, len(body))
+        pending = self._length - len(body)   # apples eaten but not yet grown into
+        # Segment j is still in place for the first n - j + pending moves (the tail
+        # is checked before it moves away, see Snake.move)
+        self._busy = busy = {}
+        n = len(body)
+        for j in range(n - 1, -1, -1):
+            busy[body[j]] = n - j + pending
+        self._ghost = game.active_buffs.get('ghost_mode', 0)
+        self._reverse = _REVERSE[DIRECTIONS.index(snake.direction)]
+        self._movers = [(mo.float_x, mo.float_y, mo.dx, mo.dy, mo.shape) for mo in game.moving_obstacles]
+        self._mover_cells = {}
+        self._mover_window = {}
+
+    @staticmethod
+    def _cell_neighbours(x, y, w, h):
+        result = []
+        for d, (dx, dy) in enumerate(DIRECTIONS):
+            nx, ny = x + dx, y + dy
+            if C.WALL_COLLISION:
+                if not (0 <= nx < w and 0 <= ny < h):
+                    continue
+            else:
+                nx, ny = nx % w, ny % h
+            result.append((d, ny * w + nx))
+        return tuple(result)
+
+    def _goal(self, game):
+        """(goal cells, required direction index or None), or None when there is nothing to reach."""
+        w = C.GRID_WIDTH
+        if game.apple_visible:
+            return frozenset((game.apple.y * w + game.apple.x,)), None
+        door = game.level_door
+        if door is not None:
+            return frozenset(y * w + x for x, y in door.cells_list), DIRECTIONS.index(door.exit_dir)
+        return None
+
+    # ---------------------------------------------------------------- prediction
+    def _blocked(self, cell, t):
+        """Whether moving into `cell` on the t-th tick from now would hit something."""
+        if t < self._ghost:
+            return False
+        if self._static[cell] or self._busy.get(cell, 0) >= t:
+            return True
+        return bool(self._movers) and t <= self.horizon and cell in self._movers_near(t)
+
+    def _movers_near(self, t):
+        """Cells any moving obstacle is predicted to overlap within `margin` ticks of t."""
+        cells = self._mover_window.get(t)
+        if cells is None:
+            cells = set()
+            for s in range(max(0, t - self.margin), t + self.margin + 1):
+                cells |= self._movers_at(s)
+            self._mover_window[t] = cells
+        return cells
+
+    def _movers_at(self, s):
+        cells = self._mover_cells.get(s)
+        if cells is not None:
+            return cells
+        cells = set()
+        w, h, wrap = C.GRID_WIDTH, C.GRID_HEIGHT, not C.WALL_COLLISION
+        for fx, fy, dx, dy, shape in self._movers:
+            px, py = fx + s * dx, fy + s * dy
+            if wrap:
+                px, py = px % w, py % h
+            x0, y0 = math.floor(px), math.floor(py)
+            xs = (x0, x0 + 1) if px != x0 else (x0,)   # a cell part-way across covers two
+            ys = (y0, y0 + 1) if py != y0 else (y0,)
+            for ox, oy in shape:
+                for x in xs:
+                    for y in ys:
+                        x1, y1 = x + ox, y + oy
+                        if wrap:
+                            cells.add((y1 % h) * w + x1 % w)
+                        elif 0 <= x1 < w and 0 <= y1 < h:
+                            cells.add(y1 * w + x1)
+        self._mover_cells[s] = cells
+        return cells
+
+    # ---------------------------------------------------------------- search
+    def _search(self, goals, arrive):
+        """Shortest [(cell, direction index)] from the head into `goals` (entered moving in
+        direction `arrive`, if given), avoiding cells blocked at the tick they are reached."""
+        start = self._head
+        parent = {start: None}
+        frontier = [start]
+        neighbours, blocked = self._neighbours, self._blocked
+        t = 0
+        while frontier:
+            t += 1
+            reached = []
+            for cell in frontier:
+                for d, n in neighbours[cell]:
+                    if t == 1 and d == self._reverse:
+                        continue
+                    goal = n in goals and (arrive is None or d == arrive)
+                    if (n in parent and not goal) or blocked(n, t):
+                        continue
+                    if goal:
+                        path = [(n, d)]
+                        while parent[cell] is not None:
+                            path.append((cell, parent[cell][1]))
+                            cell = parent[cell][0]
+                        path.reverse()
+                        return path
+                    parent[n] = (cell, d)
+                    reached.append(n)
+            frontier = reached
+        return None
+
+    def _plan_holds(self):
+        blocked = self._blocked
+        return not any(blocked(cell, t) for t, (cell, _) in enumerate(self._plan, 1))
+
+    def _flood(self, start, walls, stop_at, enough):
+        """Cells reachable from `start` without crossing `walls`; stops early at `stop_at` or
+        once `enough` cells were found.  Returns (count, found stop_at)."""
+        static, neighbours = self._static, self._neighbours
+        seen = {start}
+        queue = [start]
+        for cell in queue:
+            for _, n in neighbours[cell]:
+                if n == stop_at:
+                    return len(seen), True
+                if n in seen or n in walls or static[n]:
+                    continue
+                seen.add(n)
+                queue.append(n)
+                if len(seen) >= enough:
+                    return len(seen), False
+        return len(seen), False
+
+    def _roomy(self, path):
+        """Whether the snake, having walked `path`, can still reach its tail or has room to spare."""
+        body = [cell for cell, _ in reversed(path)] + self._body
+        body = body[:self._length + 1]   # +1: the apple at the end of the path grows it
+        count, tail = self._flood(body[0], set(body[1:-1]), body[-1], len(body))
+        return tail or count >= len(body)
+
+    def _most_space(self):
+        """The first move with the most open board behind it (None if every move is blocked)."""
+        best, best_room = None, -1
+        walls = set(self._body[:-1])
+        for d, n in self._neighbours[self._head]:
+            if d == self._reverse or self._blocked(n, 1):
+                continue
+            room, _ = self._flood(n, walls, None, len(self._body) * 2)
+            if room > best_room:
+                best, best_room = DIRECTIONS[d], room
+        return best
@@ -0,0 +1,253 @@
+"""
+Batch simulation of many headless runs across a process pool (balancing).
+
+    python batch_runner.py --runs 10000 --workers 8 --start-level 3
+    python batch_runner.py --runs 1000000 --csv runs.csv
+
+Each worker process builds one headless Game and replays it for every run it
+is handed; run i always uses seed --seed + i, so a batch is reproducible no
+matter how runs are spread over workers.  The snake is driven by a simple
+policy (see POLICIES).  Finished runs stream back through imap_unordered and
+are folded into RunningStats / Histogram per stat as they arrive – memory
+stays constant however many runs are requested.  --csv additionally streams
+one row per run to a file.
+
+The stats are the ones game_over() shows on the death screen
+(Game._collect_run_stats()).
+"""
+
+import argparse
+import csv
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+import constants as C
+
+# Stats aggregated per run, in death-screen order (see Game._collect_run_stats)
+STATS = ('apples', 'time_ticks', 'max_level', 'max_length', 'distance',
+         'magic_apples', 'max_combo', 'longest_streak')
+
+
+# ---------------------------------------------------------------- aggregation
+class RunningStats:
+    """Streaming count / mean / variance / min / max (Welford)."""
+    __slots__ = ('n', 'mean', '_m2', 'min', 'max')
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def stdev(self):
+        return math.sqrt(self._m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+
+class Histogram:
+    """Exact counts of integer values; memory grows with distinct values, not samples."""
+    __slots__ = ('counts', 'n')
+
+    def __init__(self):
+        self.counts = {}
+        self.n = 0
+
+    def add(self, value):
+        self.counts[value] = self.counts.get(value, 0) + 1
+        self.n += 1
+
+    def quantile(self, q):
+        """Smallest value with at least q of the samples at or below it."""
+        if not self.n:
+            return None
+        target = q * self.n
+        seen = 0
+        for value in sorted(self.counts):
+            seen += self.counts[value]
+            if seen >= target:
+                return value
+        return max(self.counts)
+
+
+# ---------------------------------------------------------------- policies
+def _policy_straight(game):
+    return None   # keep the current direction until something is hit
+
+
+def _policy_greedy(game):
+    """Head for the apple – or the exit portal once the level is cleared – by wrap-aware
+    distance, never stepping into an occupied cell if avoidable."""
+    snake = game.snake
+    hx, hy = snake.get_head_position()
+    reverse = (-snake.direction[0], -snake.direction[1])
+    door = game.level_door
+    if door is not None and not game.apple_visible:
+        # Aim for the cell just inside the portal, then step into it towards the wall
+        ex, ey = door.exit_dir
+        inside = [(x - ex, y - ey) for x, y in door.cells_list]
+        if (hx, hy) in inside and door.exit_dir != reverse:
+            return door.exit_dir
+        ax, ay = inside[len(inside) // 2]
+    else:
+        ax, ay = game.apple.x, game.apple.y
+    blocked = set(game._get_occupied_positions())
+    blocked.discard(snake.positions[-1])   # the tail moves away this tick
+    w, h = C.GRID_WIDTH, C.GRID_HEIGHT
+    best, best_key = None, None
+    for d in ((0, -1), (1, 0), (0, 1), (-1, 0)):
+        if d == reverse:
+            continue
+        nx, ny = hx + d[0], hy + d[1]
+        if C.WALL_COLLISION:
+            if not (0 <= nx < w and 0 <= ny < h):
+                continue
+            dist = abs(ax - nx) + abs(ay - ny)
+        else:
+            nx, ny = nx % w, ny % h
+            dx, dy = abs(ax - nx), abs(ay - ny)
+            dist = min(dx, w - dx) + min(dy, h - dy)
+        key = ((nx, ny) in blocked, dist)
+        if best_key is None or key < best_key:
+            best, best_key = d, key
+    return best
+
+
+_autopilot = None
+
+
+def _policy_autopilot(game):
+    """BFS path planner (autopilot.Autopilot); one per worker process, it notices new runs itself."""
+    global _autopilot
+    if _autopilot is None:
+        from autopilot import Autopilot
+        _autopilot = Autopilot()
+    return _autopilot(game)
+
+
+POLICIES = {
+    'autopilot': _policy_autopilot,
+    'greedy': _policy_greedy,
+    'straight': _policy_straight,
+}
+
+
+# ---------------------------------------------------------------- worker side
+_game = None
+_config = None
+
+
+def _init_worker(config):
+    global _game, _config
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    from game import Game
+    _config = config
+    _game = Game(start_level=config['start_level'], seed=config['seed'], autosave=False, headless=True)
+
+
+def _play(seed):
+    """One complete run; returns (seed, ticks played, capped, stats)."""
+    game = _game
+    random.seed(seed)
+    game.seed = seed
+    game.reset()
+    policy = POLICIES[_config['policy']]
+    max_ticks = _config['max_ticks']
+    ticks = 0
+    while ticks < max_ticks:
+        direction = policy(game)
+        if direction is not None:
+            game.steer(direction)
+        ticks += 1
+        if not game.step(render=False):
+            break
+    stats = game._collect_run_stats()
+    return seed, ticks, ticks >= max_ticks and game.running, [stats[name] for name in STATS]
+
+
+# ---------------------------------------------------------------- driver
+def run_batch(runs, workers, seed=0, start_level=1, policy='greedy', max_ticks=5000,
+              chunksize=16, on_result=None, progress_every=0):
+    """Play `runs` runs on `workers` processes.  Returns ({stat: (RunningStats, Histogram)},
+    capped run count).  on_result(seed, ticks, capped, values) sees every run as it finishes."""
+    config = {'seed': seed, 'start_level': start_level, 'policy': policy, 'max_ticks': max_ticks}
+    aggregates = {name: (RunningStats(), Histogram()) for name in STATS}
+    capped = 0
+    done = 0
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(config,)) as pool:
+        seeds = range(seed, seed + runs)
+        for run_seed, ticks, was_capped, values in pool.imap_unordered(_play, seeds, chunksize):
+            for name, value in zip(STATS, values):
+                running, histogram = aggregates[name]
+                running.add(value)
+                histogram.add(value)
+            capped += was_capped
+            done += 1
+            if on_result:
+                on_result(run_seed, ticks, was_capped, values)
+            if progress_every and done % progress_every == 0:
+                rate = done / (time.perf_counter() - start)
+                print(f'  {done}/{runs} runs ({rate:.0f} runs/s)', file=sys.stderr)
+    return aggregates, capped
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batch headless simulation with aggregated run stats')
+    parser.add_argument('--runs', type=int, default=1000, help='number of runs (default 1000)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='worker processes (default: one per CPU)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of run 0; run i uses seed+i')
+    parser.add_argument('--start-level', type=int, default=1, help='level every run starts at')
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='greedy', help='how the snake is steered')
+    parser.add_argument('--max-ticks', type=int, default=5000, help='runs still alive after this many ticks are cut off')
+    parser.add_argument('--chunksize', type=int, default=16, help='runs handed to a worker at a time')
+    parser.add_argument('--csv', metavar='FILE', default=None, help='also stream one row per run to FILE')
+    args = parser.parse_args()
+
+    csv_file = writer = None
+    if args.csv:
+        csv_file = open(args.csv, 'w', newline='')
+        writer = csv.writer(csv_file)
+        writer.writerow(('seed', 'ticks', 'capped') + STATS)
+
+    def on_result(seed, ticks, capped, values):
+        if writer:
+            writer.writerow([seed, ticks, int(capped)] + values)
+
+    start = time.perf_counter()
+    try:
+        aggregates, capped = run_batch(args.runs, args.workers, args.seed, args.start_level, args.policy,
+                                       args.max_ticks, args.chunksize, on_result,
+                                       progress_every=max(1, args.runs // 10))
+    finally:
+        if csv_file:
+            csv_file.close()
+    elapsed = time.perf_counter() - start
+
+    print(f'{args.runs} runs on {args.workers} workers in {elapsed:.1f}s '
+          f'({args.runs / elapsed:.0f} runs/s), policy {args.policy}, {capped} cut off at {args.max_ticks} ticks')
+    print(f'{"stat":<16}{"mean":>10}{"stdev":>10}{"min":>8}{"p50":>8}{"p90":>8}{"p99":>8}{"max":>8}')
+    for name in STATS:
+        running, histogram = aggregates[name]
+        print(f'{name:<16}{running.mean:>10.2f}{running.stdev:>10.2f}{running.min:>8}'
+              f'{histogram.quantile(0.5):>8}{histogram.quantile(0.9):>8}{histogram.quantile(0.99):>8}'
+              f'{running.max:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Round-trip cost of driving games through the line-protocol bot server.
+
+Starts `bot_server.py` as a child process on stdin/stdout, keeps every
+game's occupancy planes up to date from the deltas it sends back (as a real
+controller would) and steps the games with random actions.  Each row packs a
+different number of ticks into one request; --depth requests are kept in
+flight.  Reported: game-ticks per second, the round trip per request and per
+tick, and the server's own time per tick:
+
+    python benchmarks/bench_bot_server.py
+    python benchmarks/bench_bot_server.py --games 256 --per-request 1 8 32 --depth 4
+
+Run from the repository root.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Controller:
+    """Client end of the protocol over a child server's pipes."""
+
+    def __init__(self, games, seed):
+        env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1')
+        self.proc = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, 'bot_server.py'), '--games', str(games), '--seed', str(seed)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, cwd=ROOT, env=env)
+        hello = self.receive()
+        self.games = hello['games']
+        self.planes = np.zeros((self.games, len(hello['channels']), hello['height'], hello['width']), np.uint8)
+        self.next_id = 0
+
+    def send(self, cmd, **fields):
+        self.next_id += 1
+        fields.update(id=self.next_id, cmd=cmd)
+        self.proc.stdin.write(json.dumps(fields, separators=(',', ':')).encode() + b'\n')
+        self.proc.stdin.flush()
+        return self.next_id
+
+    def receive(self):
+        reply = json.loads(self.proc.stdout.readline())
+        if 'error' in reply:
+            raise RuntimeError(f"bot server: {reply['error']}")
+        return reply
+
+    def apply(self, deltas):
+        for planes, delta in zip(self.planes, deltas):
+            if delta:
+                c, x, y, n = np.array(delta, np.int64).reshape(-1, 4).T
+                planes[c, y, x] = n
+
+    def close(self):
+        self.send('close')
+        self.receive()
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+def measure(controller, ticks, per_request, depth, rng):
+    """(game-ticks/s, per-request round trips in ms, server us per tick) over `ticks` ticks."""
+    n = controller.games
+    controller.send('reset', seed=1)
+    controller.apply(controller.receive()['delta'])
+    requests = max(1, ticks // per_request)
+    in_flight, round_trips, server_us = deque(), [], []
+    start = time.perf_counter()
+    sent = 0
+    while sent < requests or in_flight:
+        while sent < requests and len(in_flight) < depth:
+            actions = np.where(rng.random((per_request, n)) < 0.15, rng.integers(0, 4, (per_request, n)), -1)
+            controller.send('step', actions=actions.tolist())
+            in_flight.append(time.perf_counter())
+            sent += 1
+        reply = controller.receive()
+        round_trips.append((time.perf_counter() - in_flight.popleft()) * 1000)
+        for tick in reply['ticks']:
+            controller.apply(tick['delta'])
+            server_us.append(tick['us'])
+    elapsed = time.perf_counter() - start
+    return n * requests * per_request / elapsed, np.array(round_trips), np.array(server_us)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bot server round-trip benchmark')
+    parser.add_argument('--games', type=int, default=64, help='games on the server (default 64)')
+    parser.add_argument('--ticks', type=int, default=256, help='ticks per row (default 256)')
+    parser.add_argument('--per-request', type=int, nargs='+', default=[1, 4, 16],
+                        help='ticks packed into one request, one row each (default 1 4 16)')
+    parser.add_argument('--depth', type=int, default=2, help='requests kept in flight (default 2)')
+    parser.add_argument('--seed', type=int, default=1234, help='seed (default 1234)')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    controller = Controller(args.games, args.seed)
+    try:
+        print(f'{"ticks/req":>10}{"ticks/s":>12}{"rtt p50":>10}{"rtt p99":>10}'
+              f'{"per tick":>10}{"server":>10}   ({args.games} games, depth {args.depth}, ms)')
+        for per_request in args.per_request:
+            rate, rtt, server = measure(controller, args.ticks, per_request, args.depth, rng)
+            print(f'{per_request:>10}{rate:>12,.0f}{np.percentile(rtt, 50):>10.2f}{np.percentile(rtt, 99):>10.2f}'
+                  f'{np.median(rtt) / per_request:>10.2f}{np.median(server) / 1000:>10.2f}')
+    finally:
+        controller.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Micro-benchmark for the entity classes in game_objects.py.
+
+Reports, per entity type, the bytes allocated per instance (tracemalloc, so
+nested Rects / lists count too), plain attribute-read throughput, and
+update() throughput.  Pass --baseline REV to load game_objects.py from another
+git revision and print both sets of numbers side by side, e.g.
+
+    python benchmarks/bench_entities.py --baseline 7f88cf0
+
+Run from the repository root.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import constants as C  # noqa: E402
+import game_objects  # noqa: E402
+
+N_INSTANCES = 5000
+N_UPDATES = 200
+REPEATS = 3   # timings report the best of this many runs to damp scheduler noise
+
+
+def load_revision(rev):
+    """Import game_objects.py as it was at git revision `rev`."""
+    source = subprocess.check_output(['git', 'show', f'{rev}:game_objects.py'], text=True)
+    module = types.ModuleType(f'game_objects_{rev}')
+    module.__file__ = f'{rev}:game_objects.py'
+    exec(compile(source, module.__file__, 'exec'), module.__dict__)
+    return module
+
+
+def _factories(mod):
+    """(name, constructor) pairs covering every entity class the game spawns in bulk."""
+    return [
+        ('Apple',                    lambda i: mod.Apple(i % C.GRID_WIDTH, i % C.GRID_HEIGHT)),
+        ('MagicApple',               lambda i: mod.MagicApple(i % C.GRID_WIDTH, i % C.GRID_HEIGHT)),
+        ('Obstacle',                 lambda i: mod.Obstacle(i % C.GRID_WIDTH, i % C.GRID_HEIGHT)),
+        ('MovingObstacle',           lambda i: mod.MovingObstacle(i % C.GRID_WIDTH, i % C.GRID_HEIGHT)),
+        ('OrthogonalMovingObstacle', lambda i: mod.OrthogonalMovingObstacle(i % C.GRID_WIDTH, i % C.GRID_HEIGHT)),
+        ('SeekerObstacle',           lambda i: mod.SeekerObstacle(i % C.GRID_WIDTH, i % C.GRID_HEIGHT)),
+        ('Particle',                 lambda i: mod.Particle(i % C.GRID_WIDTH, i % C.GRID_HEIGHT)),
+        ('CirclePulse',              lambda i: mod.CirclePulse(i % C.GRID_WIDTH, i % C.GRID_HEIGHT, (255, 0, 0))),
+        ('LevelDoor',                lambda i: mod.LevelDoor(('top', 'bottom', 'left', 'right')[i % 4])),
+    ]
+
+
+def bytes_per_instance(factory):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objs = [factory(i) for i in range(N_INSTANCES)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    # Subtract the list that holds the instances
+    total -= sys.getsizeof(objs)
+    return total / N_INSTANCES
+
+
+def attribute_reads_per_sec(factory):
+    objs = [factory(i) for i in range(N_INSTANCES)]
+    start = time.perf_counter()
+    for _ in range(20):
+        for ob in objs:
+            ob.x; ob.y; ob.x; ob.y
+    elapsed = time.perf_counter() - start
+    return 20 * 4 * N_INSTANCES / elapsed
+
+
+def updates_per_sec(mod, name, factory):
+    """Entity updates/sec using each class's own update() signature."""
+    objs = [factory(i) for i in range(N_INSTANCES // 10)]
+    if name in ('Apple', 'Obstacle'):
+        return None  # static – nothing to update
+    if 'MovingObstacle' in name or name == 'SeekerObstacle':
+        snake = mod.Snake()
+        static = [mod.Obstacle(3, 3), mod.Obstacle(20, 20)]
+        call = lambda ob: ob.update(snake, static)
+    else:
+        call = lambda ob: ob.update()
+    start = time.perf_counter()
+    for _ in range(N_UPDATES):
+        for ob in objs:
+            call(ob)
+    elapsed = time.perf_counter() - start
+    return N_UPDATES * len(objs) / elapsed
+
+
+def measure(mod):
+    results = {}
+    for name, factory in _factories(mod):
+        updates = [updates_per_sec(mod, name, factory) for _ in range(REPEATS)]
+        results[name] = (
+            bytes_per_instance(factory),
+            max(attribute_reads_per_sec(factory) for _ in range(REPEATS)),
+            None if updates[0] is None else max(updates),
+        )
+    return results
+
+
+def _fmt_rate(value):
+    return '-' if value is None else f'{value / 1e6:7.2f} M/s'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Entity memory / attribute-access micro-benchmark')
+    parser.add_argument('--baseline', metavar='REV', default=None,
+                        help='git revision whose game_objects.py is measured for comparison')
+    args = parser.parse_args()
+
+    current = measure(game_objects)
+    baseline = measure(load_revision(args.baseline)) if args.baseline else None
+
+    print(f'{"entity":<26}{"bytes/inst":>12}{"attr reads":>14}{"updates":>14}')
+    for name, (size, reads, updates) in current.items():
+        print(f'{name:<26}{size:>12.0f}{_fmt_rate(reads):>14}{_fmt_rate(updates):>14}')
+        if baseline:
+            b_size, b_reads, b_updates = baseline[name]
+            print(f'{"  " + args.baseline:<26}{b_size:>12.0f}{_fmt_rate(b_reads):>14}{_fmt_rate(b_updates):>14}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Scaling of the shared-memory environment pool (env_pool.EnvPool) with workers.
+
+The same number of environments is stepped with 1, 2, 4, ... worker
+processes (up to --max-workers, default: the CPU count) by random actions,
+and game-ticks per second are reported with the speed-up over one worker:
+
+    python benchmarks/bench_env_pool.py
+    python benchmarks/bench_env_pool.py --backend engine --envs 4096 --ticks 500
+
+Run from the repository root.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from env_pool import EnvPool, SHARDS  # noqa: E402
+
+
+def measure(envs, workers, backend, ticks, seed):
+    """Game-ticks per second over `ticks` pool steps (after one untimed step)."""
+    rng = np.random.default_rng(seed)
+    actions = [np.where(rng.random(envs) < 0.15, rng.integers(0, 4, envs), -1) for _ in range(16)]
+    with EnvPool(envs, workers=workers, backend=backend, seed=seed) as pool:
+        pool.step(actions[0])
+        start = time.perf_counter()
+        for t in range(ticks):
+            pool.step(actions[t % len(actions)])
+        return envs * ticks / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EnvPool scaling benchmark')
+    parser.add_argument('--backend', choices=sorted(SHARDS), default='game', help='shard type (default game)')
+    parser.add_argument('--envs', type=int, default=None,
+                        help='environments in the pool (default 64 for game, 4096 for engine)')
+    parser.add_argument('--ticks', type=int, default=200, help='timed steps (default 200)')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count(),
+                        help='largest worker count tried (default: CPU count)')
+    parser.add_argument('--seed', type=int, default=1234, help='seed (default 1234)')
+    args = parser.parse_args()
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    envs = args.envs or (64 if args.backend == 'game' else 4096)
+
+    counts, workers = [], 1
+    while workers < args.max_workers:
+        counts.append(workers)
+        workers *= 2
+    counts.append(args.max_workers)
+
+    print(f'{"workers":>8}{"ticks/s":>14}{"speed-up":>10}   ({envs} {args.backend} envs)')
+    base = None
+    for workers in counts:
+        rate = measure(envs, workers, args.backend, args.ticks, args.seed)
+        base = base or rate
+        print(f'{workers:>8}{rate:>14,.0f}{rate / base:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
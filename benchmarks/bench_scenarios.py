@@ -0,0 +1,239 @@
+"""
+Benchmark suite of canonical gameplay scenarios.
+
+Each scenario is rebuilt reproducibly from Game(start_level=N, seed=S,
+headless=True) plus a little setup, e.g. a 150-segment snake on level 5 among
+80 mixed obstacles.  Two numbers are measured per scenario:
+
+  sim     ticks/sec of Game.step(render=False) – update, collisions and event
+          dispatch only, no drawing at all
+  render  milliseconds per Game.draw() into the offscreen canvas (the sim is
+          advanced untimed between frames so effects evolve naturally)
+
+The snake is steered along a Hamiltonian cycle of the board and protected by
+a shield (or ghost mode) so runs don't end early; if one does anyway the
+scenario is rebuilt outside the timed region and counted under "resets".
+
+Every measurement is repeated --repeat times on a freshly built scenario and
+the table shows medians.  --record appends the samples to the local history
+(see history.py) for later regression checks between commits:
+
+    python benchmarks/bench_scenarios.py
+    python benchmarks/bench_scenarios.py --scenario darkness --ticks 2000
+    python benchmarks/bench_scenarios.py --repeat 7 --record
+
+Run from the repository root.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import constants as C  # noqa: E402
+from game import Game  # noqa: E402
+from game_objects import ParticleEffect  # noqa: E402
+import history  # noqa: E402
+
+PROTECTION = 10 ** 6   # shield charges / buff ticks that outlast any benchmark run
+
+
+# ---------------------------------------------------------------- steering
+def hamiltonian_cycle(width, height):
+    """Cells of a closed tour over an even-height board: snake through columns 1.. row by
+    row, then return up column 0."""
+    cycle = []
+    for y in range(height):
+        xs = range(1, width) if y % 2 == 0 else range(width - 1, 0, -1)
+        cycle.extend((x, y) for x in xs)
+    cycle.extend((0, y) for y in range(height - 1, -1, -1))
+    return cycle
+
+
+class Pilot:
+    """Keeps the snake on the cycle by setting next_direction before every step."""
+
+    def __init__(self, width, height):
+        self.cycle = hamiltonian_cycle(width, height)
+        self.index = {cell: i for i, cell in enumerate(self.cycle)}
+
+    def place_snake(self, game, length):
+        """Lay a `length`-segment snake along the cycle, head first."""
+        snake = game.snake
+        start = len(self.cycle) // 2
+        snake.positions = [self.cycle[(start - i) % len(self.cycle)] for i in range(length)]
+        snake.length = length
+        head = snake.positions[0]
+        snake.float_x, snake.float_y = float(head[0]), float(head[1])
+        snake.direction = self._direction(head)
+        game.max_snake_length = max(game.max_snake_length, length)
+
+    def _direction(self, head):
+        i = self.index.get(head)
+        if i is None:
+            return None
+        nx, ny = self.cycle[(i + 1) % len(self.cycle)]
+        return nx - head[0], ny - head[1]
+
+    def steer(self, game):
+        direction = self._direction(game.snake.get_head_position())
+        if direction is not None:
+            game.next_direction = direction
+
+
+# ---------------------------------------------------------------- scenarios
+def _shield(game):
+    game.active_buffs['shield'] = PROTECTION
+
+
+def setup_long_snake(game, pilot):
+    """Level 5: 150-segment snake among 80 mixed obstacles."""
+    pilot.place_snake(game, 150)
+    for _ in range(80):
+        game._add_obstacle(random.choice(['static', 'orthogonal', 'diagonal', 'seeker']))
+    _shield(game)
+
+
+def setup_level_clear(game, pilot):
+    """Level 1 with 60 static obstacles, then the level-clear removal burst starts."""
+    pilot.place_snake(game, 30)
+    for _ in range(60):
+        game._add_obstacle('static')
+    game.apples_eaten = C.LEVEL_2_APPLES
+    game._check_for_level_up()
+    _shield(game)
+
+
+def setup_darkness(game, pilot):
+    """Level 3 diagonal movers under the darkness buff."""
+    pilot.place_snake(game, 40)
+    for _ in range(20):
+        game._add_obstacle('diagonal')
+    game.active_buffs['darkness'] = PROTECTION
+    _shield(game)
+
+
+def setup_ghost(game, pilot):
+    """Level 2: 150-segment snake in ghost mode (per-segment alpha) through 30 movers."""
+    pilot.place_snake(game, 150)
+    for _ in range(30):
+        game._add_obstacle('orthogonal')
+    game.active_buffs['ghost_mode'] = PROTECTION
+
+
+def setup_particles(game, pilot):
+    """Level 1 with a continuous storm of obstacle dust and pulse rings."""
+    pilot.place_snake(game, 20)
+    _shield(game)
+    top_up_particles(game)
+
+
+def top_up_particles(game):
+    kinds = ['apple', 'obstacle_static', 'obstacle_orthogonal', 'obstacle_diagonal', 'obstacle_seeker']
+    while len(game.particle_effects) < 40:
+        x, y = random.randrange(C.GRID_WIDTH), random.randrange(C.GRID_HEIGHT)
+        game.particle_effects.append(ParticleEffect(x, y, random.choice(kinds)))
+
+
+# name: (start_level, setup, per-tick hook run outside the timed region)
+SCENARIOS = {
+    'long_snake_l5': (5, setup_long_snake, None),
+    'level_clear':   (1, setup_level_clear, None),
+    'darkness':      (3, setup_darkness, None),
+    'ghost_snake':   (2, setup_ghost, None),
+    'particles':     (1, setup_particles, top_up_particles),
+}
+
+
+# ---------------------------------------------------------------- measurement
+class Scenario:
+    def __init__(self, name, seed):
+        self.name = name
+        self.seed = seed
+        self.start_level, self._setup, self.hook = SCENARIOS[name]
+        random.seed(seed)
+        self.game = Game(start_level=self.start_level, seed=seed, autosave=False, headless=True)
+        self.pilot = Pilot(C.GRID_WIDTH, C.GRID_HEIGHT)
+        self.resets = 0
+        self._setup(self.game, self.pilot)
+
+    def rebuild(self):
+        self.resets += 1
+        random.seed(self.seed + self.resets)
+        self.game.reset()
+        self._setup(self.game, self.pilot)
+
+    def advance(self):
+        """Untimed preparation for the next tick."""
+        if self.hook:
+            self.hook(self.game)
+        self.pilot.steer(self.game)
+
+
+def measure_sim(scenario, ticks):
+    game = scenario.game
+    elapsed = 0.0
+    for _ in range(ticks):
+        scenario.advance()
+        start = time.perf_counter()
+        alive = game.step(render=False)
+        elapsed += time.perf_counter() - start
+        if not alive:
+            scenario.rebuild()
+    return ticks / elapsed
+
+
+def measure_render(scenario, frames):
+    game = scenario.game
+    times = []
+    for _ in range(frames):
+        scenario.advance()
+        if not game.step(render=False):
+            scenario.rebuild()
+            continue
+        start = time.perf_counter()
+        game.draw()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-scenario simulation and render benchmark')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='run only this scenario (repeatable; default: all)')
+    parser.add_argument('--ticks', type=int, default=1000, help='simulation ticks per scenario (default 1000)')
+    parser.add_argument('--frames', type=int, default=300, help='rendered frames per scenario (default 300)')
+    parser.add_argument('--seed', type=int, default=1234, help='scenario seed (default 1234)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='independent samples per scenario and metric (default 5)')
+    parser.add_argument('--record', action='store_true',
+                        help=f'append the samples to {os.path.relpath(history.RESULTS_FILE)}')
+    args = parser.parse_args()
+
+    print(f'{"scenario":<16}{"sim ticks/s":>13}{"render ms":>11}{"p95 ms":>9}{"resets":>8}'
+          f'   (median of {args.repeat})')
+    for name in args.scenario or SCENARIOS:
+        rates, means, p95s, resets = [], [], [], 0
+        for _ in range(args.repeat):
+            # Separate builds so the render pass starts from the same state as the sim pass
+            sim = Scenario(name, args.seed)
+            rates.append(measure_sim(sim, args.ticks))
+            render = Scenario(name, args.seed)
+            times = measure_render(render, args.frames)
+            means.append(statistics.mean(times))
+            p95s.append(statistics.quantiles(times, n=20)[-1] if len(times) >= 2 else float('nan'))
+            resets += sim.resets + render.resets
+        print(f'{name:<16}{statistics.median(rates):>13.0f}{statistics.median(means):>11.2f}'
+              f'{statistics.median(p95s):>9.2f}{resets:>8}')
+        if args.record:
+            params = {'ticks': args.ticks, 'frames': args.frames, 'seed': args.seed}
+            history.record(name, 'sim_ticks_per_s', rates, **params)
+            history.record(name, 'render_ms', means, **params)
+
+
+if __name__ == '__main__':
+    main()
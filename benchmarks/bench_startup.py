@@ -0,0 +1,87 @@
+"""
+Start-up time benchmark with a budget.
+
+Launches the game in fresh interpreter processes (so every run is a cold
+import), lets it load until the first frame and the ready state, and reports
+the median of each milestone recorded by startup.StartupProfiler.  Exits with
+status 1 when the median time to the first frame exceeds --budget-ms, so it can
+gate changes in CI:
+
+    python benchmarks/bench_startup.py --runs 5 --budget-ms 1000
+
+By default SDL's dummy video/audio drivers are used so it runs headless; pass
+--real-display to measure against the real window and audio device.
+Run from the repository root.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULT_PREFIX = 'STARTUP_RESULT '
+BUDGET_MILESTONE = 'first frame'
+
+
+def child():
+    """Runs inside the measured process: build a Game and report its milestones."""
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    from startup import StartupProfiler
+    profiler = StartupProfiler()
+    profiler.install()
+    from game import Game
+    Game(autosave=False, profiler=profiler)
+    print(RESULT_PREFIX + json.dumps(dict(profiler.marks)), flush=True)
+    os._exit(0)   # skip interpreter teardown; only start-up is measured
+
+
+def run_once(real_display):
+    env = dict(os.environ)
+    if not real_display:
+        env.setdefault('SDL_VIDEODRIVER', 'dummy')
+        env.setdefault('SDL_AUDIODRIVER', 'dummy')
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--child'],
+                         env=env, capture_output=True, text=True, check=True).stdout
+    wall = time.perf_counter() - start
+    for line in out.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            marks = json.loads(line[len(RESULT_PREFIX):])
+            marks['process exit'] = wall
+            return marks
+    raise RuntimeError(f'child produced no result:\n{out}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold start-up benchmark with a time budget')
+    parser.add_argument('--runs', type=int, default=5, help='fresh processes to launch (default 5)')
+    parser.add_argument('--budget-ms', type=float, default=1000.0,
+                        help=f'maximum median time to "{BUDGET_MILESTONE}" (default 1000)')
+    parser.add_argument('--real-display', action='store_true',
+                        help='use the real video/audio drivers instead of SDL dummies')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child()
+        return
+
+    runs = [run_once(args.real_display) for _ in range(args.runs)]
+    print(f'{"milestone":<20}{"median":>10}{"min":>10}{"max":>10}   ({args.runs} runs)')
+    for label in runs[0]:
+        values = [r[label] * 1000 for r in runs]
+        print(f'{label:<20}{statistics.median(values):>9.1f}ms{min(values):>8.1f}ms{max(values):>8.1f}ms')
+
+    first_frame = statistics.median(r[BUDGET_MILESTONE] for r in runs) * 1000
+    if first_frame > args.budget_ms:
+        print(f'FAIL: {BUDGET_MILESTONE} took {first_frame:.1f} ms, budget is {args.budget_ms:.0f} ms')
+        sys.exit(1)
+    print(f'OK: {BUDGET_MILESTONE} in {first_frame:.1f} ms (budget {args.budget_ms:.0f} ms)')
+
+
+if __name__ == '__main__':
+    main()
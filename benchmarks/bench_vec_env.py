@@ -0,0 +1,94 @@
+"""
+Throughput of the batched engine (vec_env.BatchedSnakeEngine).
+
+N games are stepped in lockstep by a vectorised greedy bot (head for the
+apple, never into a snake or static cell); games that end restart at once.
+After a short warm-up, so the boards carry obstacles and longer snakes, the
+timed ticks report game-ticks per second for the engine alone and including
+the bot:
+
+    python benchmarks/bench_vec_env.py
+    python benchmarks/bench_vec_env.py --envs 16384 --level 3 --ticks 1000
+    python benchmarks/bench_vec_env.py --repeat 7 --record
+
+--record appends the engine samples to the local history (see history.py)
+as scenario "vec_l<level>_n<envs>".  Run from the repository root.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vec_env import BatchedSnakeEngine, DIRECTIONS  # noqa: E402
+import history  # noqa: E402
+
+
+def greedy(engine):
+    """Per game, the direction that gets closest to the apple (wrap-aware) without
+    entering a snake or static cell or reversing; blocked everywhere -> least bad."""
+    w, h = engine.width, engine.height
+    heads = engine.heads()
+    nx = (heads[:, None, 0] + DIRECTIONS[None, :, 0]) % w
+    ny = (heads[:, None, 1] + DIRECTIONS[None, :, 1]) % h
+    rows = np.arange(engine.n)[:, None]
+    blocked = (engine.occ[rows, ny, nx] > 0) | engine.static[rows, ny, nx]
+    dx = np.abs(nx - engine.apple[:, None, 0])
+    dy = np.abs(ny - engine.apple[:, None, 1])
+    dist = np.minimum(dx, w - dx) + np.minimum(dy, h - dy)
+    reverse = np.all(DIRECTIONS[None] == -engine.direction[:, None], axis=2)
+    return np.argmin(dist + blocked * 1000 + reverse * 10000, axis=1)
+
+
+def measure(envs, level, ticks, warmup, seed):
+    """(engine ticks/s, ticks/s including the bot, games finished, mean final score)."""
+    engine = BatchedSnakeEngine(envs, start_level=level, seed=seed)
+    for _ in range(warmup):
+        engine.step(greedy(engine))
+    episodes = engine.episodes
+    policy = 0.0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        t = time.perf_counter()
+        actions = greedy(engine)
+        policy += time.perf_counter() - t
+        engine.step(actions)
+    elapsed = time.perf_counter() - start
+    games = engine.episodes - episodes
+    return (envs * ticks / (elapsed - policy), envs * ticks / elapsed,
+            games, float(engine.final_score.mean()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batched engine throughput benchmark')
+    parser.add_argument('--envs', type=int, action='append',
+                        help='games stepped in lockstep (repeatable; default 1024 and 4096)')
+    parser.add_argument('--level', type=int, default=1, help='start level 1-5 (default 1)')
+    parser.add_argument('--ticks', type=int, default=500, help='timed ticks (default 500)')
+    parser.add_argument('--warmup', type=int, default=100, help='untimed ticks first (default 100)')
+    parser.add_argument('--seed', type=int, default=1234, help='engine seed (default 1234)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='independent samples per batch size (default 3)')
+    parser.add_argument('--record', action='store_true',
+                        help=f'append the samples to {os.path.relpath(history.RESULTS_FILE)}')
+    args = parser.parse_args()
+
+    print(f'{"envs":>7}{"engine ticks/s":>16}{"with bot":>12}{"games":>8}{"mean score":>12}'
+          f'   (median of {args.repeat}, level {args.level})')
+    for envs in args.envs or (1024, 4096):
+        runs = [measure(envs, args.level, args.ticks, args.warmup, args.seed + i)
+                for i in range(args.repeat)]
+        engine, total, games, score = (statistics.median(col) for col in zip(*runs))
+        print(f'{envs:>7}{engine:>16,.0f}{total:>12,.0f}{games:>8.0f}{score:>12.1f}')
+        if args.record:
+            history.record(f'vec_l{args.level}_n{envs}', 'sim_ticks_per_s', [r[0] for r in runs],
+                           ticks=args.ticks, warmup=args.warmup, seed=args.seed)
+
+
+if __name__ == '__main__':
+    main()
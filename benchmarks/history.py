@@ -0,0 +1,262 @@
+"""
+Benchmark history and regression checks.
+
+bench_scenarios.py --record appends every measured sample set to
+benchmarks/results.jsonl (git-ignored, append-only), one JSON object per
+scenario and metric, keyed by git commit and a fingerprint of the machine.
+Numbers are only ever compared between runs on the same fingerprint.
+
+    python benchmarks/history.py list
+    python benchmarks/history.py compare BASE HEAD [--threshold 5] [--alpha 0.05] [--include-dirty]
+
+compare pools all samples recorded for each commit and runs a two-sided
+Mann-Whitney U test per scenario and metric.  A change is flagged as a
+regression when it is statistically significant (p < alpha) *and* the median
+got worse by more than --threshold percent; the exit status is 1 if anything
+regressed, so it can gate a change to game.py or game_objects.py.  Runs
+recorded with uncommitted changes (marked + by list) are filed under HEAD
+but left out unless --include-dirty is given: that code is not in the commit.
+
+Run from the repository root.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from functools import lru_cache
+
+RESULTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results.jsonl')
+
+# metric name -> True if larger is better
+METRICS = {
+    'sim_ticks_per_s': True,
+    'render_ms': False,
+}
+
+
+# ---------------------------------------------------------------- identity
+def git_commit(rev='HEAD'):
+    """(full sha, dirty flag) for `rev`; dirty only applies to HEAD."""
+    sha = subprocess.check_output(['git', 'rev-parse', rev], text=True).strip()
+    dirty = False
+    if rev == 'HEAD':
+        status = subprocess.check_output(['git', 'status', '--porcelain', '--untracked-files=no'], text=True)
+        dirty = bool(status.strip())
+    return sha, dirty
+
+
+def _cpu_model():
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def machine_info():
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')   # keep compare output clean
+    import pygame
+    return {
+        'system': platform.system(),
+        'machine': platform.machine(),
+        'cpu': _cpu_model(),
+        'cpus': os.cpu_count(),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'sdl': '.'.join(map(str, pygame.get_sdl_version())),
+    }
+
+
+def fingerprint(info):
+    """Short stable id of a machine_info() dict."""
+    return hashlib.sha1(json.dumps(info, sort_keys=True).encode()).hexdigest()[:12]
+
+
+# ---------------------------------------------------------------- storage
+def record(scenario, metric, samples, **params):
+    """Append one sample set for the current commit and machine."""
+    sha, dirty = git_commit()
+    info = machine_info()
+    entry = {
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': sha,
+        'dirty': dirty,
+        'machine': fingerprint(info),
+        'machine_info': info,
+        'scenario': scenario,
+        'metric': metric,
+        'samples': samples,
+        'params': params,
+    }
+    with open(RESULTS_FILE, 'a') as f:
+        f.write(json.dumps(entry) + '\n')
+
+
+def load(path=RESULTS_FILE):
+    entries = []
+    try:
+        with open(path) as f:
+            for n, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    print(f"Warning: skipping malformed line {n} of {path}")
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+# ---------------------------------------------------------------- statistics
+@lru_cache(maxsize=None)
+def _u_counts(n1, n2):
+    """Number of orderings giving each U value, for the exact null distribution."""
+    if n1 == 0 or n2 == 0:
+        return (1,)
+    counts = [0] * (n1 * n2 + 1)
+    for u, c in enumerate(_u_counts(n1 - 1, n2)):     # largest element from sample 1
+        counts[u + n2] += c
+    for u, c in enumerate(_u_counts(n1, n2 - 1)):     # largest element from sample 2
+        counts[u] += c
+    return tuple(counts)
+
+
+def mann_whitney_u(a, b):
+    """Two-sided Mann-Whitney U test.  Returns (U for `a`, p-value).
+    Exact for small samples without ties, otherwise the normal approximation
+    with tie and continuity correction."""
+    n1, n2 = len(a), len(b)
+    if not n1 or not n2:
+        return 0.0, 1.0
+    values = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    n = n1 + n2
+    rank_sum = 0.0
+    tie_term = 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and values[j + 1][0] == values[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1                     # average rank of the tie group
+        rank_sum += rank * sum(1 for k in range(i, j + 1) if values[k][1] == 0)
+        t = j - i + 1
+        tie_term += t ** 3 - t
+        i = j + 1
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+
+    if tie_term == 0 and n <= 30:
+        counts = _u_counts(n1, n2)
+        total = sum(counts)
+        low = min(u, n1 * n2 - u)
+        p = 2 * sum(counts[:int(low) + 1]) / total
+        return u, min(1.0, p)
+
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+    if sigma == 0:
+        return u, 1.0
+    z = (abs(u - mean) - 0.5) / sigma
+    return u, min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+# ---------------------------------------------------------------- commands
+def _samples(entries, sha, machine, include_dirty=False):
+    """{(scenario, metric): [samples]} pooled over every clean run of `sha` on `machine`
+    (and the runs made on top of uncommitted changes, if `include_dirty`)."""
+    pooled = {}
+    for e in entries:
+        if e['commit'] == sha and e['machine'] == machine and (include_dirty or not e['dirty']):
+            pooled.setdefault((e['scenario'], e['metric']), []).extend(e['samples'])
+    return pooled
+
+
+def compare(base, head, threshold, alpha, machine=None, include_dirty=False):
+    """Print a comparison table; returns the number of regressions."""
+    entries = load()
+    base_sha, _ = git_commit(base)
+    head_sha, _ = git_commit(head)
+    machine = machine or fingerprint(machine_info())
+    old = _samples(entries, base_sha, machine, include_dirty)
+    new = _samples(entries, head_sha, machine, include_dirty)
+    if not old or not new:
+        missing = ', '.join(rev for rev, s in ((base, old), (head, new)) if not s)
+        print(f"No recorded results for {missing} on machine {machine}; "
+              f"run bench_scenarios.py --record at that commit first"
+              f"{'' if include_dirty else ' (runs on a dirty tree need --include-dirty)'}.")
+        return 0
+
+    print(f'{base_sha[:10]} -> {head_sha[:10]} on {machine}  (threshold {threshold:g}%, alpha {alpha:g})')
+    print(f'{"scenario":<16}{"metric":<17}{"base":>10}{"head":>10}{"change":>9}{"p":>8}  verdict')
+    regressions = 0
+    for key in sorted(set(old) & set(new)):
+        scenario, metric = key
+        a, b = old[key], new[key]
+        base_median, head_median = statistics.median(a), statistics.median(b)
+        change = (head_median - base_median) / base_median * 100 if base_median else 0.0
+        _, p = mann_whitney_u(a, b)
+        worse = -change if METRICS.get(metric, True) else change   # > 0 means slower
+        if p >= alpha:
+            verdict = 'no significant change'
+        elif worse > threshold:
+            verdict = 'REGRESSION'
+            regressions += 1
+        elif worse < -threshold:
+            verdict = 'improved'
+        else:
+            verdict = 'within threshold'
+        print(f'{scenario:<16}{metric:<17}{base_median:>10.2f}{head_median:>10.2f}'
+              f'{change:>+8.1f}%{p:>8.3f}  {verdict}')
+    return regressions
+
+
+def list_results():
+    rows = {}
+    for e in load():
+        key = (e['commit'][:10], e['dirty'], e['machine'])
+        row = rows.setdefault(key, [e['time'], 0, set()])
+        row[1] += len(e['samples'])
+        row[2].add(e['scenario'])
+    if not rows:
+        print(f"No results recorded yet in {RESULTS_FILE}")
+    for (commit, dirty, machine), (first, samples, scenarios) in rows.items():
+        print(f'{commit}{"+" if dirty else " "} {machine}  {first}  '
+              f'{samples:4d} samples, {len(scenarios)} scenarios')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark history and regression detection')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('list', help='recorded commits and machines')
+    cmp = sub.add_parser('compare', help='test HEAD against BASE for regressions')
+    cmp.add_argument('base', help='baseline git revision')
+    cmp.add_argument('head', nargs='?', default='HEAD', help='revision to check (default HEAD)')
+    cmp.add_argument('--threshold', type=float, default=5.0,
+                     help='percent change of the median treated as a regression (default 5)')
+    cmp.add_argument('--alpha', type=float, default=0.05, help='significance level (default 0.05)')
+    cmp.add_argument('--machine', default=None,
+                     help='machine fingerprint to compare on (default: this machine)')
+    cmp.add_argument('--include-dirty', action='store_true',
+                     help='also pool runs recorded with uncommitted changes')
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        list_results()
+    elif compare(args.base, args.head, args.threshold, args.alpha, args.machine,
+                 args.include_dirty):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
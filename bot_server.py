@@ -0,0 +1,277 @@
+"""
+Line-protocol bot server: drive many headless games from another process.
+
+    python bot_server.py --games 256                  # JSON lines on stdin / stdout
+    python bot_server.py --games 256 --port 7777      # ... or on 127.0.0.1:7777
+
+A controller written in any language talks to the server in JSON lines – one
+UTF-8 JSON object per line each way.  On connecting it receives a hello:
+
+    {"hello": "snake-bot-server", "version": 1, "games": 256, "width": 30, "height": 30,
+     "channels": ["body", "head", ...], "actions": ["up", "down", "left", "right"]}
+
+and then sends requests, every one answered by exactly one reply line carrying
+the same "id":
+
+    {"id": 1, "cmd": "reset", "seed": 7}
+    {"id": 2, "cmd": "step", "actions": [[0, -1, 3, ...], [-1, -1, 2, ...]]}
+    {"id": 3, "cmd": "stats"}
+    {"id": 4, "cmd": "close"}
+
+A step carries one or more ticks, each a list with one action per game (0 up,
+1 down, 2 left, 3 right, -1 keep) or a single action for every game; they are
+played back to back and the reply holds a record per tick:
+
+    {"id": 2, "ticks": [{"reward": [...], "done": [...], "score": [...],
+                         "delta": [[c, x, y, n, c, x, y, n, ...], ...], "us": 812}, ...]}
+
+"delta" lists, per game, the occupancy cells (see occupancy.CHANNELS) whose
+count changed since the previous reply as flat (channel, x, y, new count)
+quadruples, so a controller keeps its own (channel, H, W) planes current
+from a few cells per tick; the first reply on a connection (and a reset)
+sends the whole board.  "score" is each game's score after the tick; a
+game with "done" set ended on that tick with that score and has already
+restarted, like in env_pool.EnvPool.  "us" is the
+server time spent on the tick and "stats" returns its distribution.
+
+Requests are read and answered strictly in order, so a controller can
+pipeline: keep several step requests in flight, or put several ticks in
+one request, and the round trip is paid once for all of them.  Malformed
+requests get {"id": ..., "error": "..."} and the session carries on.
+
+With --port the server accepts one controller at a time on 127.0.0.1; the
+games live on between connections.  Board-sized boards only (not --endless).
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import sys
+import time
+
+import numpy as np
+
+import constants as C
+from batch_runner import Histogram, RunningStats
+
+ACTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))   # up, down, left, right
+PROTOCOL_VERSION = 1
+
+
+class BotTable:
+    """N headless games with their occupancy planes and the planes last sent to the client."""
+
+    def __init__(self, n, start_level=1, seed=0):
+        if C.ENDLESS_WORLD:
+            raise ValueError('the bot server needs a bounded board, not the endless world')
+        os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+        from game import Game   # imported late: pygame must not print before stdout is redirected
+        from occupancy import CHANNELS, OccupancyGrid
+        self.n = n
+        self.channels = CHANNELS
+        random.seed(seed)
+        self.games = []
+        for i in range(n):
+            game = Game(start_level=start_level, seed=seed + i, autosave=False, headless=True)
+            game.occupancy = OccupancyGrid()
+            game.occupancy.sync(game)
+            self.games.append(game)
+        self.sent = np.zeros((n,) + self.games[0].occupancy.planes.shape, np.uint8)
+        self.tick_us = RunningStats()
+        self.tick_hist = Histogram()
+        self.requests = 0
+
+    def forget_sent(self):
+        """The next reply describes every board from scratch (new connection)."""
+        self.sent.fill(0)
+
+    def reset(self, seed=None):
+        if seed is not None:
+            random.seed(seed)
+        for i, game in enumerate(self.games):
+            if seed is not None:
+                game.seed = seed + i
+            game.reset()
+            game.occupancy.sync(game)
+        self.forget_sent()
+        return {'score': [0] * self.n, 'delta': self._deltas()}
+
+    def check(self, actions):
+        """Raise ValueError unless `actions` is one valid tick."""
+        if type(actions) is int:   # not isinstance: JSON true / false are bools
+            actions = (actions,)
+        elif not isinstance(actions, list) or len(actions) != self.n:
+            raise ValueError(f'a tick must be one action or a list of {self.n}')
+        for action in actions:
+            if type(action) is not int or not -1 <= action < len(ACTIONS):
+                raise ValueError(f'invalid action {action!r} (0-3, or -1 to keep the heading)')
+
+    def step(self, actions):
+        """Play one tick; `actions` is one action per game or a single int for all."""
+        start = time.perf_counter()
+        if type(actions) is int:
+            actions = (actions,) * self.n
+        reward, done, score = [0] * self.n, [False] * self.n, [0] * self.n
+        for i, (game, action) in enumerate(zip(self.games, actions)):
+            if action >= 0:
+                game.steer(ACTIONS[action])
+            before = game.score
+            running = game.step(render=False)
+            reward[i] = game.score - before
+            score[i] = game.score
+            if not running:
+                done[i] = True
+                game.reset()
+                game.occupancy.sync(game)
+        record = {'reward': reward, 'done': done, 'score': score, 'delta': self._deltas()}
+        us = round((time.perf_counter() - start) * 1e6)
+        record['us'] = us
+        self.tick_us.add(us)
+        self.tick_hist.add(us)
+        return record
+
+    def _deltas(self):
+        """Per game: flat (channel, x, y, count) for every cell that differs from what was sent."""
+        deltas = []
+        for game, sent in zip(self.games, self.sent):
+            planes = game.occupancy.planes
+            changed = np.flatnonzero(planes != sent)
+            if not len(changed):
+                deltas.append([])
+                continue
+            channel, y, x = np.unravel_index(changed, planes.shape)
+            deltas.append(np.stack((channel, x, y, planes.ravel()[changed]), axis=1).ravel().tolist())
+            sent[...] = planes
+        return deltas
+
+    def stats(self):
+        hist, running = self.tick_hist, self.tick_us
+        return {
+            'requests': self.requests,
+            'ticks': running.n,
+            'games': self.n,
+            'tick_us_mean': round(running.mean, 1),
+            'tick_us_p50': hist.quantile(0.5),
+            'tick_us_p90': hist.quantile(0.9),
+            'tick_us_p99': hist.quantile(0.99),
+            'tick_us_max': running.max if running.n else None,
+        }
+
+
+def _hello(table):
+    return {
+        'hello': 'snake-bot-server', 'version': PROTOCOL_VERSION, 'games': table.n,
+        'width': C.GRID_WIDTH, 'height': C.GRID_HEIGHT, 'channels': list(table.channels),
+        'actions': ['up', 'down', 'left', 'right'],
+    }
+
+
+def _handle(table, request):
+    """The reply to one decoded request, or None to end the session."""
+    cmd = request.get('cmd')
+    if cmd == 'step':
+        ticks = request.get('actions')
+        if not isinstance(ticks, list) or not ticks:
+            raise ValueError("'actions' must be a non-empty list of ticks")
+        for actions in ticks:   # check them all before playing any
+            table.check(actions)
+        return {'ticks': [table.step(actions) for actions in ticks]}
+    if cmd == 'reset':
+        seed = request.get('seed')
+        if seed is not None and type(seed) is not int:
+            raise ValueError("'seed' must be an integer")
+        return table.reset(seed)
+    if cmd == 'stats':
+        return table.stats()
+    if cmd == 'close':
+        return None
+    raise ValueError(f"unknown cmd {cmd!r} (reset, step, stats, close)")
+
+
+def serve(table, rfile, wfile):
+    """Answer requests read from binary file `rfile` on `wfile` until close or EOF."""
+    table.forget_sent()
+
+    def send(message):
+        wfile.write(json.dumps(message, separators=(',', ':')).encode() + b'\n')
+        wfile.flush()
+
+    send(_hello(table))
+    for line in rfile:
+        if not line.strip():
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError('a request must be a JSON object')
+            request_id = request.get('id')
+            reply = _handle(table, request)
+        except ValueError as e:   # json.JSONDecodeError included
+            reply = {'error': str(e)}
+        table.requests += 1
+        if reply is None:
+            send({'id': request_id, 'closed': True})
+            return False
+        reply['id'] = request_id
+        send(reply)
+    return True
+
+
+def serve_tcp(table, port, host=None):
+    """Accept one controller at a time on host:port until interrupted."""
+    with socket.create_server((host or C.BOT_SERVER_HOST, port)) as server:
+        print(f'Bot server on {server.getsockname()[0]}:{server.getsockname()[1]} '
+              f'({table.n} games)', file=sys.stderr)
+        while True:
+            conn, addr = server.accept()
+            with conn:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                rfile, wfile = conn.makefile('rb'), conn.makefile('wb')
+                try:
+                    serve(table, rfile, wfile)
+                except ConnectionError:
+                    pass
+                finally:
+                    rfile.close()
+                    try:
+                        wfile.close()
+                    except ConnectionError:
+                        pass
+            print(f'Controller {addr[0]}:{addr[1]} left; {_summary(table)}', file=sys.stderr)
+
+
+def _summary(table):
+    s = table.stats()
+    if not s['ticks']:
+        return 'no ticks played'
+    return (f"{s['ticks']} ticks x {s['games']} games in {s['requests']} requests, per tick "
+            f"mean {s['tick_us_mean']:.0f}us p50 {s['tick_us_p50']}us p99 {s['tick_us_p99']}us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve headless games to external bots over JSON lines')
+    parser.add_argument('--games', type=int, default=64, help='games driven in lockstep (default 64)')
+    parser.add_argument('--port', type=int, default=None,
+                        help='listen on 127.0.0.1:PORT instead of using stdin/stdout')
+    parser.add_argument('--start-level', type=int, default=1, help='level every game starts at')
+    parser.add_argument('--seed', type=int, default=0, help='seed of game 0; game i uses seed+i')
+    args = parser.parse_args()
+    if args.port is None:
+        rfile, wfile = sys.stdin.buffer, sys.stdout.buffer
+        sys.stdout = sys.stderr   # whatever the game prints must stay out of the protocol stream
+    table = BotTable(args.games, args.start_level, args.seed)
+    try:
+        if args.port is None:
+            serve(table, rfile, wfile)
+        else:
+            serve_tcp(table, args.port)
+    except KeyboardInterrupt:
+        pass
+    print(_summary(table), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
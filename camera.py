@@ -0,0 +1,80 @@
+import constants as C
+
+
+class Camera:
+    """Viewport onto a board that is larger than the window.
+
+    Tracks the top-left board cell shown on screen and converts board
+    coordinates (cells, floats allowed) into screen pixels.  The view scrolls
+    in whole cells so the background grid never has to move.  On a wrapping
+    board the view can straddle the seam; objects on the far side are mapped
+    next to the near edge so nothing pops at the wrap line.  In endless mode the
+    board has no edges at all and the view is never clamped."""
+
+    def __init__(self, view_width=C.VIEW_WIDTH, view_height=C.VIEW_HEIGHT,
+                 board_width=None, board_height=None, wrap=None):
+        self.view_width   = view_width
+        self.view_height  = view_height
+        self.board_width  = board_width if board_width is not None else C.GRID_WIDTH
+        self.board_height = board_height if board_height is not None else C.GRID_HEIGHT
+        self.bounded = not C.ENDLESS_WORLD
+        self.wrap = (self.bounded and not C.WALL_COLLISION) if wrap is None else wrap
+        self.left = 0
+        self.top  = 0
+
+    # ------------------------------------------------------------------ following
+    def center_on(self, gx, gy):
+        """Jump so that cell (gx, gy) is in the middle of the view."""
+        self.left = gx - self.view_width // 2
+        self.top  = gy - self.view_height // 2
+        self._clamp()
+
+    def follow(self, gx, gy):
+        """Scroll just enough to keep (gx, gy) CAMERA_EDGE_MARGIN cells away from the view edges."""
+        margin = C.CAMERA_EDGE_MARGIN
+        vx = self._view_offset(gx, self.left, self.board_width)
+        vy = self._view_offset(gy, self.top, self.board_height)
+        if vx < margin:
+            self.left -= margin - vx
+        elif vx >= self.view_width - margin:
+            self.left += vx - (self.view_width - margin - 1)
+        if vy < margin:
+            self.top -= margin - vy
+        elif vy >= self.view_height - margin:
+            self.top += vy - (self.view_height - margin - 1)
+        self._clamp()
+
+    def _clamp(self):
+        if self.wrap:
+            self.left %= self.board_width
+            self.top  %= self.board_height
+        elif self.bounded:
+            self.left = max(0, min(self.left, self.board_width - self.view_width))
+            self.top  = max(0, min(self.top, self.board_height - self.view_height))
+
+    def _view_offset(self, g, origin, board):
+        """Cells from the view origin to g; on wrapping boards measured the short way round."""
+        v = g - origin
+        if self.wrap:
+            v %= board
+            if v >= board - C.CAMERA_CULL_MARGIN:
+                v -= board   # just left of / above the view across the seam
+        return v
+
+    # ------------------------------------------------------------------ mapping
+    def to_screen(self, gx, gy):
+        """Top-left screen pixel of board cell (gx, gy)."""
+        return (self._view_offset(gx, self.left, self.board_width) * C.GRID_SIZE,
+                self._view_offset(gy, self.top, self.board_height) * C.GRID_SIZE)
+
+    def to_screen_px(self, px, py):
+        """Screen pixel of a board-space pixel (board cell * GRID_SIZE + offset)."""
+        return self.to_screen(px / C.GRID_SIZE, py / C.GRID_SIZE)
+
+    def is_visible(self, gx, gy, margin=C.CAMERA_CULL_MARGIN):
+        """False when cell (gx, gy) is certainly off screen.
+        margin widens the test for objects that extend past their anchor cell."""
+        vx = self._view_offset(gx, self.left, self.board_width)
+        vy = self._view_offset(gy, self.top, self.board_height)
+        return (-margin <= vx < self.view_width + margin
+                and -margin <= vy < self.view_height + margin)
@@ -1,4 +1,3 @@
-import pygame
 import os
 
 # General Game Constants
@@ -6,8 +5,26 @@ WALL_COLLISION = False
 SCREEN_WIDTH = 600
 SCREEN_HEIGHT = 600
 GRID_SIZE = 20
-GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
-GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
+VIEW_WIDTH = SCREEN_WIDTH // GRID_SIZE    # cells visible on screen
+VIEW_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
+GRID_WIDTH = VIEW_WIDTH                   # logical board size in cells (see set_board_size)
+GRID_HEIGHT = VIEW_HEIGHT
+
+# Camera (only active when the board is larger than the screen)
+CAMERA_EDGE_MARGIN = 8    # cells kept between the snake head and the view edge before scrolling
+CAMERA_CULL_MARGIN = 3    # extra cells around the view still drawn (multi-cell shapes, particles)
+
+# Endless world (--endless): unbounded board streamed in chunks around the snake head
+ENDLESS_WORLD = False
+CHUNK_SIZE = 16                    # chunk edge in cells
+CHUNK_ACTIVE_RADIUS = 1            # chunks around the head's chunk that are simulated (1 -> 3x3)
+CHUNK_MAX_STORED = 256             # evicted chunks kept in memory before the oldest is dropped
+CHUNK_SWEEP_INTERVAL = 20          # ticks between sweeps that evict drifting moving obstacles
+CHUNK_SAFE_RING = 1                # chunk rings around the origin generated empty
+CHUNK_STATIC_OBSTACLES = (1, 3)    # static obstacles per chunk (max grows by one every two rings)
+CHUNK_MOVING_OBSTACLES = (0, 2)    # moving obstacles per chunk once unlocked
+CHUNK_MOVING_UNLOCK_RING = {'orthogonal': 2, 'diagonal': 3, 'seeker': 4}
+CHUNK_MAGIC_APPLE_PROBABILITY = 0.25
 
 # Particle Effects Constants
 PARTICLE_COUNT = 15  # Number of particles per effect
@@ -139,6 +156,19 @@ SEEKER_OBSTACLE_SPEED = 0.12     # Slightly faster than regular moving obstacles
 SEEKER_TURN_RATE_SCALE = 0.60 # Turn rate = SCALE / dist; seeker is passive far away, aggressive up close
 SEEKER_TURN_RATE_MAX  = 0.35  # Cap so the seeker never snap-turns at point-blank range
 
+def set_board_size(width, height):
+    """Resize the logical board (in cells). Must be called before a Game is created.
+    Boards larger than the window are rendered through a scrolling Camera."""
+    global GRID_WIDTH, GRID_HEIGHT, SNAKE_START_POS
+    GRID_WIDTH = width
+    GRID_HEIGHT = height
+    SNAKE_START_POS = (GRID_WIDTH // 2, GRID_HEIGHT // 2)
+
+def set_endless_world(enabled=True):
+    """Switch to the unbounded chunk-streamed board. Must be called before a Game is created."""
+    global ENDLESS_WORLD
+    ENDLESS_WORLD = enabled
+
 # Sound Constants
 SOUND_FOLDER = os.path.join("Files", "Sound")
 
@@ -166,11 +196,105 @@ MENU_MUSIC_FILE   = get_sound_file_path(SOUND_FOLDER, "menu_music.mp3")
 MENU_MUSIC_VOLUME     = 0.5
 MENU_MUSIC_FADEOUT_MS = 1500   # ms for menu music to fade when gameplay resumes
 
+# Asset registry (loaded by assets.AssetManager). Preloaded assets are decoded on a
+# background thread behind the loading bar; the rest are loaded on first use.
+# key: (path, volume, preload, voice category – see VOICE_CATEGORIES)
+SOUNDS = {
+    'apple_eat':       (APPLE_EAT_SOUND_FILE,          1.0, True,  'pickup'),
+    'magic_1':         (MAGIC_APPLE_EAT_SOUND_FILES[0], 1.0, True,  'pickup'),
+    'magic_2':         (MAGIC_APPLE_EAT_SOUND_FILES[1], 1.0, True,  'pickup'),
+    'magic_3':         (MAGIC_APPLE_EAT_SOUND_FILES[2], 1.0, True,  'pickup'),
+    'magic_4':         (MAGIC_APPLE_EAT_SOUND_FILES[3], 1.0, True,  'pickup'),
+    'magic_apple_eat': (MAGIC_APPLE_EAT_SOUND_FILE,    1.0, False, 'pickup'),  # fallback if no magic_N loads
+    'bite_self':       (BITE_SELF_SOUND_FILE,          1.0, False, 'hit'),
+    'bite_obstacle':   (BITE_OBSTACLE_SOUND_FILE,      1.0, False, 'hit'),
+    'remove_obstacle': (REMOVE_OBSTACLE_SOUND_FILE,    1.0, False, 'ambient'),
+    'whoosh':          (WHOOSH_SOUND_FILE,             0.7, False, 'ui'),
+}
+# Voice pools (voices.VoiceManager). Each category owns reserved mixer channels.
+# category: (channels, coalesce window ms, max plays per second)
+# A repeat of the same sound inside the coalesce window is merged into the voice
+# already playing; plays beyond the per-second cap are dropped; when every channel
+# in the pool is busy the oldest voice is cut off.
+VOICE_CATEGORIES = {
+    'pickup':  (3, 30,  12),
+    'hit':     (2, 60,  8),
+    'ambient': (2, 80,  6),    # level-clear obstacle removal can fire every few ticks
+    'ui':      (1, 150, 4),
+}
+VOICE_FREE_CHANNELS = 2    # unreserved channels left for anything played outside the pools
+MAGIC_SOUND_KEYS = ('magic_1', 'magic_2', 'magic_3', 'magic_4')
+PCM_CACHE_DIR = os.path.join("Files", "Cache", "pcm")   # decoded sounds, see sound_cache.py
+# key (Screen attribute name): (SysFont family, size, bold, size for pygame's default font, preload)
+FONTS = {
+    'font':          ('Arial', 22, True,  28, True),
+    'font_regular':  ('Arial', 22, False, 28, True),
+    'title_font':    ('Arial', 52, True,  64, True),
+    'score_font':    ('Arial', 28, True,  34, True),
+    'hs_title_font': ('Arial', 22, True,  28, True),
+    'hs_entry_font': ('Arial', 19, False, 24, True),
+    'input_font':    ('Arial', 22, False, 28, True),
+    'prompt_font':   ('Arial', 18, False, 23, True),
+    'buff_font':     ('Arial', 17, True,  22, True),
+    'hud_font':      ('Arial', 22, True,  28, True),
+    'announcement':  ('Arial', 54, True,  60, False),  # BuffAnnouncement pop-ups
+    'debug_font':    ('Courier New', 13, True, 16, True),  # F3 overlay (monospaced columns)
+}
+LOADING_BAR_COLOR = (0, 200, 0)
+
+# Menu / overlay loops (Game._overlay_loop)
+OVERLAY_FRAME_MS = 50             # animation interval of pulsing menus (20 fps)
+DEATH_SCREEN_FRAME_MS = 67        # drifting joke text after death (15 fps)
+CURSOR_BLINK_MS = 500             # name-entry cursor toggle interval
+OVERLAY_IDLE_TIMEOUT_MS = 10000   # without input for this long, animations freeze until the next event
+
 # Death-screen wave animation
 WAVE_SPAWN_INTERVAL = 70    # frames between new ripple waves
 WAVE_SPEED = 7              # pixels the wave radius grows per frame
 WAVE_MAX_RADIUS = 900       # radius at which a wave is discarded
 
+# Adaptive quality (quality.QualityGovernor)
+ALPHA_EFFECTS = True        # per-pixel alpha for particles, pulses, ghost snake and the feathered darkness edge
+FRAME_BUDGET_MS = 12.0      # update + draw time per tick before effects are shed (0 = governor off)
+# Levels from best to cheapest: (name, PARTICLE_COUNT, PULSE_COUNT, ALPHA_EFFECTS, WAVE_SPAWN_INTERVAL)
+QUALITY_LEVELS = [
+    ('high',    PARTICLE_COUNT, PULSE_COUNT, True,  WAVE_SPAWN_INTERVAL),
+    ('medium',  10,             2,           True,  100),
+    ('low',     6,              1,           False, 140),
+    ('minimal', 3,              1,           False, 210),
+]
+QUALITY_DOWNGRADE_FRAMES = 10    # consecutive over-budget frames before shedding one level
+QUALITY_UPGRADE_FRAMES = 120     # consecutive frames under QUALITY_HEADROOM x budget before restoring one
+QUALITY_HEADROOM = 0.6
+DEBUG_OVERLAY_COLOR = (180, 255, 180)
+
+# Frame profiler (perf.FrameProfiler): F3 overlay, F4 dumps the buffered frames to CSV
+PERF_HISTORY_FRAMES = 600        # frames kept for averages, p99 and CSV dumps
+PERF_SUMMARY_REFRESH = 10        # frames between overlay statistic refreshes
+PERF_DUMP_DIR = os.path.join("Files", "Perf")
+TRACE_BUFFER_EVENTS = 200000     # --trace ring buffer; older spans are overwritten
+
+# Metrics endpoint (main.py --metrics-port, Prometheus text format)
+METRICS_HOST = '127.0.0.1'
+METRICS_FRAME_BUCKETS_MS = (1, 2, 4, 8, 12, 16, 25, 50, 100)   # frame-time histogram bucket bounds
+
+# Batched engine (vec_env.BatchedSnakeEngine): N games stepped in lockstep in NumPy arrays
+VEC_MAX_MOVERS = 64              # moving-obstacle slots per game; spawns beyond this are dropped
+VEC_SPAWN_TRIES = 32             # vectorised rejection-sampling rounds before the per-game fallback
+ENV_POOL_TIMEOUT = 60.0          # seconds env_pool.EnvPool waits on its workers before giving up
+# Screen.gray_cells(): one grey level per occupancy channel, brightest wins where they overlap
+GRAY_CELL_LEVELS = {
+    'body': 110, 'head': 255, 'apple': 200, 'magic_apple': 230, 'static': 70,
+    'orthogonal': 140, 'diagonal': 160, 'seeker': 180, 'door': 40,
+}
+BOT_SERVER_HOST = '127.0.0.1'    # bot_server.py --port listens here only
+
+# Autopilot (autopilot.py, main.py --autopilot): BFS planner over predicted occupancy
+AUTOPILOT_HORIZON = 40           # ticks ahead moving obstacles are extrapolated; later steps ignore them
+AUTOPILOT_MOVER_MARGIN = 2       # a predicted mover cell stays blocked this many ticks either side
+PLANNER_DEADLINE_MS = 4.0        # --autopilot async: longest the game loop waits for the planner per tick
+PLANNER_START_TIMEOUT = 30.0     # seconds to wait for the planner process to start before giving up
+
 # UI and Display Constants
 BACKGROUND_COLOR = (0, 0, 0)
 GRID_LINE_COLOR = (12, 12, 12)      # Barely-visible grid overlay
@@ -207,12 +331,16 @@ HIGH_SCORE_FILE = os.path.join("Files", "highscores.txt")  # Use os.path.join fo
 NUM_HIGH_SCORES = 5
 DEFAULT_HIGH_SCORE_ENTRY = ("Empty Slot", 0)
 
+# Autosave Constants
+AUTOSAVE_FILE = os.path.join("Files", "autosave.bin")
+AUTOSAVE_INTERVAL_TICKS = 50    # game ticks between background checkpoints
+
 # Text Input Constants
-INPUT_BOX_RECT = pygame.Rect(SCREEN_WIDTH // 4, SCREEN_HEIGHT // 2 + 50, SCREEN_WIDTH // 2, 40)
-INPUT_PROMPT_POS = (INPUT_BOX_RECT.centerx, INPUT_BOX_RECT.top - 20)
+INPUT_BOX_RECT = (SCREEN_WIDTH // 4, SCREEN_HEIGHT // 2 + 50, SCREEN_WIDTH // 2, 40)   # x, y, w, h
+INPUT_PROMPT_POS = (INPUT_BOX_RECT[0] + INPUT_BOX_RECT[2] // 2, INPUT_BOX_RECT[1] - 20)
 INPUT_TEXT_COLOR = (0, 0, 0)
-INPUT_BOX_COLOR_ACTIVE = pygame.Color('lightskyblue3')
-INPUT_BOX_COLOR_INACTIVE = pygame.Color('gray')  # Or use TEXT_COLOR
+INPUT_BOX_COLOR_ACTIVE = (141, 182, 205)    # 'lightskyblue3'
+INPUT_BOX_COLOR_INACTIVE = (190, 190, 190)  # 'gray'
 MAX_NAME_LENGTH = 15
 RESTART_PROMPT_POS = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40)
 
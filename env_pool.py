@@ -0,0 +1,282 @@
+"""
+Sharded environment pool stepped through shared memory.
+
+    with EnvPool(512, workers=8) as pool:          # 8 processes x 64 games
+        obs, reward, done = pool.reset(), None, None
+        while training:
+            obs, reward, done = pool.step(actions)  # actions: (N,) 0 up, 1 down, 2 left, 3 right, -1 keep
+
+Every worker process owns a contiguous shard of the N environments and writes
+their observations, rewards and done flags straight into one
+multiprocessing.shared_memory block; the controller writes the action array
+into the same block.  A step is two barrier waits – "go" and "all shards
+done" – so nothing is pickled or copied between processes per step and the
+workers run their shards fully in parallel.
+
+Backends (one shard per worker):
+
+  game     headless Game instances, one per environment (the real rules)
+  engine   one vec_env.BatchedSnakeEngine per worker (simplified rules, much faster)
+
+An observation is the board as a (H, W) grid of CELL_CODES.  Rewards are
+score gained during the step.  Finished games restart immediately; score
+holds the final score of the game that ended on a step with done set.  The
+arrays returned by reset() and step() are views of the shared block and are
+overwritten by the next call – copy what must be kept.
+
+Board-sized boards only (not --endless).
+"""
+
+import os
+import random
+import threading
+import traceback
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+import constants as C
+
+CELL_CODES = ('empty', 'body', 'head', 'apple', 'magic_apple', 'static', 'moving', 'door')
+EMPTY, BODY, HEAD, APPLE, MAGIC, STATIC, MOVING, DOOR = range(len(CELL_CODES))
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))   # action -> (dx, dy): up, down, left, right
+
+_STEP, _RESET, _CLOSE = range(3)
+
+
+def _layout(n, width, height):
+    """(name, dtype, shape, offset) of every array in the shared block, and its size."""
+    fields = [
+        ('command', np.int64, (1,)),
+        ('actions', np.int8, (n,)),
+        ('reward', np.float32, (n,)),
+        ('score', np.int32, (n,)),
+        ('done', np.bool_, (n,)),
+        ('obs', np.uint8, (n, height, width)),
+    ]
+    layout, offset = [], 0
+    for name, dtype, shape in fields:
+        offset = -(-offset // 8) * 8   # 8-byte alignment
+        layout.append((name, dtype, shape, offset))
+        offset += int(np.prod(shape)) * np.dtype(dtype).itemsize
+    return layout, offset
+
+
+def _views(buf, n, width, height):
+    layout, _ = _layout(n, width, height)
+    return {name: np.ndarray(shape, dtype, buf, offset) for name, dtype, shape, offset in layout}
+
+
+# ---------------------------------------------------------------- shards
+class _GameShard:
+    """One headless Game per environment."""
+
+    def __init__(self, count, start_level, seed):
+        os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+        from game import Game
+        random.seed(seed)
+        self.games = [Game(start_level=start_level, seed=seed + i, autosave=False, headless=True)
+                      for i in range(count)]
+
+    def reset(self, obs):
+        for i, game in enumerate(self.games):
+            game.reset()
+            self._cells(game, obs[i])
+
+    def step(self, actions, obs, reward, done, score):
+        for i, game in enumerate(self.games):
+            if actions[i] >= 0:
+                game.steer(DIRECTIONS[actions[i]])
+            before = game.score
+            running = game.step(render=False)
+            reward[i] = game.score - before
+            done[i] = not running
+            if not running:
+                score[i] = game.score
+                game.reset()
+            self._cells(game, obs[i])
+
+    @staticmethod
+    def _cells(game, grid):
+        grid.fill(EMPTY)
+        for x, y in game.level_door.cells_list if game.level_door else ():
+            grid[y, x] = DOOR
+        for ob in game.obstacles:
+            for x, y in ob.cells:
+                grid[y, x] = STATIC
+        h, w = grid.shape
+        for mo in game.moving_obstacles:
+            for x, y in mo.cells:
+                grid[y % h, x % w] = MOVING
+        if game.apple_visible:
+            grid[game.apple.y, game.apple.x] = APPLE
+        for magic in game.magic_apples:
+            grid[magic.y, magic.x] = MAGIC
+        positions = game.snake.positions
+        for x, y in positions[1:]:
+            grid[y % h, x % w] = BODY
+        x, y = positions[0]
+        grid[y % h, x % w] = HEAD
+
+
+class _EngineShard:
+    """One BatchedSnakeEngine for the whole shard."""
+
+    def __init__(self, count, start_level, seed):
+        from vec_env import BatchedSnakeEngine
+        self.engine = BatchedSnakeEngine(count, start_level=start_level, seed=seed)
+
+    def reset(self, obs):
+        self.engine.reset()
+        self._cells(obs)
+
+    def step(self, actions, obs, reward, done, score):
+        engine = self.engine
+        gained, ended = engine.step(actions)
+        reward[:] = gained
+        done[:] = ended
+        score[ended] = engine.final_score[ended]
+        self._cells(obs)
+
+    def _cells(self, obs):
+        from vec_env import SHAPE_OFFSETS, SHAPE_USED, SHAPE_CELLS
+        engine = self.engine
+        n, h, w = obs.shape
+        rows = np.arange(n)
+        obs[:] = np.where(engine.static, STATIC, np.where(engine.occ > 0, BODY, EMPTY))
+        g, s = np.nonzero(engine.mover_kind > 0)
+        base = np.floor(engine.mover_pos[g, s]).astype(np.int64)
+        shape = engine.mover_shape[g, s]
+        for j in range(SHAPE_CELLS):
+            used = SHAPE_USED[shape, j]
+            x = (base[used, 0] + SHAPE_OFFSETS[shape[used], j, 0]) % w
+            y = (base[used, 1] + SHAPE_OFFSETS[shape[used], j, 1]) % h
+            obs[g[used], y, x] = MOVING
+        obs[rows, engine.apple[:, 1], engine.apple[:, 0]] = APPLE
+        magic = np.flatnonzero(engine.magic_kind >= 0)
+        obs[magic, engine.magic[magic, 1], engine.magic[magic, 0]] = MAGIC
+        heads = engine.heads()
+        obs[rows, heads[:, 1], heads[:, 0]] = HEAD
+
+
+SHARDS = {
+    'game': _GameShard,
+    'engine': _EngineShard,
+}
+
+
+def _worker(name, n, width, height, lo, hi, backend, start_level, seed, go, finished):
+    """Worker process: run shard [lo, hi) whenever the controller releases the barrier."""
+    if (C.GRID_WIDTH, C.GRID_HEIGHT) != (width, height):
+        C.set_board_size(width, height)   # spawned workers start from the default board
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        views = _views(shm.buf, n, width, height)
+        command = views['command']
+        actions, obs = views['actions'][lo:hi], views['obs'][lo:hi]
+        reward, done, score = views['reward'][lo:hi], views['done'][lo:hi], views['score'][lo:hi]
+        shard = SHARDS[backend](hi - lo, start_level, seed)
+        while True:
+            go.wait()
+            if command[0] == _CLOSE:
+                break
+            if command[0] == _RESET:
+                shard.reset(obs)
+                reward[:] = 0
+                done[:] = False
+            else:
+                shard.step(actions, obs, reward, done, score)
+            finished.wait()
+    except threading.BrokenBarrierError:
+        pass   # the controller or another worker gave up
+    except Exception:
+        traceback.print_exc()
+        go.abort()
+        finished.abort()
+    finally:
+        views = command = actions = obs = reward = done = score = None   # release the buffer first
+        shm.close()
+
+
+# ---------------------------------------------------------------- controller
+class EnvPool:
+    """N environments split over worker processes, stepped through shared memory."""
+
+    def __init__(self, n, workers=None, backend='game', start_level=1, seed=0):
+        if backend not in SHARDS:
+            raise ValueError(f"unknown backend '{backend}' (choose from {', '.join(SHARDS)})")
+        workers = max(1, min(workers or os.cpu_count(), n))
+        self.n = n
+        self.workers = workers
+        self.backend = backend
+        self.width, self.height = C.GRID_WIDTH, C.GRID_HEIGHT
+        _, size = _layout(n, self.width, self.height)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        views = _views(self._shm.buf, n, self.width, self.height)
+        views['command'][0] = _STEP
+        self._command = views['command']
+        self.actions = views['actions']
+        self.obs = views['obs']
+        self.reward = views['reward']
+        self.done = views['done']
+        self.score = views['score']
+
+        ctx = get_context()
+        self._go = ctx.Barrier(workers + 1)
+        self._finished = ctx.Barrier(workers + 1)
+        bounds = np.linspace(0, n, workers + 1).astype(int)
+        self._procs = []
+        for w in range(workers):
+            lo, hi = int(bounds[w]), int(bounds[w + 1])
+            proc = ctx.Process(
+                target=_worker, daemon=True, name=f'EnvPool-{w}',
+                args=(self._shm.name, n, self.width, self.height, lo, hi, backend,
+                      start_level, seed + lo, self._go, self._finished))
+            proc.start()
+            self._procs.append(proc)
+        self._closed = False
+        self.reset()
+
+    def _run(self, command):
+        self._command[0] = command
+        try:
+            self._go.wait(C.ENV_POOL_TIMEOUT)
+            self._finished.wait(C.ENV_POOL_TIMEOUT)
+        except threading.BrokenBarrierError:
+            self.close()
+            raise RuntimeError('EnvPool: a worker failed or timed out (see its traceback above)')
+
+    def reset(self):
+        """Restart every environment; returns the observations."""
+        self._run(_RESET)
+        return self.obs
+
+    def step(self, actions):
+        """Apply one action per environment and advance all of them one tick.
+        Returns (obs, reward, done)."""
+        self.actions[:] = actions
+        self._run(_STEP)
+        return self.obs, self.reward, self.done
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._command[0] = _CLOSE
+        try:
+            self._go.wait(C.ENV_POOL_TIMEOUT)
+        except threading.BrokenBarrierError:
+            pass
+        for proc in self._procs:
+            proc.join(C.ENV_POOL_TIMEOUT)
+            if proc.is_alive():
+                proc.terminate()
+        self._command = self.actions = self.obs = self.reward = self.done = self.score = None
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
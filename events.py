@@ -0,0 +1,106 @@
+"""
+Typed game event bus.
+
+Gameplay code publishes what happened – an apple eaten, a shield absorbing a
+hit, an obstacle appearing – and side systems (sound, telemetry, replays,
+achievements) subscribe by event class instead of being called from inside
+check_collisions() or _update_mechanics_and_objects().
+
+Publishing is guarded so an event nobody listens to costs one set lookup and
+is never even constructed:
+
+    if bus.wants(AppleEaten):
+        bus.publish(AppleEaten(x, y, combo, gained))
+
+Published events are queued and dispatched together by flush(), which
+Game.run() calls once per tick.  Gameplay state itself is still changed
+synchronously; only the reactions to it are batched.
+"""
+
+
+class Event:
+    """Base class; subclasses declare their fields in __slots__."""
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+
+class AppleEaten(Event):
+    __slots__ = ('x', 'y', 'combo', 'gained')
+
+
+class MagicAppleEaten(Event):
+    __slots__ = ('x', 'y', 'kind')
+
+
+class ShieldAbsorbed(Event):
+    __slots__ = ('x', 'y', 'charges_left')
+
+
+class ObstacleSpawned(Event):
+    __slots__ = ('kind', 'x', 'y')
+
+
+class ObstacleRemoved(Event):
+    __slots__ = ('kind', 'x', 'y')
+
+
+class DoorEntered(Event):
+    __slots__ = ('level',)
+
+
+class SnakeDied(Event):
+    __slots__ = ('cause', 'x', 'y')     # cause: 'self', 'wall' or 'obstacle'
+
+
+class EventBus:
+    """Per-class subscriber lists with a per-tick dispatch queue."""
+
+    def __init__(self):
+        self._handlers = {}      # event class -> [callable]
+        self._wanted = set()     # event classes with at least one handler
+        self._pending = []
+        self.published = 0
+        self.dispatched = 0
+
+    def subscribe(self, event_cls, handler):
+        self._handlers.setdefault(event_cls, []).append(handler)
+        self._wanted.add(event_cls)
+
+    def unsubscribe(self, event_cls, handler):
+        handlers = self._handlers.get(event_cls, [])
+        if handler in handlers:
+            handlers.remove(handler)
+        if not handlers:
+            self._handlers.pop(event_cls, None)
+            self._wanted.discard(event_cls)
+
+    def wants(self, event_cls):
+        return event_cls in self._wanted
+
+    def publish(self, event):
+        """Queue `event` for the next flush(); dropped if nobody subscribes to its class."""
+        if type(event) in self._wanted:
+            self._pending.append(event)
+            self.published += 1
+
+    def flush(self):
+        """Deliver queued events in publish order.  Events published by handlers wait for the next flush."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        handlers = self._handlers
+        for event in pending:
+            for handler in handlers.get(type(event), ()):
+                handler(event)
+        self.dispatched += len(pending)
+
+    def clear(self):
+        """Drop queued events without dispatching them (e.g. on reset)."""
+        self._pending.clear()
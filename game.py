@@ -3,77 +3,135 @@ import random
 import math
 from pygame.locals import *
 from pygame import mixer # Import mixer
-from time import sleep
+from time import sleep, perf_counter
 
 # Use absolute imports
 import constants as C
 import high_scores as hs
 import magic_apple_logic as mal
+import save_state
+import tracing
+from assets import AssetManager
+from voices import VoiceManager
+from quality import QualityGovernor
+from perf import FrameProfiler
+from events import (EventBus, AppleEaten, MagicAppleEaten, ShieldAbsorbed, ObstacleSpawned,
+                    ObstacleRemoved, DoorEntered, SnakeDied)
 from game_objects import Snake, Apple, MagicApple, Obstacle, MovingObstacle, ParticleEffect, OrthogonalMovingObstacle, SeekerObstacle, BuffAnnouncement, ShockwaveEffect, LevelDoor
 from screen import Screen
+from camera import Camera
+from world import ChunkWorld
+
+# Events that count as player activity in overlay loops: they trigger a redraw
+# (hover, typing, window changes) and restart the idle timer
+_OVERLAY_WAKE_EVENTS = (KEYDOWN, TEXTINPUT, MOUSEBUTTONDOWN, MOUSEMOTION,
+                        VIDEORESIZE, VIDEOEXPOSE, WINDOWEXPOSED)
 
 class Game:
     """ Manages the game state and main loop """
-    def __init__(self, test_buff=None, start_level=1):
-        pygame.init()
-        mixer.init() # Initialize the mixer
-        self.screen = Screen() # Uses constants defined in screen.py/constants.py
+    def __init__(self, test_buff=None, start_level=1, autosave=True, seed=None,
+                 window_size=None, fullscreen=False, profiler=None, frame_budget_ms=None,
+                 headless=False):
+        # Subsystems start lazily: Screen brings up the display, AssetManager
+        # the font module and mixer once something needs them.
+        # headless=True runs without window, audio, autosave or blocking menus;
+        # drive it with step() (benchmarks, bots)
+        self.headless = headless
+        self.profiler = profiler   # StartupProfiler (main.py --profile-startup) or None
+        # Fixed 600x600 canvas, scaled to the window (see Screen)
+        self.screen = Screen(window_size=window_size, fullscreen=fullscreen, headless=headless)
+        self._mark('display')
         self.clock = pygame.time.Clock()
         self.high_scores = hs.load_high_scores() # Uses function from high_scores.py
         self.test_buff = test_buff   # if set, force this magic apple type after the 1st apple
         self.start_level = max(1, min(start_level, 5))  # clamped to valid range
         self.gameover = False
+        # World seed: fixes chunk generation in endless mode and, when given, all other randomness
+        if seed is not None:
+            random.seed(seed)
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        # Scrolling viewport, only needed when the board is larger than the window
+        if C.ENDLESS_WORLD or C.GRID_WIDTH > C.VIEW_WIDTH or C.GRID_HEIGHT > C.VIEW_HEIGHT:
+            self.camera = Camera()
+        else:
+            self.camera = None
+        # Background checkpointing of the current run (None when disabled)
+        self.autosaver = save_state.Autosaver() if autosave and not headless else None
 
-        # Initialize sound attributes to None
-        self.apple_eat_sound = None
-        self.magic_apple_eat_sound = None
-        self.magic_apple_eat_sounds = []   # list of 4 random magic sounds
-        self.bite_self_sound = None
-        self.bite_obstacle_sound = None
-        self.remove_obstacle_sound = None
-        self.whoosh_sound = None
         self.next_direction = None # Buffer for the next direction change
 
-        # Load sound effects individually
-        try:
-            self.apple_eat_sound = mixer.Sound(C.APPLE_EAT_SOUND_FILE)
-        except pygame.error as e:
-            print(f"Warning: Could not load apple eat sound ({C.APPLE_EAT_SOUND_FILE}): {e}")
-
-        try:
-            self.magic_apple_eat_sound = mixer.Sound(C.MAGIC_APPLE_EAT_SOUND_FILE)
-        except pygame.error as e:
-            print(f"Warning: Could not load magic apple eat sound ({C.MAGIC_APPLE_EAT_SOUND_FILE}): {e}")
-
-        for path in C.MAGIC_APPLE_EAT_SOUND_FILES:
-            if path:
-                try:
-                    self.magic_apple_eat_sounds.append(mixer.Sound(path))
-                except pygame.error as e:
-                    print(f"Warning: Could not load magic sound ({path}): {e}")
-
-        try:
-            self.bite_self_sound = mixer.Sound(C.BITE_SELF_SOUND_FILE)
-        except pygame.error as e:
-            print(f"Warning: Could not load bite self sound ({C.BITE_SELF_SOUND_FILE}): {e}")
-
-        try:
-            self.bite_obstacle_sound = mixer.Sound(C.BITE_OBSTACLE_SOUND_FILE)
-        except pygame.error as e:
-            print(f"Warning: Could not load bite obstacle sound ({C.BITE_OBSTACLE_SOUND_FILE}): {e}")
-        
-        try:
-            self.remove_obstacle_sound = mixer.Sound(C.REMOVE_OBSTACLE_SOUND_FILE)
-        except pygame.error as e:
-            print(f"Warning: Could not load remove obstacle sound ({C.REMOVE_OBSTACLE_SOUND_FILE}): {e}")
-
-        try:
-            self.whoosh_sound = mixer.Sound(C.WHOOSH_SOUND_FILE)
-            self.whoosh_sound.set_volume(0.7)
-        except pygame.error as e:
-            print(f"Warning: Could not load whoosh sound ({C.WHOOSH_SOUND_FILE}): {e}")
+        # Fonts and sounds load on a worker thread behind a loading bar
+        self.assets = AssetManager(audio=not headless)
+        self.assets.start()
+        self.voices = VoiceManager()   # pooled, rate-limited playback for _play_sound()
+        self.events = EventBus()       # gameplay events, dispatched once per tick in run()
+        # Random placement counters for the metrics endpoint: successful spawns and
+        # positions tried per kind (attempts / spawns > 1 means retries on a crowded board)
+        self.spawns = {'apple': 0, 'magic_apple': 0, 'obstacle': 0}
+        self.spawn_attempts = {'apple': 0, 'magic_apple': 0, 'obstacle': 0}
+        self._subscribe_sounds()
+        self.quality = QualityGovernor(frame_budget_ms)   # sheds effects when ticks run over budget
+        self.perf = FrameProfiler()    # per-phase frame timings (F3 overlay, F4 CSV dump)
+        self.show_debug = False        # F3 debug overlay
+        self.occupancy = None          # OccupancyGrid that step() keeps in sync, once set (snake_env)
+        self.autopilot = None          # controller that run() asks for a direction every tick (--autopilot)
+        self.metrics = None            # MetricsServer (--metrics-port); run() stops it before pygame quits
+        if headless:
+            self.assets.wait()
+            self.screen.set_fonts(self.assets)
+        else:
+            self._show_loading()
+        self._mark('assets loaded')
 
         self.reset()
+        self._mark('ready')
+        if self.profiler is not None:
+            self.profiler.uninstall()
+            print('\n'.join(self.profiler.report()))
+
+    def _show_loading(self):
+        """Draw the progress bar until the preload assets are in, then hand fonts to the screen."""
+        first = True
+        while first or not self.assets.ready():
+            pygame.event.pump()   # keep the window responsive
+            self.screen.draw_loading(self.assets.progress)
+            self.screen.update()
+            if first:
+                self._mark('first frame')
+                first = False
+            self.clock.tick(60)
+        self.screen.set_fonts(self.assets)
+
+    def _mark(self, label):
+        if self.profiler is not None:
+            self.profiler.mark(label)
+
+    def _play_sound(self, key):
+        """Play a C.SOUNDS entry through its voice pool; silently skipped if the file could not be loaded."""
+        sound = self.assets.sound(key)
+        if sound:
+            self.voices.play(key, sound)
+
+    def _subscribe_sounds(self):
+        """Sound effects are reactions to gameplay events (see events.py)."""
+        bus = self.events
+        bus.subscribe(AppleEaten,      lambda e: self._play_sound('apple_eat'))
+        bus.subscribe(MagicAppleEaten, lambda e: self._play_sound(self._magic_sound_key()))
+        bus.subscribe(ShieldAbsorbed,  lambda e: self._play_sound('bite_obstacle'))
+        bus.subscribe(ObstacleRemoved, lambda e: self._play_sound('remove_obstacle'))
+        bus.subscribe(DoorEntered,     lambda e: self._play_sound('whoosh'))
+        bus.subscribe(SnakeDied,       self._on_death_sound)
+
+    def _magic_sound_key(self):
+        """One of the loaded magic_N sounds at random, else the single fallback."""
+        magic_keys = [k for k in C.MAGIC_SOUND_KEYS if self.assets.sound(k)]
+        return random.choice(magic_keys) if magic_keys else 'magic_apple_eat'
+
+    def _on_death_sound(self, event):
+        if event.cause == 'self':
+            self._play_sound('bite_self')
+        elif event.cause == 'obstacle':
+            self._play_sound('bite_obstacle')
 
     def _apply_start_level(self):
         """Pre-configure game state to match the requested start_level.
@@ -118,18 +176,31 @@ class Game:
             occupied.extend(mo.cells)          # all cells of multi-cell moving obstacles
         return occupied
 
+    def _spawn_area(self):
+        """ (x0, y0, x1, y1) cells new objects may spawn in: the whole board, or the
+        active chunks in endless mode. x1/y1 are exclusive. """
+        if self.world is not None:
+            return self.world.active_bounds()
+        return 0, 0, C.GRID_WIDTH, C.GRID_HEIGHT
+
     def _create_initial_apple(self):
         """ Creates the first apple, ensuring it doesn't spawn on snake/obstacles. Subsequent apple spawning is defined in the Apple class."""
         apple = Apple(0, 0) # Initial dummy position
-        apple.respawn(self._get_occupied_positions())
+        self._count_spawn('apple', apple.respawn(self._get_occupied_positions(), bounds=self._spawn_area()))
         return apple
     
+    def _count_spawn(self, kind, attempts):
+        self.spawns[kind] += 1
+        self.spawn_attempts[kind] += attempts
+
     def _add_magic_apple(self, force_type=None):
         """ Adds a magic apple to the game at a random unoccupied position.
         If force_type is given, that buff type is used instead of a random one. """
+        x0, y0, x1, y1 = self._spawn_area()
         while True:
-            x = random.randint(0, C.GRID_WIDTH - 1)
-            y = random.randint(0, C.GRID_HEIGHT - 1)
+            self.spawn_attempts['magic_apple'] += 1
+            x = random.randint(x0, x1 - 1)
+            y = random.randint(y0, y1 - 1)
             new_pos = (x, y)
             
             # Check against snake, existing obstacles, and the regular apple
@@ -146,6 +217,7 @@ class Game:
                 # Create the magic apple
                 magic_apple = MagicApple(x, y, force_type=force_type)
                 self.magic_apples.append(magic_apple)
+                self.spawns['magic_apple'] += 1
                 break
 
     def _add_obstacle(self, obstacle_type="static", lifespan=None):
@@ -167,10 +239,12 @@ class Game:
             return
 
         use_shapes = obstacle_type in ("static", "orthogonal")
+        x0, y0, x1, y1 = self._spawn_area()
 
         while True:
-            x = random.randint(0, C.GRID_WIDTH - 1)
-            y = random.randint(0, C.GRID_HEIGHT - 1)
+            self.spawn_attempts['obstacle'] += 1
+            x = random.randint(x0, x1 - 1)
+            y = random.randint(y0, y1 - 1)
 
             occupied = self._get_occupied_positions()
             occupied.append((self.apple.x, self.apple.y))
@@ -181,7 +255,7 @@ class Game:
                 shape = random.choices(C.OBSTACLE_SHAPES, weights=C.OBSTACLE_SHAPE_WEIGHTS, k=1)[0]
                 all_cells = [(x + dx, y + dy) for (dx, dy) in shape]
                 valid = all(
-                    0 <= cx < C.GRID_WIDTH and 0 <= cy < C.GRID_HEIGHT
+                    x0 <= cx < x1 and y0 <= cy < y1
                     and (cx, cy) not in occupied_set
                     and abs(cx - head_x) + abs(cy - head_y) >= C.MIN_OBSTACLE_SPAWN_DISTANCE
                     for (cx, cy) in all_cells
@@ -203,6 +277,9 @@ class Game:
                 if lifespan is not None:
                     obstacle.lifespan = lifespan
                 obstacle_settings["list"].append(obstacle)
+                self.spawns['obstacle'] += 1
+                if self.events.wants(ObstacleSpawned):
+                    self.events.publish(ObstacleSpawned(obstacle_type, x, y))
                 self.particle_effects.append(ParticleEffect(x, y, obstacle_settings["effect_type"], is_spawning=True))
                 break
 
@@ -219,6 +296,14 @@ class Game:
         }
         if self.level not in thresholds or self.apples_eaten < thresholds[self.level]:
             return
+        if self.world is not None:
+            # Endless world: no walls for a portal – the level simply advances in place
+            self.level += 1
+            self.max_level_reached = max(self.max_level_reached, self.level)
+            self.level_start_tick = self.time_alive
+            self.buff_announcements.append(BuffAnnouncement(f"LEVEL {self.level}", C.DOOR_COLOR,
+                                                           self.assets.font('announcement')))
+            return
         self.next_level     = self.level + 1
         self.level_clearing = True
         self.apple_visible  = False   # no apple visible during clear/door/exit sequence
@@ -238,8 +323,8 @@ class Game:
         if self.removing_static_obstacles and self.frame_counter % C.OBSTACLE_REMOVAL_INTERVAL == 0:
             if self.obstacles:
                 obstacle_to_remove = self.obstacles.pop(0)
-                if self.remove_obstacle_sound:
-                    self.remove_obstacle_sound.play()
+                if self.events.wants(ObstacleRemoved):
+                    self.events.publish(ObstacleRemoved('static', obstacle_to_remove.x, obstacle_to_remove.y))
                 self.particle_effects.append(ParticleEffect(obstacle_to_remove.x, obstacle_to_remove.y, "obstacle_static", is_spawning=False))
             else:
                 self.removing_static_obstacles = False
@@ -251,8 +336,8 @@ class Game:
             if orthogonal_obstacles:
                 obstacle_to_remove = orthogonal_obstacles[0]
                 self.moving_obstacles.remove(obstacle_to_remove)
-                if self.remove_obstacle_sound:
-                    self.remove_obstacle_sound.play()
+                if self.events.wants(ObstacleRemoved):
+                    self.events.publish(ObstacleRemoved('orthogonal', obstacle_to_remove.x, obstacle_to_remove.y))
                 self.particle_effects.append(ParticleEffect(obstacle_to_remove.x, obstacle_to_remove.y, "obstacle_orthogonal", is_spawning=False))
             else:
                 self.removing_orthogonal_obstacles = False
@@ -266,8 +351,8 @@ class Game:
             if diagonal_obstacles:
                 obstacle_to_remove = diagonal_obstacles[0]
                 self.moving_obstacles.remove(obstacle_to_remove)
-                if self.remove_obstacle_sound:
-                    self.remove_obstacle_sound.play()
+                if self.events.wants(ObstacleRemoved):
+                    self.events.publish(ObstacleRemoved('diagonal', obstacle_to_remove.x, obstacle_to_remove.y))
                 self.particle_effects.append(ParticleEffect(obstacle_to_remove.x, obstacle_to_remove.y, "obstacle_diagonal", is_spawning=False))
             else:
                 self.removing_diagonal_obstacles = False
@@ -278,8 +363,8 @@ class Game:
             if seeker_obstacles:
                 obstacle_to_remove = seeker_obstacles[0]
                 self.moving_obstacles.remove(obstacle_to_remove)
-                if self.remove_obstacle_sound:
-                    self.remove_obstacle_sound.play()
+                if self.events.wants(ObstacleRemoved):
+                    self.events.publish(ObstacleRemoved('seeker', int(obstacle_to_remove.float_x), int(obstacle_to_remove.float_y)))
                 self.particle_effects.append(ParticleEffect(int(obstacle_to_remove.float_x), int(obstacle_to_remove.float_y), "obstacle_seeker", is_spawning=False))
             else:
                 self.removing_seeker_obstacles = False
@@ -340,13 +425,13 @@ class Game:
 
         # Tick and despawn temporary obstacles (those tagged with a lifespan)
         for ob in list(self.obstacles):
-            if hasattr(ob, 'lifespan'):
+            if ob.lifespan is not None:
                 ob.lifespan -= 1
                 if ob.lifespan <= 0:
                     self.obstacles.remove(ob)
                     self.particle_effects.append(ParticleEffect(ob.x, ob.y, "obstacle_static", is_spawning=False))
         for mob in list(self.moving_obstacles):
-            if hasattr(mob, 'lifespan'):
+            if mob.lifespan is not None:
                 mob.lifespan -= 1
                 if mob.lifespan <= 0:
                     self.moving_obstacles.remove(mob)
@@ -385,12 +470,21 @@ class Game:
                     self.pause_game()
                 elif event.key == K_ESCAPE:
                     self.confirm_quit()
+                elif event.key == K_F3:
+                    self.show_debug = not self.show_debug
+                elif event.key == K_F4:
+                    print(f"Frame timings written to {self.perf.dump_csv()}")
 
                 if new_dir:
-                    # Store the intended direction instead of changing immediately
-                    self.next_direction = new_dir
-                    if 'manual_control' in self.active_buffs:
-                        self.manual_step = True
+                    self.steer(new_dir)
+
+    def steer(self, direction):
+        """Queue a direction change for the next tick, like a key press: the change is
+        buffered rather than applied immediately, and under manual_control it also
+        releases the next move.  Bots and environments drive headless games with this."""
+        self.next_direction = direction
+        if 'manual_control' in self.active_buffs:
+            self.manual_step = True
 
     def _tick_active_buffs(self):
         """Decrement all active buff timers; restore speed when speed buffs expire.
@@ -406,9 +500,56 @@ class Game:
             if k in charge_based or v > 1
         }
 
+    def _overlay_loop(self, draw, on_event, frame_ms=None, align=False):
+        """Shared event-driven loop for menus and overlays.
+
+        draw(tick) renders one frame; on_event(event) returns True to leave the loop.
+        frame_ms is the animation interval (None = static screen, redrawn only after
+        input); with align=True frames land on multiples of frame_ms, so a blinking
+        cursor wakes up exactly when it toggles.  Between frames the loop sleeps in
+        pygame.event.wait(), and after OVERLAY_IDLE_TIMEOUT_MS without input the
+        animation freezes and the loop blocks until the next event."""
+        self.perf.discard()   # the gameplay frame that opened this menu is not representative
+        tick = 0
+        draw(tick)
+        self.screen.update()
+        now = pygame.time.get_ticks()
+        last_input = now
+        next_frame = self._next_overlay_frame(now, frame_ms, align)
+        while True:
+            animating = frame_ms is not None and now - last_input < C.OVERLAY_IDLE_TIMEOUT_MS
+            if not animating:
+                events = [pygame.event.wait()]          # idle: sleep until something happens
+            elif next_frame - now >= 1:
+                events = [pygame.event.wait(next_frame - now)]
+            else:
+                events = []                              # frame is due right now
+            events = [e for e in events if e.type != NOEVENT] + pygame.event.get()
+            redraw = False
+            for event in events:
+                if on_event(event):
+                    return
+                if event.type in _OVERLAY_WAKE_EVENTS:
+                    redraw = True                        # hover, typing, resize, ...
+                    last_input = pygame.time.get_ticks()
+            now = pygame.time.get_ticks()
+            if animating and now >= next_frame:
+                tick += 1
+                redraw = True
+                next_frame = self._next_overlay_frame(now, frame_ms, align)
+            if redraw:
+                draw(tick)
+                self.screen.update()
+
+    @staticmethod
+    def _next_overlay_frame(now, frame_ms, align):
+        if frame_ms is None:
+            return now
+        return now + frame_ms - (now % frame_ms if align else 0)
+
     def _start_menu_music(self):
         """Start looping menu music if it isn't already playing."""
-        if C.MENU_MUSIC_FILE and not mixer.music.get_busy():
+        if C.MENU_MUSIC_FILE and self.assets.ensure_mixer() and not mixer.music.get_busy():
             try:
                 mixer.music.load(C.MENU_MUSIC_FILE)
                 mixer.music.set_volume(C.MENU_MUSIC_VOLUME)
@@ -418,7 +559,8 @@ class Game:
 
     def _stop_menu_music(self):
         """Fade the menu music out over MENU_MUSIC_FADEOUT_MS milliseconds."""
-        mixer.music.fadeout(C.MENU_MUSIC_FADEOUT_MS)
+        if mixer.get_init():
+            mixer.music.fadeout(C.MENU_MUSIC_FADEOUT_MS)
 
     def _start_level_exit(self):
         """Begin the portal exit animation.
@@ -433,37 +575,42 @@ class Game:
         self.snake.exit_original_n = self.exit_original_length
         self.snake.exit_consumed   = 0
         self.game_speed            = C.EXIT_ANIMATION_SPEED
-        if self.whoosh_sound:
-            self.whoosh_sound.play()
+        if self.events.wants(DoorEntered):
+            self.events.publish(DoorEntered(self.level))
 
     def _calc_level_clear_bonus(self, elapsed):
         overtime = max(0, elapsed - C.LEVEL_CLEAR_BONUS_DECAY)
         return max(0, C.LEVEL_CLEAR_BONUS_BASE - overtime // C.LEVEL_CLEAR_BONUS_RATE)
 
+    @tracing.traced(cat='level')
     def _show_level_clear_screen(self, elapsed_ticks, bonus):
         """Blocking animated screen shown between levels."""
         self._start_menu_music()
         self.screen.reset_waves()
-        anim_tick = 0
-        waiting   = True
-        while waiting and self.running:
-            self.clock.tick(20)
-            anim_tick += 1
+
+        def draw(tick):
             self.screen.tick_waves()
             self.screen.draw_level_clear_screen(
-                self.level, self.next_level, elapsed_ticks, bonus, self.score, anim_tick
+                self.level, self.next_level, elapsed_ticks, bonus, self.score, tick + 1
             )
-            self.screen.update()
-            for event in pygame.event.get():
-                if event.type == QUIT:
+
+        def on_event(event):
+            if event.type == QUIT:
+                self.running = False
+                return True
+            if event.type == KEYDOWN:
+                if event.key in (K_RETURN, K_SPACE):
+                    return True
+                if event.key == K_ESCAPE:
                     self.running = False
-                elif event.type == KEYDOWN:
-                    if event.key in (K_RETURN, K_SPACE):
-                        waiting = False
-                    elif event.key == K_ESCAPE:
-                        self.running = False
+                    return True
+            return False
+
+        if self.running:
+            self._overlay_loop(draw, on_event, C.OVERLAY_FRAME_MS)
         self._stop_menu_music()
 
+    @tracing.traced(cat='level')
     def _setup_next_level(self):
         """Advance to next_level, clear the field, and place the snake at a new entry portal."""
         self.level              = self.next_level
@@ -514,13 +661,16 @@ class Game:
         self.apple_visible = True
         self.apple.respawn(self._get_occupied_positions())
         self.level_start_tick = self.time_alive
+        if self.camera is not None:
+            self.camera.center_on(hx, hy)
 
     def _complete_level_exit(self):
         """Called when the last snake segment has entered the door."""
         elapsed = self.time_alive - self.level_start_tick
         bonus   = self._calc_level_clear_bonus(elapsed)
         self.score += bonus
-        self._show_level_clear_screen(elapsed, bonus)
+        if not self.headless:
+            self._show_level_clear_screen(elapsed, bonus)
         if self.running:
             self._setup_next_level()
         self.level_exiting = False
@@ -543,7 +693,9 @@ class Game:
                     self._complete_level_exit()
             self._tick_active_buffs()
             self.time_alive += 1
+            start = perf_counter()
             self._update_mechanics_and_objects()
+            self.perf.add('update.mechanics', start)
             self.particle_effects = [e for e in self.particle_effects if e.update()]
             return
 
@@ -561,13 +713,10 @@ class Game:
         if do_move:
             if not self.snake.move(ghost='ghost_mode' in self.active_buffs):
                 head = self.snake.get_head_position()
-                self.death_pos = (
-                    head[0] * C.GRID_SIZE + C.GRID_SIZE // 2,
-                    head[1] * C.GRID_SIZE + C.GRID_SIZE // 2,
-                )
-                if head in self.snake.positions[1:]:
-                    if self.bite_self_sound:
-                        self.bite_self_sound.play()
+                self.death_pos = self._cell_center_px(*head)
+                if self.events.wants(SnakeDied):
+                    cause = 'self' if head in self.snake.positions[1:] else 'wall'
+                    self.events.publish(SnakeDied(cause, *head))
                 self.game_over()
                 return
 
@@ -598,8 +747,16 @@ class Game:
         # Check if player advances to next level
         self._check_for_level_up()
 
+        # Stream endless-world chunks in and out around the head
+        if self.world is not None:
+            start = perf_counter()
+            self.world.update(self)
+            self.perf.add('update.world', start)
+
         # Apply level-specific mechanics
+        start = perf_counter()
         self._update_mechanics_and_objects()
+        self.perf.add('update.mechanics', start)
 
         # Update particle effects and remove finished ones
         self.particle_effects = [effect for effect in self.particle_effects if effect.update()]
@@ -607,15 +764,17 @@ class Game:
     def _apply_obstacle_death(self):
         """Handle an obstacle collision: absorb one shield charge or die."""
         self.current_streak = 0
+        head = self.snake.get_head_position()
         if 'shield' in self.active_buffs:
             self.active_buffs['shield'] -= 1
-            if self.active_buffs['shield'] == 0:
+            charges_left = self.active_buffs['shield']
+            if charges_left == 0:
                 del self.active_buffs['shield']
-            if self.bite_obstacle_sound:
-                self.bite_obstacle_sound.play()
+            if self.events.wants(ShieldAbsorbed):
+                self.events.publish(ShieldAbsorbed(*head, charges_left))
             return  # hit absorbed – snake survives
-        if self.bite_obstacle_sound:
-            self.bite_obstacle_sound.play()
+        if self.events.wants(SnakeDied):
+            self.events.publish(SnakeDied('obstacle', *head))
         self.game_over()
 
     def check_collisions(self):
@@ -630,7 +789,8 @@ class Game:
                 self.max_combo = self.combo_count
             combo_mult = min(self.combo_count, C.COMBO_MAX_MULT)
             base_score = 2 if 'double_score' in self.active_buffs else 1
-            self.score += base_score * combo_mult
+            gained = base_score * combo_mult
+            self.score += gained
             self.apples_eaten += 1
             if combo_mult >= 2:
                 self.current_streak += 1
@@ -640,8 +800,8 @@ class Game:
                 self.current_streak = 0  # first apple in a chain; no bonus yet
             if 'no_grow' not in self.active_buffs:
                 self.snake.grow()
-            if self.apple_eat_sound:
-                self.apple_eat_sound.play()
+            if self.events.wants(AppleEaten):
+                self.events.publish(AppleEaten(self.apple.x, self.apple.y, self.combo_count, gained))
 
             # Level-specific obstacle spawning (paused while clearing or door active)
             if not self.level_clearing and not self.level_door:
@@ -657,7 +817,8 @@ class Game:
                     self._add_obstacle(random.choice(["static", "orthogonal", "diagonal", "seeker"]))
 
             # Respawn apple, ensuring it's not on the snake or obstacles
-            self.apple.respawn(self._get_occupied_positions())
+            self._count_spawn('apple', self.apple.respawn(self._get_occupied_positions(),
+                                                          bounds=self._spawn_area()))
 
             # In test mode, force the target buff after the very first apple
             if self.test_buff and self.apples_eaten == 1:
@@ -673,10 +834,8 @@ class Game:
             if self.snake.collides_with_rect(magic_apple.rect):
                 self.score += 5
                 self.snake.grow()
-                if self.magic_apple_eat_sounds:
-                    random.choice(self.magic_apple_eat_sounds).play()
-                elif self.magic_apple_eat_sound:
-                    self.magic_apple_eat_sound.play()
+                if self.events.wants(MagicAppleEaten):
+                    self.events.publish(MagicAppleEaten(magic_apple.x, magic_apple.y, magic_apple.type))
                 # Dispatch buff effect
                 fn = getattr(mal, magic_apple.type, None)
                 if fn:
@@ -685,7 +844,7 @@ class Game:
                 self.magic_apples.remove(magic_apple)
                 label, color = C.BUFF_DISPLAY_NAMES.get(
                     magic_apple.type, (magic_apple.type, C.TEXT_COLOR))
-                self.buff_announcements.append(BuffAnnouncement(label, color))
+                self.buff_announcements.append(BuffAnnouncement(label, color, self.assets.font('announcement')))
                 break
 
         # Snake hitting static obstacles (bypassed during ghost_mode)
@@ -694,10 +853,7 @@ class Game:
                 if ob in self.obstacle_hit_cooldowns:
                     continue
                 if any(self.snake.collides_with_rect(r) for r in ob.rects):
-                    self.death_pos = (
-                        ob.x * C.GRID_SIZE + C.GRID_SIZE // 2,
-                        ob.y * C.GRID_SIZE + C.GRID_SIZE // 2,
-                    )
+                    self.death_pos = self._cell_center_px(ob.x, ob.y)
                     self._apply_obstacle_death()
                     if self.running:  # hit absorbed – start cooldown
                         self.obstacle_hit_cooldowns[ob] = C.OBSTACLE_HIT_COOLDOWN
@@ -709,10 +865,8 @@ class Game:
                 if moving_obstacle in self.obstacle_hit_cooldowns:
                     continue
                 if moving_obstacle.collides_with_snake_head(self.snake):
-                    self.death_pos = (
-                        int(moving_obstacle.float_x * C.GRID_SIZE + C.GRID_SIZE // 2),
-                        int(moving_obstacle.float_y * C.GRID_SIZE + C.GRID_SIZE // 2),
-                    )
+                    self.death_pos = self._cell_center_px(moving_obstacle.float_x,
+                                                          moving_obstacle.float_y)
                     self._apply_obstacle_death()
                     if self.running:  # hit absorbed – start cooldown
                         self.obstacle_hit_cooldowns[moving_obstacle] = C.OBSTACLE_HIT_COOLDOWN
@@ -723,59 +877,87 @@ class Game:
             if self.level_door.is_head_entering(self.snake):
                 self._start_level_exit()
 
+    def _cell_center_px(self, gx, gy):
+        """Screen-pixel centre of grid cell (gx, gy), accounting for the camera."""
+        if self.camera is None:
+            px, py = gx * C.GRID_SIZE, gy * C.GRID_SIZE
+        else:
+            px, py = self.camera.to_screen(gx, gy)
+        return int(px + C.GRID_SIZE // 2), int(py + C.GRID_SIZE // 2)
+
     def draw(self):
         """ Draws all game elements onto the screen. """
+        perf = self.perf
+        perf.lap_start()
         invert = 'color_invert' in self.active_buffs
         self.screen.invert_mode = invert
         self.screen.clear()
+        perf.lap('clear')
+
+        # Scroll the viewport and cull everything outside it (no-op on window-sized boards)
+        cam = self.camera
+        if cam is not None:
+            if not self.level_exiting:   # hold still while the snake crawls into the portal
+                cam.follow(*self.snake.get_head_position())
+            visible = cam.is_visible
+        else:
+            visible = None
 
         for effect in self.particle_effects:
-            effect.draw(self.screen.surface)
+            if visible is None or visible(effect.x, effect.y):
+                effect.draw(self.screen.surface, cam)
+        perf.lap('effects')
 
         self.snake.ghost_alpha = C.SNAKE_GHOST_ALPHA if 'ghost_mode' in self.active_buffs else 255
         self.snake.invert_colors = invert
-        self.screen.draw_element(self.snake)
+        self.screen.draw_element(self.snake, cam)
+        perf.lap('snake')
 
         # Apple: hidden during level-clear sequence
-        if self.apple_visible:
+        if self.apple_visible and (visible is None or visible(self.apple.x, self.apple.y)):
             orig_apple_color = self.apple.color
             if invert:
                 self.apple.color = (0, 190, 0)
-            self.screen.draw_element(self.apple)
+            self.screen.draw_element(self.apple, cam)
             self.apple.color = orig_apple_color
 
         # Magic apples: swap fill to magenta when inverted; border (lifespan) unchanged
         for magic_apple in self.magic_apples:
+            if visible is not None and not visible(magic_apple.x, magic_apple.y):
+                continue
             orig_ma_color = magic_apple.color
             if invert:
                 magic_apple.color = (200, 0, 200)
-            self.screen.draw_element(magic_apple)
+            self.screen.draw_element(magic_apple, cam)
             magic_apple.color = orig_ma_color
+        perf.lap('apples')
 
         for obstacle in self.obstacles:
-            self.screen.draw_element(obstacle)
+            if visible is None or visible(obstacle.x, obstacle.y):
+                self.screen.draw_element(obstacle, cam)
         for moving_obstacle in self.moving_obstacles:
-            self.screen.draw_element(moving_obstacle)
+            if visible is None or visible(moving_obstacle.float_x, moving_obstacle.float_y):
+                self.screen.draw_element(moving_obstacle, cam)
+        perf.lap('obstacles')
 
         # Level door portals
         if self.level_door:
             if self.level_exiting and self.exit_segments_left <= 0 and C.DOOR_FADEOUT_TICKS > 0:
                 door_alpha = self.exit_door_fade / C.DOOR_FADEOUT_TICKS
-                self.level_door.draw(self.screen.surface, alpha_scale=door_alpha)
+                self.level_door.draw(self.screen.surface, alpha_scale=door_alpha, camera=cam)
             else:
-                self.level_door.draw(self.screen.surface)
+                self.level_door.draw(self.screen.surface, camera=cam)
         if self.entry_door:
             fade = max(0.0, self.entry_door_ticks / C.DOOR_ENTRY_FADE_TICKS)
-            self.entry_door.draw(self.screen.surface, alpha_scale=fade)
+            self.entry_door.draw(self.screen.surface, alpha_scale=fade, camera=cam)
+        perf.lap('doors')
 
         # Darkness buff: drape a fully-opaque vignette over the gameplay layer,
         # leaving only a soft-edged circle around the snake head visible.
         # Applied BEFORE buff announcements and HUD so they always stay readable.
         if 'darkness' in self.active_buffs:
-            head_x, head_y = self.snake.get_head_position()
-            px = head_x * C.GRID_SIZE + C.GRID_SIZE // 2
-            py = head_y * C.GRID_SIZE + C.GRID_SIZE // 2
-            self.screen.apply_darkness((px, py))
+            self.screen.apply_darkness(self._cell_center_px(*self.snake.get_head_position()))
+            perf.lap('darkness')
 
         # Buff announcements drawn after the darkness mask so they are never hidden
         active = []
@@ -784,11 +966,38 @@ class Game:
                 ann.draw(self.screen.surface)
                 active.append(ann)
         self.buff_announcements = active
+        perf.lap('announcements')
 
         self.screen.draw_score_and_level(self.score, self.level,
                                           self.combo_count, self.combo_timer)
         self.screen.draw_buffs(self.active_buffs)
+        perf.lap('hud')
+        if self.show_debug:
+            self.screen.draw_debug_overlay(self._debug_lines())
+            perf.lap('debug')
         self.screen.update()
+        perf.lap('present')
+
+    def _debug_lines(self):
+        """Text for the F3 overlay."""
+        lines = [f'fps: {self.clock.get_fps():.1f} (target {self.game_speed})']
+        lines += self.quality.debug_lines()
+        lines.append(f'particles {C.PARTICLE_COUNT}  pulses {C.PULSE_COUNT}  '
+                     f'alpha {"on" if C.ALPHA_EFFECTS else "off"}  waves 1/{C.WAVE_SPAWN_INTERVAL}')
+        lines += self.perf.debug_lines()
+        if self.autopilot is not None:
+            lines += self.autopilot.debug_lines()
+        return lines
+
+    def _entity_counts(self):
+        """Per-frame entity counts recorded next to the timings."""
+        return {
+            'snake': len(self.snake.positions),
+            'obstacles': len(self.obstacles),
+            'movers': len(self.moving_obstacles),
+            'magic': len(self.magic_apples),
+            'particles': sum(len(getattr(e, 'particles', ())) for e in self.particle_effects),
+        }
 
     def check_and_update_high_scores(self, current_score):
         """ Checks if the current score qualifies for the high score list. """
@@ -810,43 +1019,47 @@ class Game:
 
     def get_player_name(self):
         """ Handles the text input screen for entering a high score name. """
-        player_name = ""
-        input_active = True
+        name = []
         prompt = f"High Score! Enter Name (max {C.MAX_NAME_LENGTH}):"
+        result = {'cancelled': False}
 
-        while input_active and self.running:
-            self.clock.tick(30)  # cap at 30 fps so the blinking cursor redraws smoothly
+        def draw(tick):
             self.screen.clear()
             self.screen.draw_overlay()
             self.screen.draw_game_over_message(self.score)
-            self.screen.draw_text_input(prompt, player_name, True)
-            self.screen.update()
-
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    self.running = False # Signal game exit
-                    return None # Indicate quit
-                if event.type == KEYDOWN:
-                    if event.key == K_RETURN:
-                        input_active = False # Name submitted
-                    elif event.key == K_BACKSPACE:
-                        player_name = player_name[:-1]
-                    elif event.key == K_ESCAPE:
-                        return None # Allow escaping name entry without saving
-                    else:
-                        # Add character if it's printable and name length is within limit
-                        if len(player_name) < C.MAX_NAME_LENGTH and event.unicode.isprintable():
-                             # Check isprintable() for safety, though event.unicode usually handles it
-                            player_name += event.unicode
+            self.screen.draw_text_input(prompt, ''.join(name), True)
 
+        def on_event(event):
+            if event.type == QUIT:
+                self.running = False # Signal game exit
+                result['cancelled'] = True
+                return True
+            if event.type == KEYDOWN:
+                if event.key == K_RETURN:
+                    return True # Name submitted
+                elif event.key == K_BACKSPACE:
+                    if name:
+                        name.pop()
+                elif event.key == K_ESCAPE:
+                    result['cancelled'] = True # Allow escaping name entry without saving
+                    return True
+                # Add character if it's printable and name length is within limit
+                elif len(name) < C.MAX_NAME_LENGTH and event.unicode.isprintable():
+                    name.append(event.unicode)
+            return False
+
+        # Frames only when the cursor blinks (or a key is typed)
+        self._overlay_loop(draw, on_event, C.CURSOR_BLINK_MS, align=True)
+        if result['cancelled']:
+            return None # Indicate quit
+        player_name = ''.join(name)
         return player_name if player_name else "Anonymous" # Default name if empty
 
     def pause_game(self):
         """Pauses the game, shows live stats overlay, and waits for SPACE to resume."""
         snapshot = self.screen.surface.copy()
-        tick = 0
-        while True:
-            self.clock.tick(20)
+
+        def draw(tick):
             self.screen.surface.blit(snapshot, (0, 0))
             playtime_s   = self.time_alive // C.SNAKE_SPEED_INITIAL
             snake_length = len(self.snake.positions)
@@ -855,118 +1068,133 @@ class Game:
                 self.apples_eaten, self.magic_apples_eaten,
                 self.distance_traveled, self.longest_streak, tick
             )
-            self.screen.update()
-            tick += 1
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    self.running = False
-                    return
-                if event.type == KEYDOWN:
-                    if event.key == K_SPACE:
-                        return
-                    if event.key == K_ESCAPE:
-                        self.confirm_quit()
-                        if not self.running:
-                            return
+
+        def on_event(event):
+            if event.type == QUIT:
+                self.running = False
+                return True
+            if event.type == KEYDOWN:
+                if event.key == K_SPACE:
+                    return True
+                if event.key == K_ESCAPE:
+                    self.confirm_quit()
+                    return not self.running
+            return False
+
+        self._overlay_loop(draw, on_event, C.OVERLAY_FRAME_MS)
 
     def confirm_quit(self):
         """Show a quit-confirmation dialog; quit only if ESC is pressed again."""
         # Freeze the current frame; only the dialog animates on top
         snapshot = self.screen.surface.copy()
-        tick = 0
-        quit_rect = resume_rect = None
-        while True:
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    self.running = False
-                    return
-                if event.type == KEYDOWN:
-                    if event.key == K_ESCAPE:
-                        self.running = False
-                        return
-                    if event.key == K_SPACE:
-                        return  # resume
-                if event.type == MOUSEBUTTONDOWN and event.button == 1:
-                    if quit_rect and quit_rect.collidepoint(event.pos):
-                        self.running = False
-                        return
-                    if resume_rect and resume_rect.collidepoint(event.pos):
-                        return
+        buttons = [None, None]   # quit_rect, resume_rect from the last frame
+
+        def draw(tick):
             self.screen.surface.blit(snapshot, (0, 0))
-            quit_rect, resume_rect = self.screen.draw_quit_confirm(tick)
-            self.screen.update()
-            self.clock.tick(20)
-            tick += 1
+            buttons[:] = self.screen.draw_quit_confirm(tick)
+
+        def on_event(event):
+            quit_rect, resume_rect = buttons
+            if event.type == QUIT:
+                self.running = False
+                return True
+            if event.type == KEYDOWN:
+                if event.key == K_ESCAPE:
+                    self.running = False
+                    return True
+                if event.key == K_SPACE:
+                    return True  # resume
+            if event.type == MOUSEBUTTONDOWN and event.button == 1:
+                click = self.screen.to_logical(event.pos)
+                if quit_rect and quit_rect.collidepoint(click):
+                    self.running = False
+                    return True
+                if resume_rect and resume_rect.collidepoint(click):
+                    return True
+            return False
+
+        self._overlay_loop(draw, on_event, C.OVERLAY_FRAME_MS)
 
     def wait_for_continue(self):
         """Game pauses and awaits 'Space'. Other buttons cannot be pressed."""
         self.running = False # Pause the game loop
         # Print to the bottom of the screen "Press Space to continue..."
         self.screen.draw_bottom_message(message="Press SPACE to continue...", size=20)
-        self.screen.update()
-        waiting_for_input = True
-        while waiting_for_input:
-            self.clock.tick(15)  # Lower tick rate for game over screen
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    self.running = False
-                    waiting_for_input = False
-                elif event.type == KEYDOWN:
-                    if event.key == K_SPACE:
-                        waiting_for_input = False  # Exit waiting loop
-                        self.running = True  # Ensure game continues
+
+        def on_event(event):
+            if event.type == QUIT:
+                return True
+            if event.type == KEYDOWN and event.key == K_SPACE:
+                self.running = True  # Ensure game continues
+                return True
+            return False
+
+        # Static screen: nothing to redraw, block until a key arrives
+        self._overlay_loop(lambda tick: None, on_event)
     
     def wait_for_continue_after_death(self):
         """Game pauses and awaits 'Space'. Other buttons cannot be pressed. In the meantime a random joke sentence will pass over the screen."""
         # chose random joke from the death message list
         joke_text = random.choice(C.Death_Messages)
         text_height_start = random.randint(50, C.SCREEN_HEIGHT-100)
-        current_text_height = text_height_start
         # measure rendered text width and pick an X so the text stays fully on-screen
         font_size = 20
         font = pygame.font.Font(None, font_size)
         text_pixel_width, _ = font.size(joke_text)
-        current_text_width = text_pixel_width / 1.5 + 20
+        text_x_start = text_pixel_width / 1.5 + 20
 
         self.running = False # Pause the game loop
         self.screen.draw_bottom_message(message="Press SPACE to continue...", size=20)
-        self.screen.update()
-        waiting_for_input = True
         static_background = self.screen.surface.copy() # save the current visuals to rerender it
         shockwave = ShockwaveEffect(*self.death_pos) if self.death_pos else None
-        while waiting_for_input:
-            self.clock.tick(15)  # Lower tick rate for game over screen
+
+        def draw(tick):
             # reprint the last screen
             self.screen.surface.blit(static_background, (0, 0))
             # shockwave at the point of death
             if shockwave and not shockwave.done:
-                shockwave.update()
+                if tick:
+                    shockwave.update()
                 shockwave.draw(self.screen.surface)
-            # display the joke text
-            self.screen.draw_message_at_x_y(joke_text, current_text_width, current_text_height, 20)
+            # display the joke text; it drifts one pixel per frame, sometimes up,
+            # sometimes down, depending on where it starts, and always to the right
+            drift = tick if text_height_start < C.SCREEN_HEIGHT/2 else -tick
+            self.screen.draw_message_at_x_y(joke_text, text_x_start + tick, text_height_start + drift, 20)
 
-            # change position for next frame
-            if text_height_start < C.SCREEN_HEIGHT/2: # sometimes text goes up, sometimes down, depending on where it starts
-                current_text_height += 1
-            else:
-                current_text_height -= 1
-            current_text_width += 1 # text always goes towards the right
-            self.screen.update()
-
-            # check for the user to press enter
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    self.running = False
-                    waiting_for_input = False
-                elif event.type == KEYDOWN:
-                    if event.key == K_SPACE:
-                        waiting_for_input = False  # Exit waiting loop
-                        self.running = True  # Ensure game continues
-                        self._start_menu_music()
+        def on_event(event):
+            if event.type == QUIT:
+                return True
+            if event.type == KEYDOWN and event.key == K_SPACE:
+                self.running = True  # Ensure game continues
+                self._start_menu_music()
+                return True
+            return False
+
+        self._overlay_loop(draw, on_event, C.DEATH_SCREEN_FRAME_MS)
+
+    def _collect_run_stats(self):
+        """Stats of the current run, as shown on the death screen."""
+        return {
+            'score':           self.score,
+            'apples':          self.apples_eaten,
+            'time_ticks':      self.time_alive,
+            'max_level':       self.max_level_reached,
+            'max_length':      self.max_snake_length,
+            'distance':        self.distance_traveled,
+            'magic_apples':    self.magic_apples_eaten,
+            'max_combo':       self.max_combo,
+            'longest_streak':  self.longest_streak,
+        }
 
     def game_over(self):
         """ Handles the game over sequence, including high score check and restart prompt. """
         self.gameover = True
+        self.events.flush()   # the death sound must play before the blocking death screen
+        if self.headless:
+            self.running = False   # no death screen or name entry; step() reports the end
+            return
+        if self.autosaver:
+            self.autosaver.clear()  # a finished run can't be resumed
         self.wait_for_continue_after_death()
         self.running = True # Allow the game to continue for restart or quit
         insert_pos = self.check_and_update_high_scores(self.score)
@@ -988,47 +1216,41 @@ class Game:
             # Reload high scores after saving to ensure the list displayed is current
             self.high_scores = hs.load_high_scores()
 
-        # Build stats dict for the death screen
-        stats = {
-            'apples':          self.apples_eaten,
-            'time_ticks':      self.time_alive,
-            'max_level':       self.max_level_reached,
-            'max_length':      self.max_snake_length,
-            'distance':        self.distance_traveled,
-            'magic_apples':    self.magic_apples_eaten,
-            'max_combo':       self.max_combo,
-            'longest_streak':  self.longest_streak,
-        }
+        stats = self._collect_run_stats()
 
-        # Animated game-over screen – redraws each tick so waves animate
+        # Animated game-over screen – waves animate until the player goes idle
         self.screen.reset_waves()
-        waiting_for_input = True
-        anim_tick = 0
-        restart_rect = quit_rect = None
-        while waiting_for_input and self.running:
-            self.clock.tick(20)
-            anim_tick += 1
+        buttons = [None, None]   # restart_rect, quit_rect from the last frame
+
+        def draw(tick):
             self.screen.tick_waves()
-            restart_rect, quit_rect = self.screen.draw_death_screen(
+            buttons[:] = self.screen.draw_death_screen(
                 self.score, stats, self.high_scores,
-                highlight_pos=insert_pos, tick=anim_tick
+                highlight_pos=insert_pos, tick=tick + 1
             )
-            self.screen.update()
-            for event in pygame.event.get():
-                if event.type == QUIT:
+
+        def on_event(event):
+            restart_rect, quit_rect = buttons
+            if event.type == QUIT:
+                self.running = False
+                return True
+            if event.type == KEYDOWN:
+                if event.key == K_ESCAPE:
+                    self.running = False
+                    return True
+                if event.key == K_RETURN:
+                    return True
+            if event.type == MOUSEBUTTONDOWN and event.button == 1:
+                click = self.screen.to_logical(event.pos)
+                if restart_rect and restart_rect.collidepoint(click):
+                    return True
+                if quit_rect and quit_rect.collidepoint(click):
                     self.running = False
-                    waiting_for_input = False
-                elif event.type == KEYDOWN:
-                    if event.key == K_ESCAPE:
-                        self.running = False
-                    elif event.key == K_RETURN:
-                        waiting_for_input = False
-                elif event.type == MOUSEBUTTONDOWN and event.button == 1:
-                    if restart_rect and restart_rect.collidepoint(event.pos):
-                        waiting_for_input = False
-                    elif quit_rect and quit_rect.collidepoint(event.pos):
-                        self.running = False
-                        waiting_for_input = False
+                    return True
+            return False
+
+        if self.running:
+            self._overlay_loop(draw, on_event, C.OVERLAY_FRAME_MS)
 
         # If the game is still running (i.e., didn't quit), reset for a new game
         if self.running:
@@ -1037,12 +1259,14 @@ class Game:
 
     def reset(self):
         """ Resets the game state for a new game. """
+        self.events.clear()   # reactions to the previous run are stale
         self.snake = Snake()
         self.obstacles = []
         self.moving_obstacles = []
         self.magic_apples = []
         self.particle_effects = []
         self.buff_announcements = []
+        self.world = ChunkWorld(self.seed, self.snake.get_head_position()) if C.ENDLESS_WORLD else None
         self.apple = self._create_initial_apple()
         self.score = 0
         self.apples_eaten = 0
@@ -1081,24 +1305,140 @@ class Game:
         self.apple_visible        = True    # False while clearing/door active (no new apples)
         self.death_pos = None   # screen-pixel (cx, cy) of the object that killed the snake
         self.obstacle_hit_cooldowns = {}  # obstacle -> ticks until same obstacle can hit again
+        self.gameover = False
         self.running = True
         self._apply_start_level()
+        if self.world is not None:
+            self.world.update(self, force=True)   # populate the starting chunks
+        if self.camera is not None:
+            self.camera.center_on(*self.snake.get_head_position())
+
+    def _offer_resume(self):
+        """If an autosaved run exists, restore it and ask whether to continue it.
+        Declining starts a fresh game and discards the checkpoint.  A checkpoint made
+        with another board size or world mode is left alone and this run not saved."""
+        data = self.autosaver.load()
+        if not data:
+            return
+        try:
+            save_state.restore(self, data)
+        except save_state.SnapshotMismatch as e:
+            # A healthy run for another --board / --endless: leave it for that setup
+            # and don't checkpoint this session over it
+            print(f"Warning: Keeping autosave for another setup ({self.autosaver.path}): {e}; "
+                  f"this run is not autosaved")
+            self.autosaver.close()
+            self.autosaver = None
+            return
+        except save_state.SnapshotError as e:
+            print(f"Warning: Ignoring unusable autosave ({self.autosaver.path}): {e}")
+            self.autosaver.clear()
+            return
+
+        # Show the restored board frozen behind the dialog
+        self.draw()
+        snapshot = self.screen.surface.copy()
+        buttons = [None, None]   # resume_rect, new_rect from the last frame
+
+        def draw(tick):
+            self.screen.surface.blit(snapshot, (0, 0))
+            buttons[:] = self.screen.draw_resume_prompt(tick, self.level, self.score)
+
+        def start_new():
+            self.autosaver.clear()
+            self.reset()
+            return True
+
+        def on_event(event):
+            resume_rect, new_rect = buttons
+            if event.type == QUIT:
+                self.running = False
+                return True
+            if event.type == KEYDOWN:
+                if event.key in (K_RETURN, K_SPACE):
+                    return True
+                if event.key == K_ESCAPE:
+                    return start_new()
+            if event.type == MOUSEBUTTONDOWN and event.button == 1:
+                click = self.screen.to_logical(event.pos)
+                if resume_rect and resume_rect.collidepoint(click):
+                    return True
+                if new_rect and new_rect.collidepoint(click):
+                    return start_new()
+            return False
+
+        self._overlay_loop(draw, on_event, C.OVERLAY_FRAME_MS)
+
+    def _checkpoint(self):
+        """Hand a snapshot of the current run to the background autosaver every few ticks."""
+        if self.gameover or self.time_alive % C.AUTOSAVE_INTERVAL_TICKS != 0:
+            return
+        self.autosaver.submit(save_state.snapshot(self))
+
+    def _close_autosave(self):
+        """Persist the run on quit so it can be resumed, then stop the writer thread."""
+        if not self.gameover and self.time_alive > 0:
+            self.autosaver.save_now(save_state.snapshot(self))
+        elif not self.gameover:
+            self.autosaver.clear()  # untouched fresh game – nothing worth resuming
+        self.autosaver.close()
+
+    def step(self, render=True):
+        """Advance the game by one tick: update, collisions, event dispatch and (with
+        render=True) draw.  Does not wait for the clock or read input, so headless
+        runs can call it as fast as they like.  Returns False once the run has ended."""
+        perf = self.perf
+        work_start = start = perf_counter()   # frame budget excludes the clock.tick() sleep
+        self.update_game_state()
+        perf.add('update', start)
+        # Check collisions only if game state update didn't end the game
+        if self.running:
+            start = perf_counter()
+            self.check_collisions()
+            perf.add('collisions', start)
+            self.events.flush()   # one batched dispatch per tick
+            # Draw only if collision checks didn't end the game
+            if self.running:
+                if render:
+                    start = perf_counter()
+                    self.draw()
+                    perf.add('draw', start)
+                    self.quality.record((perf_counter() - work_start) * 1000)
+                if self.autosaver:
+                    start = perf_counter()
+                    self._checkpoint()
+                    perf.add('autosave', start)
+                perf.end_frame(self._entity_counts())
+        if self.occupancy is not None:
+            self.occupancy.sync(self)
+        return self.running
 
     def run(self):
         """ Starts and runs the main game loop. """
+        if self.autosaver:
+            self._offer_resume()
         while self.running:
+            loop_start = perf_counter()
             self.clock.tick(self.game_speed) # Control game speed
+            perf = self.perf
+            start = perf_counter()
             self.handle_events()
+            perf.add('events', start)
             # Only update and draw if the game is still running after event handling
             if self.running:
-                self.update_game_state()
-                # Check collisions only if game state update didn't end the game
-                if self.running:
-                    self.check_collisions()
-                    # Draw only if collision checks didn't end the game
-                    if self.running:
-                        self.draw()
-
+                if self.autopilot is not None:
+                    start = perf_counter()
+                    self.autopilot.drive(self)
+                    perf.add('autopilot', start)
+                self.step()
+            tracing.complete('frame', 'frame', loop_start)
+
+        if self.autosaver:
+            self._close_autosave()
+
+        # Scrapes read the mixer, so the endpoint goes first
+        if self.metrics is not None:
+            self.metrics.stop()
         # Clean up pygame resources when the loop ends
         mixer.quit() # Quit the mixer
         pygame.quit()
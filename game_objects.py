@@ -3,8 +3,21 @@ import random
 import constants as C # Use absolute import
 import math  # For particle effects calculations
 
+def _cell_px(gx, gy, camera):
+    """Top-left screen pixel of grid cell (gx, gy); identity mapping when there is no camera."""
+    if camera is None:
+        return gx * C.GRID_SIZE, gy * C.GRID_SIZE
+    return camera.to_screen(gx, gy)
+
+def _blend(color, alpha):
+    """Opaque stand-in for `color` at `alpha` over the background (used when C.ALPHA_EFFECTS is off)."""
+    bg = C.BACKGROUND_COLOR
+    return tuple(b + (c - b) * alpha // 255 for c, b in zip(color, bg))
+
 class GameObject:
     """ Base class for objects with position and size """
+    __slots__ = ('x', 'y', 'width', 'height', 'color', 'rect')
+
     def __init__(self, x, y, width, height, color):
         self.x = x
         self.y = y
@@ -14,8 +27,12 @@ class GameObject:
         # Convert grid coordinates to screen coordinates for the rect
         self.rect = pygame.Rect(self.x * C.GRID_SIZE, self.y * C.GRID_SIZE, self.width, self.height)
 
-    def draw(self, surface):
-        pygame.draw.rect(surface, self.color, self.rect)
+    def draw(self, surface, camera=None):
+        if camera is None:
+            pygame.draw.rect(surface, self.color, self.rect)
+        else:
+            px, py = camera.to_screen(self.x, self.y)
+            pygame.draw.rect(surface, self.color, pygame.Rect(px, py, self.width, self.height))
 
     def update_rect(self):
         # Update rect based on grid coordinates
@@ -26,6 +43,10 @@ class GameObject:
 
 class Snake:
     """ Represents the snake """
+    __slots__ = ('length', 'positions', 'direction', 'color', 'head_color', 'size',
+                 'float_x', 'float_y', 'ghost_alpha', 'invert_colors',
+                 'exit_mode', 'exit_consumed', 'exit_original_n')
+
     def __init__(self):
         self.length = C.SNAKE_START_LENGTH
         # Initial grid positions
@@ -40,6 +61,11 @@ class Snake:
         self.float_y = float(start_y)
         # Visual state – set by Game.draw() each frame
         self.ghost_alpha = 255
+        self.invert_colors = False
+        # Exit-portal animation state – set by Game._start_level_exit()
+        self.exit_mode = False
+        self.exit_consumed = 0       # segments already swallowed by the portal
+        self.exit_original_n = 0     # snake length when the exit began
 
     def get_head_position(self):
         # Returns integer grid position (compatible with existing logic)
@@ -52,7 +78,9 @@ class Snake:
     def move(self, ghost=False):
         dx, dy = self.direction
         cur_x, cur_y = self.get_head_position()
-        if C.WALL_COLLISION:
+        if C.ENDLESS_WORLD:
+            new_head_grid = (cur_x + dx, cur_y + dy)   # unbounded board: no walls, no wrap
+        elif C.WALL_COLLISION:
             new_head_grid = (cur_x + dx, cur_y + dy)
             if not (0 <= new_head_grid[0] < C.GRID_WIDTH and 0 <= new_head_grid[1] < C.GRID_HEIGHT):
                 return False # Wall collision
@@ -80,28 +108,34 @@ class Snake:
     def grow(self):
         self.length += 1
 
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         inset = C.SNAKE_SEGMENT_INSET
         seg_size = C.GRID_SIZE - 2 * inset
         n = len(self.positions)
-        use_alpha = self.ghost_alpha < 255
+        use_alpha = self.ghost_alpha < 255 and C.ALPHA_EFFECTS
+        blend = self.ghost_alpha < 255 and not C.ALPHA_EFFECTS
 
         # Helper: draw one inset rect (with optional alpha) onto `surface`
         def _draw_seg(sx, sy, color):
-            rx = sx * C.GRID_SIZE + inset
-            ry = sy * C.GRID_SIZE + inset
+            if camera is not None and not camera.is_visible(sx, sy, margin=0):
+                return   # culled – segment is off screen
+            rx, ry = _cell_px(sx, sy, camera)
+            rx += inset
+            ry += inset
             if use_alpha:
                 s = pygame.Surface((seg_size, seg_size), pygame.SRCALPHA)
                 s.fill((*color, self.ghost_alpha))
                 surface.blit(s, (rx, ry))
             else:
+                if blend:
+                    color = _blend(color, self.ghost_alpha)
                 pygame.draw.rect(surface, color, pygame.Rect(rx, ry, seg_size, seg_size))
 
         # Exit-portal animation: segments that have passed through the portal are
         # not rendered; remaining segments draw with their original gradient shading.
-        if getattr(self, 'exit_mode', False) and n > 0:
-            exit_consumed = getattr(self, 'exit_consumed', 0)
-            original_n    = getattr(self, 'exit_original_n', n)
+        if self.exit_mode and n > 0:
+            exit_consumed = self.exit_consumed
+            original_n    = self.exit_original_n
             for i, (x, y) in enumerate(self.positions[exit_consumed:]):
                 orig_i = exit_consumed + i
                 t = orig_i / max(original_n - 2, 1)
@@ -111,7 +145,7 @@ class Snake:
 
         # Head
         head_x, head_y = self.positions[0]
-        inv = getattr(self, 'invert_colors', False)
+        inv = self.invert_colors
         _draw_seg(head_x, head_y, (200, 30, 30) if inv else self.head_color)
 
         # Body gradient: green normally, red when color-inverted
@@ -122,8 +156,9 @@ class Snake:
 
         # Eyes on head (2 small white dots)
         dx, dy = self.direction
-        cx = head_x * C.GRID_SIZE + C.GRID_SIZE // 2
-        cy = head_y * C.GRID_SIZE + C.GRID_SIZE // 2
+        cx, cy = _cell_px(head_x, head_y, camera)
+        cx += C.GRID_SIZE // 2
+        cy += C.GRID_SIZE // 2
         r = C.SNAKE_EYE_RADIUS
         offset = C.GRID_SIZE // 2 - r - 2
         # Perpendicular axis to movement
@@ -134,7 +169,7 @@ class Snake:
             eye1 = (cx + dx * offset, cy - offset)
             eye2 = (cx + dx * offset, cy + offset)
 
-        eye_color = (255, 255, 255) if not use_alpha else (255, 255, 255)
+        eye_color = _blend((255, 255, 255), self.ghost_alpha) if blend else (255, 255, 255)
         eye_alpha = self.ghost_alpha
         if use_alpha:
             for ex, ey in (eye1, eye2):
@@ -165,13 +200,16 @@ class Snake:
 
 class Apple(GameObject):
     """ Represents the apple """
+    __slots__ = ()
+
     def __init__(self, x, y):
         super().__init__(x, y, C.APPLE_SIZE[0], C.APPLE_SIZE[1], C.APPLE_COLOR)
 
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         """Draw a circle with a small warm-white highlight."""
-        cx = self.x * C.GRID_SIZE + C.GRID_SIZE // 2
-        cy = self.y * C.GRID_SIZE + C.GRID_SIZE // 2
+        cx, cy = _cell_px(self.x, self.y, camera)
+        cx += C.GRID_SIZE // 2
+        cy += C.GRID_SIZE // 2
         radius = C.GRID_SIZE // 2 - 1
         pygame.draw.circle(surface, self.color, (cx, cy), radius)
         # Small highlight in upper-right quadrant
@@ -179,11 +217,15 @@ class Apple(GameObject):
         hy = cy - radius // 3
         pygame.draw.circle(surface, C.APPLE_HIGHLIGHT_COLOR, (hx, hy), 2)
 
-    def respawn(self, occupied_positions):
-        """ Respawn apple in a free grid location """
+    def respawn(self, occupied_positions, bounds=None):
+        """ Respawn apple in a free grid location and return the number of positions tried.
+        bounds=(x0, y0, x1, y1) limits the search area (x1/y1 exclusive); defaults to the board. """
+        x0, y0, x1, y1 = bounds if bounds is not None else (0, 0, C.GRID_WIDTH, C.GRID_HEIGHT)
+        attempts = 0
         while True:
-            self.x = random.randint(0, C.GRID_WIDTH - 1)
-            self.y = random.randint(0, C.GRID_HEIGHT - 1)
+            attempts += 1
+            self.x = random.randint(x0, x1 - 1)
+            self.y = random.randint(y0, y1 - 1)
             new_pos = (self.x, self.y)
 
             # Check if the new grid position is occupied by snake or obstacles
@@ -195,14 +237,16 @@ class Apple(GameObject):
 
             if not is_occupied:
                 self.update_rect() # Update rect based on new grid position
-                break # Found a free spot
+                return attempts # Found a free spot
 
 class MagicApple(GameObject):
     """ Represents a magic apple """
-    def __init__(self, x, y, force_type=None):
+    __slots__ = ('type', 'lifespan', 'initial_lifespan')
+
+    def __init__(self, x, y, force_type=None, rng=random):
         super().__init__(x, y, C.MAGIC_APPLE_SIZE[0], C.MAGIC_APPLE_SIZE[1], C.MAGIC_APPLE_COLOR)
-        self.type = force_type if force_type else random.choice(C.MAGIC_APPLE_TYPES)
-        self.lifespan = C.MAGIC_APPLE_LIFESPAN + random.uniform(-0.5, 0.5) * C.MAGIC_APPLE_LIFESPAN
+        self.type = force_type if force_type else rng.choice(C.MAGIC_APPLE_TYPES)
+        self.lifespan = C.MAGIC_APPLE_LIFESPAN + rng.uniform(-0.5, 0.5) * C.MAGIC_APPLE_LIFESPAN
         self.initial_lifespan = self.lifespan
 
     def update(self):
@@ -210,10 +254,11 @@ class MagicApple(GameObject):
         self.lifespan -= 1
         return self.lifespan
 
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         """Draw a gold circle with a green→red outline indicating remaining lifespan."""
-        cx = self.x * C.GRID_SIZE + C.GRID_SIZE // 2
-        cy = self.y * C.GRID_SIZE + C.GRID_SIZE // 2
+        cx, cy = _cell_px(self.x, self.y, camera)
+        cx += C.GRID_SIZE // 2
+        cy += C.GRID_SIZE // 2
         radius = C.GRID_SIZE // 2 - 1
         pygame.draw.circle(surface, self.color, (cx, cy), radius)
         # Highlight
@@ -236,6 +281,8 @@ def _draw_beveled_rect(surface, color, rect):
 
 class Obstacle(GameObject):
     """ Represents an obstacle. May occupy 1–3 cells depending on its shape. """
+    __slots__ = ('shape', 'cells', 'rects', 'lifespan')
+
     def __init__(self, x, y, shape=None):
         super().__init__(x, y, C.OBSTACLE_SIZE[0], C.OBSTACLE_SIZE[1], C.OBSTACLE_COLOR)
         if shape is None:
@@ -247,19 +294,27 @@ class Obstacle(GameObject):
             for (cx, cy) in self.cells
         ]
         self.rect = self.rects[0]  # kept for backward-compat; first cell only
+        self.lifespan = None       # ticks until despawn; None = permanent
 
-    def draw(self, surface):
-        for rect in self.rects:
-            _draw_beveled_rect(surface, self.color, rect)
+    def draw(self, surface, camera=None):
+        if camera is None:
+            for rect in self.rects:
+                _draw_beveled_rect(surface, self.color, rect)
+            return
+        for (cx, cy) in self.cells:
+            px, py = camera.to_screen(cx, cy)
+            _draw_beveled_rect(surface, self.color, pygame.Rect(px, py, C.GRID_SIZE, C.GRID_SIZE))
 
 class MovingObstacle(GameObject):
     """ Represents a moving obstacle """
-    def __init__(self, x, y):
+    __slots__ = ('dx', 'dy', 'float_x', 'float_y', 'shape', 'lifespan')
+
+    def __init__(self, x, y, rng=random):
         super().__init__(x, y, C.MOVING_OBSTACLE_SIZE[0], C.MOVING_OBSTACLE_SIZE[1], C.MOVING_OBSTACLE_COLOR_DIAGONAL)
-        # Randomly assign an initial direction
-        speed = random.uniform(C.MOVING_OBSTACLE_SPEED, C.MOVING_OBSTACLE_SPEED_MAX)
-        self.dx = random.choice([-1, 1]) * speed
-        self.dy = random.choice([-1, 1]) * speed
+        # Randomly assign an initial direction (rng: a seeded Random for endless-world chunks)
+        speed = rng.uniform(C.MOVING_OBSTACLE_SPEED, C.MOVING_OBSTACLE_SPEED_MAX)
+        self.dx = rng.choice([-1, 1]) * speed
+        self.dy = rng.choice([-1, 1]) * speed
         # Store the actual position as floats for smoother movement
         # Initialize float_x/y based on the initial grid position x/y
         self.float_x = float(x)
@@ -267,11 +322,12 @@ class MovingObstacle(GameObject):
         # Shape: list of (dx, dy) offsets from the anchor (float_x, float_y).
         # Single-cell by default; OrthogonalMovingObstacle overrides this.
         self.shape = [(0, 0)]
+        self.lifespan = None  # ticks until despawn; None = permanent
 
     @property
     def cells(self):
         """Grid positions currently occupied by all shape cells."""
-        return [(int(self.float_x) + dx, int(self.float_y) + dy) for (dx, dy) in self.shape]
+        return [(math.floor(self.float_x) + dx, math.floor(self.float_y) + dy) for (dx, dy) in self.shape]
 
     def update(self, snake, obstacles):
         # Update the floating position
@@ -283,26 +339,28 @@ class MovingObstacle(GameObject):
         current_screen_y = self.float_y * C.GRID_SIZE
         obstacle_rect = pygame.Rect(current_screen_x, current_screen_y, self.width, self.height)
 
-        # Handle wall collisions (wrap around or bounce)
-        if C.WALL_COLLISION:
+        # Handle wall collisions (wrap around or bounce); the endless world has neither
+        if C.ENDLESS_WORLD:
+            pass   # unbounded board: keep drifting, the chunk world evicts strays
+        elif C.WALL_COLLISION:
             # Bounce off walls
             if obstacle_rect.left < 0:
                 self.float_x = 0
                 self.dx = -self.dx
                 obstacle_rect.left = 0 # Adjust rect after changing float_x
-            elif obstacle_rect.right > C.SCREEN_WIDTH:
-                self.float_x = (C.SCREEN_WIDTH - self.width) / C.GRID_SIZE
+            elif obstacle_rect.right > C.GRID_WIDTH * C.GRID_SIZE:
+                self.float_x = C.GRID_WIDTH - self.width / C.GRID_SIZE
                 self.dx = -self.dx
-                obstacle_rect.right = C.SCREEN_WIDTH # Adjust rect
+                obstacle_rect.right = C.GRID_WIDTH * C.GRID_SIZE # Adjust rect
 
             if obstacle_rect.top < 0:
                 self.float_y = 0
                 self.dy = -self.dy
                 obstacle_rect.top = 0 # Adjust rect
-            elif obstacle_rect.bottom > C.SCREEN_HEIGHT:
-                self.float_y = (C.SCREEN_HEIGHT - self.height) / C.GRID_SIZE
+            elif obstacle_rect.bottom > C.GRID_HEIGHT * C.GRID_SIZE:
+                self.float_y = C.GRID_HEIGHT - self.height / C.GRID_SIZE
                 self.dy = -self.dy
-                obstacle_rect.bottom = C.SCREEN_HEIGHT # Adjust rect
+                obstacle_rect.bottom = C.GRID_HEIGHT * C.GRID_SIZE # Adjust rect
         else:
             # Wrap around - adjust float position for smooth wrapping
             if self.float_x < 0:
@@ -320,8 +378,8 @@ class MovingObstacle(GameObject):
             obstacle_rect = pygame.Rect(current_screen_x, current_screen_y, self.width, self.height)
 
         # Update the grid coordinates used for collision detection with static obstacles
-        self.x = int(self.float_x)
-        self.y = int(self.float_y)
+        self.x = math.floor(self.float_x)
+        self.y = math.floor(self.float_y)
 
         # Check collision with snake body (not head) using rectangle collision
         collided_with_body = False
@@ -367,13 +425,10 @@ class MovingObstacle(GameObject):
                     self.float_y += self.dy * 0.1
                     break
 
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         for (dx, dy) in self.shape:
-            draw_rect = pygame.Rect(
-                (self.float_x + dx) * C.GRID_SIZE,
-                (self.float_y + dy) * C.GRID_SIZE,
-                C.GRID_SIZE, C.GRID_SIZE,
-            )
+            px, py = _cell_px(self.float_x + dx, self.float_y + dy, camera)
+            draw_rect = pygame.Rect(px, py, C.GRID_SIZE, C.GRID_SIZE)
             _draw_beveled_rect(surface, self.color, draw_rect)
 
     def collides_with_snake_head(self, snake):
@@ -391,19 +446,21 @@ class MovingObstacle(GameObject):
 
 class OrthogonalMovingObstacle(MovingObstacle):
     """Represents an orthogonally moving obstacle"""
-    def __init__(self, x, y, shape=None):
-        super().__init__(x, y)
+    __slots__ = ()
+
+    def __init__(self, x, y, shape=None, rng=random):
+        super().__init__(x, y, rng)
         self.color = C.MOVING_OBSTACLE_COLOR_ORTHOGONAL
-        orientation = random.choice(['horizontal', 'vertical'])
+        orientation = rng.choice(['horizontal', 'vertical'])
         speed = C.MOVING_OBSTACLE_SPEED
         if orientation == 'horizontal':
-            self.dx = random.choice([-1, 1]) * speed
+            self.dx = rng.choice([-1, 1]) * speed
             self.dy = 0
         else:
-            self.dy = random.choice([-1, 1]) * speed
+            self.dy = rng.choice([-1, 1]) * speed
             self.dx = 0
         # Use the caller-provided shape (spawn-validated) or pick one randomly
-        self.shape = shape if shape is not None else random.choice(C.OBSTACLE_SHAPES)
+        self.shape = shape if shape is not None else rng.choice(C.OBSTACLE_SHAPES)
 
 
 class SeekerObstacle(MovingObstacle):
@@ -413,12 +470,13 @@ class SeekerObstacle(MovingObstacle):
     heading gradually (SEEKER_TURN_RATE), so the player has time to react
     and outmaneuver it.  Drawn as a diamond to distinguish it visually.
     """
+    __slots__ = ()
 
-    def __init__(self, x, y):
-        super().__init__(x, y)
+    def __init__(self, x, y, rng=random):
+        super().__init__(x, y, rng)
         self.color = C.MOVING_OBSTACLE_COLOR_SEEKER
         # Start with a random direction at seeker speed
-        angle = random.uniform(0, 2 * math.pi)
+        angle = rng.uniform(0, 2 * math.pi)
         spd = C.SEEKER_OBSTACLE_SPEED
         self.dx = math.cos(angle) * spd
         self.dy = math.sin(angle) * spd
@@ -445,10 +503,9 @@ class SeekerObstacle(MovingObstacle):
         # Delegate movement and collision physics to parent
         super().update(snake, obstacles)
 
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         """Draw as a crimson diamond to visually distinguish from square obstacles."""
-        screen_x = self.float_x * C.GRID_SIZE
-        screen_y = self.float_y * C.GRID_SIZE
+        screen_x, screen_y = _cell_px(self.float_x, self.float_y, camera)
         cx = int(screen_x + self.width / 2)
         cy = int(screen_y + self.height / 2)
         half = self.width // 2 - 1
@@ -488,6 +545,7 @@ class ShockwaveEffect:
     GROWTH_RATE  = 4.5   # px per tick
     FLASH_RADIUS = 10    # px — solid centre burst
     FLASH_LIFE   = 7     # ticks the centre burst lasts
+    __slots__ = ('cx', 'cy', 'tick', '_total')
 
     def __init__(self, cx, cy):
         self.cx   = cx
@@ -528,6 +586,8 @@ class ShockwaveEffect:
 
 class Particle:
     """Represents a single particle in a particle effect"""
+    __slots__ = ('x', 'y', 'size', 'color', 'dx', 'dy', 'lifespan', 'alpha')
+
     def __init__(self, x, y):
         # Convert grid coordinates to screen coordinates for particles
         self.x = x * C.GRID_SIZE + C.GRID_SIZE // 2  # Center of grid cell
@@ -551,20 +611,27 @@ class Particle:
         self.alpha = int(255 * (self.lifespan / C.PARTICLE_LIFESPAN))
         return self.lifespan > 0
         
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         """Draw particle with appropriate transparency"""
         if self.lifespan <= 0:
             return
+        x, y = (self.x, self.y) if camera is None else camera.to_screen_px(self.x, self.y)
+        if not C.ALPHA_EFFECTS:
+            pygame.draw.rect(surface, _blend(self.color, self.alpha),
+                             (int(x - self.size/2), int(y - self.size/2), self.size, self.size))
+            return
             
         # Create temporary surface with per-pixel alpha
         particle_surf = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
         # Apply transparency to the color
         color_with_alpha = (*self.color, self.alpha)
         pygame.draw.rect(particle_surf, color_with_alpha, (0, 0, self.size, self.size))
-        surface.blit(particle_surf, (int(self.x - self.size/2), int(self.y - self.size/2)))
+        surface.blit(particle_surf, (int(x - self.size/2), int(y - self.size/2)))
 
 class CirclePulse:
     """Represents a single expanding circle in a pulse effect"""
+    __slots__ = ('x', 'y', 'radius', 'color', 'lifespan', 'delay', 'alpha')
+
     def __init__(self, x, y, color, delay=0):
         # Convert grid coordinates to screen coordinates for the circle center
         self.x = x * C.GRID_SIZE + C.GRID_SIZE // 2
@@ -589,10 +656,15 @@ class CirclePulse:
         
         return self.lifespan > 0
     
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         """Draw the pulse circle with appropriate transparency"""
         if self.delay > 0 or self.lifespan <= 0:
             return
+        x, y = (self.x, self.y) if camera is None else camera.to_screen_px(self.x, self.y)
+        if not C.ALPHA_EFFECTS:
+            pygame.draw.circle(surface, _blend(self.color, self.alpha), (int(x), int(y)),
+                               self.radius, C.PULSE_LINE_WIDTH)
+            return
             
         # Create a temporary surface with per-pixel alpha
         size = int(self.radius * 2 + C.PULSE_LINE_WIDTH * 2)
@@ -611,11 +683,13 @@ class CirclePulse:
         # Blit the circle to the main surface
         surface.blit(
             circle_surf, 
-            (int(self.x - size // 2), int(self.y - size // 2))
+            (int(x - size // 2), int(y - size // 2))
         )
 
 class CirclePulseEffect:
     """Creates an expanding circular pulse effect from the epicentrum"""
+    __slots__ = ('pulses',)
+
     def __init__(self, x, y, effect_type="apple"):
         self.pulses = []
 
@@ -645,14 +719,18 @@ class CirclePulseEffect:
         self.pulses = [pulse for pulse in self.pulses if pulse.update()]
         return len(self.pulses) > 0  # Effect is alive if any pulses remain
         
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         """Draw all pulses in the effect"""
         for pulse in self.pulses:
-            pulse.draw(surface)
+            pulse.draw(surface, camera)
 
 class ParticleEffect:
     """Manages a group of particles for an effect"""
+    __slots__ = ('x', 'y', 'particles', 'pulses', 'effect_type')
+
     def __init__(self, x, y, effect_type="apple", is_spawning=False):
+        self.x = x   # origin grid cell, used for viewport culling
+        self.y = y
         self.particles = []
         self.pulses = None
         self.effect_type = effect_type
@@ -692,13 +770,13 @@ class ParticleEffect:
         # Return True if any effect is still active
         return self.pulses is not None or len(self.particles) > 0
         
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         """Draw all effects"""
         if self.pulses:
-            self.pulses.draw(surface)
+            self.pulses.draw(surface, camera)
             
         for particle in self.particles:
-            particle.draw(surface)
+            particle.draw(surface, camera)
 
 
 class LevelDoor:
@@ -707,22 +785,24 @@ class LevelDoor:
     to proceed to the next level.  Also used as a fading entry portal."""
 
     WIDTH = 2  # cells wide
+    __slots__ = ('wall', 'tick', 'x', 'y', 'cells_list', 'exit_dir', 'px')
 
-    def __init__(self, wall, start_tick=0):
+    def __init__(self, wall, start_tick=0, offset=None):
         """wall: 'top' | 'bottom' | 'left' | 'right'
-        start_tick: set to DOOR_APPEAR_TICKS to make the door fully visible immediately."""
+        start_tick: set to DOOR_APPEAR_TICKS to make the door fully visible immediately.
+        offset: cell position along the wall; random when None (set when restoring a save)."""
         self.wall = wall
         self.tick = start_tick
         margin = 3
         if wall in ('top', 'bottom'):
-            self.x = random.randint(margin, C.GRID_WIDTH  - self.WIDTH - margin)
+            self.x = offset if offset is not None else random.randint(margin, C.GRID_WIDTH  - self.WIDTH - margin)
             self.y = 0 if wall == 'top' else C.GRID_HEIGHT - 1
             self.cells_list = [(self.x + i, self.y) for i in range(self.WIDTH)]
             self.exit_dir   = (0, -1) if wall == 'top' else (0, 1)
             self.px = pygame.Rect(self.x * C.GRID_SIZE, self.y * C.GRID_SIZE,
                                   self.WIDTH * C.GRID_SIZE, C.GRID_SIZE)
         else:
-            self.y = random.randint(margin, C.GRID_HEIGHT - self.WIDTH - margin)
+            self.y = offset if offset is not None else random.randint(margin, C.GRID_HEIGHT - self.WIDTH - margin)
             self.x = 0 if wall == 'left' else C.GRID_WIDTH - 1
             self.cells_list = [(self.x, self.y + i) for i in range(self.WIDTH)]
             self.exit_dir   = (-1, 0) if wall == 'left' else (1, 0)
@@ -741,34 +821,38 @@ class LevelDoor:
         return (snake.get_head_position() in self.cells_list
                 and snake.direction == self.exit_dir)
 
-    def draw(self, surface, alpha_scale=1.0):
+    def draw(self, surface, alpha_scale=1.0, camera=None):
         appear = min(1.0, self.tick / max(1, C.DOOR_APPEAR_TICKS)) * alpha_scale
         if appear <= 0.01:
             return
         pulse = 0.5 + 0.5 * math.sin(self.tick * 0.18)
         r, g, b = C.DOOR_COLOR
-        cx = self.px.x + self.px.w // 2
-        cy = self.px.y + self.px.h // 2
+        px = self.px
+        if camera is not None:
+            sx, sy = camera.to_screen(self.x, self.y)
+            px = px.move(sx - px.x, sy - px.y)
+        cx = px.x + px.w // 2
+        cy = px.y + px.h // 2
 
         # Outer glow pad
         gp = int(8 * appear)
-        glow_rect = pygame.Rect(self.px.x - gp, self.px.y - gp,
-                                self.px.w + gp * 2, self.px.h + gp * 2)
+        glow_rect = pygame.Rect(px.x - gp, px.y - gp,
+                                px.w + gp * 2, px.h + gp * 2)
         gs = pygame.Surface((glow_rect.w, glow_rect.h), pygame.SRCALPHA)
         gs.fill((r, g, b, int(45 * appear * pulse)))
         surface.blit(gs, (glow_rect.x, glow_rect.y))
 
         # Inner fill
-        fs = pygame.Surface((self.px.w, self.px.h), pygame.SRCALPHA)
+        fs = pygame.Surface((px.w, px.h), pygame.SRCALPHA)
         fs.fill((r, g, b, int(120 * appear * (0.55 + 0.45 * pulse))))
-        surface.blit(fs, (self.px.x, self.px.y))
+        surface.blit(fs, (px.x, px.y))
 
         # Pulsing border
         bc = (int(r * (0.4 + 0.6 * pulse)), min(255, int(g * 1.0)), b)
-        pygame.draw.rect(surface, bc, self.px, max(1, int(3 * appear)))
+        pygame.draw.rect(surface, bc, px, max(1, int(3 * appear)))
 
         # 3 staggered expanding rings
-        max_r = max(self.px.w, self.px.h) + 4
+        max_r = max(px.w, px.h) + 4
         for i in range(3):
             phase = (self.tick * 0.10 + i / 3.0) % 1.0
             rr = int(max_r * (0.4 + phase * 0.8) * appear)
@@ -786,14 +870,11 @@ class BuffAnnouncement:
     game field remains visible underneath."""
 
     LIFESPAN = 32   # ticks the announcement lives
+    __slots__ = ('tick', 'angle', 'base_surf')
 
-    def __init__(self, label, color):
+    def __init__(self, label, color, font):
         self.tick    = 0
         self.angle   = -9          # slight counter-clockwise tilt (degrees)
-        try:
-            font = pygame.font.SysFont('Arial', 54, bold=True)
-        except pygame.error:
-            font = pygame.font.Font(None, 60)
         self.base_surf = font.render(label, True, color)
 
     def update(self):
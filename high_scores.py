@@ -1,6 +1,8 @@
 import os
 import constants as C # Use absolute import
+import tracing
 
+@tracing.traced('high_scores.load', 'io')
 def load_high_scores(filepath=C.HIGH_SCORE_FILE):
     """ Loads high scores from a file. Creates the file with defaults if it doesn't exist. """
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
@@ -29,6 +31,7 @@ def load_high_scores(filepath=C.HIGH_SCORE_FILE):
 
     return high_scores
 
+@tracing.traced('high_scores.save', 'io')
 def save_high_scores(filepath, high_scores):
     """ Saves the high scores list to a file. """
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
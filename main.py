@@ -1,6 +1,40 @@
 # IMPORTS
 import argparse
-from game import Game
+import constants as C
+from startup import StartupProfiler
+import tracing
+
+def _parse_size(text):
+    try:
+        w, h = (int(v) for v in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got '{text}'")
+    return w, h
+
+def _board_size(text):
+    """argparse type for 'WxH' board sizes."""
+    w, h = _parse_size(text)
+    if w < C.VIEW_WIDTH or h < C.VIEW_HEIGHT:
+        raise argparse.ArgumentTypeError(
+            f"board must be at least {C.VIEW_WIDTH}x{C.VIEW_HEIGHT} cells")
+    return w, h
+
+def _seed(text):
+    """argparse type for --seed: any integer that fits the int64 stored in snapshots."""
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got '{text}'")
+    if not -2**63 <= seed < 2**63:
+        raise argparse.ArgumentTypeError("seed must fit in a signed 64-bit integer")
+    return seed
+
+def _window_size(text):
+    """argparse type for 'WxH' window sizes in pixels."""
+    w, h = _parse_size(text)
+    if w < 1 or h < 1:
+        raise argparse.ArgumentTypeError("window size must be positive")
+    return w, h
 
 def main():
     parser = argparse.ArgumentParser(description='ProjectSnake')
@@ -15,9 +49,113 @@ def main():
              'level\'s threshold and a few representative obstacles already on the field. '
              'Example: --start-level 3'
     )
+    parser.add_argument(
+        '--no-autosave', action='store_true',
+        help='Disable background checkpointing and the resume prompt on start-up.'
+    )
+    parser.add_argument(
+        '--board', metavar='WxH', type=_board_size, default=None,
+        help='Logical board size in cells. Boards larger than the window scroll with the snake. '
+             'Example: --board 256x256'
+    )
+    parser.add_argument(
+        '--endless', action='store_true',
+        help='Play on an unbounded, procedurally generated world streamed in chunks around the snake.'
+    )
+    parser.add_argument(
+        '--seed', metavar='N', type=_seed, default=None,
+        help='Random seed for the run (world layout in --endless mode). Example: --seed 1234'
+    )
+    parser.add_argument(
+        '--window', metavar='WxH', type=_window_size, default=None,
+        help='Initial window size in pixels; the 600x600 game is scaled up by the largest '
+             'whole factor that fits. The window can also be resized. Example: --window 1800x1200'
+    )
+    parser.add_argument(
+        '--fullscreen', action='store_true',
+        help='Run fullscreen at the desktop resolution (scaled like --window).'
+    )
+    parser.add_argument(
+        '--asset-timings', action='store_true',
+        help='Print how long each font and sound took to load when the game exits.'
+    )
+    parser.add_argument(
+        '--profile-startup', action='store_true',
+        help='Print start-up milestones and the slowest module imports once the game is ready.'
+    )
+    parser.add_argument(
+        '--voice-stats', action='store_true',
+        help='Print per-category counts of played, coalesced, rate-limited and cut-off sounds on exit.'
+    )
+    parser.add_argument(
+        '--frame-budget', metavar='MS', type=float, default=None,
+        help=f'Update + draw time per tick before visual effects are reduced '
+             f'(default {C.FRAME_BUDGET_MS:g}; 0 keeps full quality). Press F3 in game for the debug overlay.'
+    )
+    parser.add_argument(
+        '--trace', metavar='FILE', default=None,
+        help='Record a timeline of frame phases, level transitions, asset loads and high-score I/O '
+             'and write it to FILE on exit (Chrome trace-event JSON; open in ui.perfetto.dev '
+             'or chrome://tracing). Example: --trace trace.json'
+    )
+    parser.add_argument(
+        '--autopilot', nargs='?', const='inline', choices=('inline', 'async'), default=None,
+        help='Let the built-in path planner steer the snake (load tests, demos). "async" plans in a '
+             'worker process with a per-tick deadline so the game never waits on a slow search. '
+             'Planning times show in the F3 overlay and are summarised on exit.'
+    )
+    parser.add_argument(
+        '--metrics-port', metavar='PORT', type=int, default=None,
+        help='Serve live engine counters (frame times, entities, spawns, caches, voices) in '
+             'Prometheus text format on http://127.0.0.1:PORT/metrics. Example: --metrics-port 9100'
+    )
     args = parser.parse_args()
-    game = Game(test_buff=args.test_buff, start_level=args.start_level)
-    game.run()
+    if args.autopilot and args.endless:
+        parser.error('--autopilot needs a bounded board, not --endless')
+    if args.trace:
+        tracing.enable()
+    profiler = None
+    if args.profile_startup:
+        profiler = StartupProfiler()
+        profiler.install()
+    from game import Game   # imported late so --profile-startup can time pygame and the game modules
+    if args.board:
+        C.set_board_size(*args.board)
+    if args.endless:
+        C.set_endless_world()
+    game = Game(test_buff=args.test_buff, start_level=args.start_level,
+                autosave=not args.no_autosave, seed=args.seed,
+                window_size=args.window, fullscreen=args.fullscreen, profiler=profiler,
+                frame_budget_ms=args.frame_budget)
+    if args.autopilot == 'async':
+        from planner_worker import AsyncPlanner
+        game.autopilot = AsyncPlanner()
+    elif args.autopilot:
+        from autopilot import Autopilot
+        game.autopilot = Autopilot()
+    metrics = None
+    if args.metrics_port is not None:
+        from metrics import MetricsServer
+        metrics = MetricsServer(game, args.metrics_port)
+        if metrics.start():
+            print(f"Metrics on http://{metrics.host}:{metrics.port}/metrics")
+            game.metrics = metrics
+    try:
+        game.run()
+    finally:
+        if metrics:
+            metrics.stop()
+        if args.autopilot == 'async':
+            game.autopilot.close()
+        if args.trace:
+            print(f"Trace with {tracing.write(args.trace)} events written to {args.trace}")
+    if args.asset_timings:
+        print('\n'.join(game.assets.report()))
+    if args.autopilot:
+        print(game.autopilot.report())
+    if args.voice_stats:
+        for category, counts in game.voices.stats().items():
+            print(f'{category:<10}' + '  '.join(f'{k}={v}' for k, v in counts.items()))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,171 @@
+"""
+Live engine metrics over HTTP (main.py --metrics-port N).
+
+MetricsServer runs a small asyncio HTTP server on its own daemon thread and
+answers GET /metrics in the Prometheus text exposition format, so a local
+Prometheus – or plain curl – can graph long soak and bot runs.  Everything is
+read at scrape time from counters the game keeps anyway (FrameProfiler,
+VoiceManager, EventBus, ChunkWorld, the PCM cache, Game.spawn_attempts); the
+game loop does no extra work for it.
+"""
+
+import asyncio
+import threading
+
+import constants as C
+import sound_cache
+
+
+class _Exposition:
+    """Builds the text format: one HELP/TYPE header per metric, then its samples."""
+
+    def __init__(self):
+        self.lines = []
+
+    def add(self, name, kind, help_text, samples):
+        """samples: a plain value or [(labels dict, value)]."""
+        name = 'snake_' + name
+        self.lines.append(f'# HELP {name} {help_text}')
+        self.lines.append(f'# TYPE {name} {kind}')
+        if not isinstance(samples, list):
+            samples = [({}, samples)]
+        for labels, value in samples:
+            self.lines.append(f'{name}{_labels(labels)} {value}')
+
+    def text(self):
+        return '\n'.join(self.lines) + '\n'
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{v}"' for k, v in labels.items()) + '}'
+
+
+def render(game):
+    """Current metrics of `game` in Prometheus text format."""
+    out = _Exposition()
+    perf = game.perf
+    out.add('frames_total', 'counter', 'Gameplay frames completed.', perf.frames_total)
+    out.add('ticks_per_second', 'gauge', 'Game loop rate averaged by pygame.time.Clock.',
+            round(game.clock.get_fps(), 2))
+
+    # Frame work time histogram (update + draw, excluding the clock.tick sleep)
+    name = 'snake_frame_work_ms'
+    out.lines.append(f'# HELP {name} Time spent in the game loop per frame, milliseconds.')
+    out.lines.append(f'# TYPE {name} histogram')
+    cumulative = 0
+    for bound, count in zip(C.METRICS_FRAME_BUCKETS_MS + ('+Inf',), perf.frame_buckets):
+        cumulative += count
+        out.lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+    out.lines.append(f'{name}_sum {perf.frame_ms_total:.3f}')
+    out.lines.append(f'{name}_count {perf.frames_total}')
+
+    if perf.frames:
+        last = perf.frames[-1]
+        out.add('entities', 'gauge', 'Entities alive in the last frame.',
+                [({'kind': kind}, last.get(kind, 0)) for kind in perf.count_columns])
+    out.add('score', 'gauge', 'Score of the current run.', game.score)
+    out.add('level', 'gauge', 'Current level.', game.level)
+    out.add('quality_level', 'gauge', 'Adaptive quality level (0 = full effects).', game.quality.level)
+
+    out.add('spawns_total', 'counter', 'Objects placed at random positions.',
+            [({'kind': kind}, n) for kind, n in game.spawns.items()])
+    out.add('spawn_attempts_total', 'counter', 'Random positions tried while placing objects.',
+            [({'kind': kind}, n) for kind, n in game.spawn_attempts.items()])
+
+    out.add('pcm_cache_lookups_total', 'counter', 'Sound loads served from / missing the PCM cache.',
+            [({'result': 'hit'}, sound_cache.stats['hits']),
+             ({'result': 'miss'}, sound_cache.stats['misses'])])
+
+    voices = game.voices.stats()
+    if voices:
+        out.add('voices_total', 'counter', 'Sound effect triggers by outcome.',
+                [({'category': category, 'outcome': outcome}, counts[outcome])
+                 for category, counts in voices.items()
+                 for outcome in ('played', 'coalesced', 'rate_limited', 'stolen')])
+        out.add('voices_busy', 'gauge', 'Mixer channels currently playing, per category.',
+                [({'category': category}, counts['busy']) for category, counts in voices.items()])
+
+    out.add('events_published_total', 'counter', 'Gameplay events queued on the event bus.',
+            game.events.published)
+    out.add('events_dispatched_total', 'counter', 'Gameplay events delivered to subscribers.',
+            game.events.dispatched)
+
+    world = game.world
+    if world is not None:
+        out.add('world_chunks_total', 'counter', 'Endless-world chunk transitions.',
+                [({'event': event}, getattr(world, event))
+                 for event in ('generated', 'restored', 'evicted', 'dropped')])
+        out.add('world_chunks_stored', 'gauge', 'Evicted chunks held in the LRU store.', len(world.stored))
+    return out.text()
+
+
+class MetricsServer:
+    """Serves render(game) on http://host:port/metrics from a daemon thread."""
+
+    def __init__(self, game, port, host=None):
+        self.game = game
+        self.host = host or C.METRICS_HOST
+        self.port = port
+        self.scrapes = 0
+        self._loop = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+
+    def start(self):
+        """Bind and start serving; returns False (after printing a warning) if the port is unavailable."""
+        self._thread = threading.Thread(target=self._serve, name='metrics', daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            print(f"Warning: metrics endpoint unavailable on {self.host}:{self.port}: {self._error}")
+            return False
+        return True
+
+    def stop(self):
+        """Stop serving and wait until a scrape in progress has finished; safe to call twice."""
+        if self._loop is None:
+            return
+        loop, self._loop = self._loop, None
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(1.0)
+
+    def _serve(self):
+        loop = asyncio.new_event_loop()
+        try:
+            server = loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            loop.close()
+            return
+        self.port = server.sockets[0].getsockname()[1]   # resolves port 0
+        self._loop = loop
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            server.close()
+            loop.close()
+
+    async def _handle(self, reader, writer):
+        try:
+            request = await reader.readline()
+            while (await reader.readline()).strip():
+                pass   # skip headers
+            parts = request.decode('latin-1').split()
+            if len(parts) >= 2 and parts[0] == 'GET' and parts[1].split('?')[0] == '/metrics':
+                status, body = '200 OK', render(self.game).encode()
+                self.scrapes += 1
+            else:
+                status, body = '404 Not Found', b'try /metrics\n'
+            writer.write(f'HTTP/1.1 {status}\r\n'
+                         f'Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n'
+                         f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n'.encode() + body)
+            await writer.drain()
+        except (ConnectionError, UnicodeDecodeError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,126 @@
+"""
+Per-cell occupancy planes of a Game, maintained incrementally.
+
+OccupancyGrid.planes is a (len(CHANNELS), H, W) uint8 array counting what
+covers each board cell: snake body and head, apple, magic apples, static
+obstacles, the three kinds of moving obstacles and the level door.  Once
+Game.occupancy is set, Game.step() calls sync() at the end of every tick and
+only the cells that changed are touched: head and tail for a normal move,
+the moving obstacles, and whichever apples, obstacles or doors came or went.
+Anything unexpected (new snake after reset, shrink) rebuilds that plane.
+
+`view` is a read-only alias of the planes for handing out to agents.
+Board-sized boards only – the endless world has no fixed grid.
+"""
+
+import numpy as np
+
+import constants as C
+from game_objects import OrthogonalMovingObstacle, SeekerObstacle
+
+CHANNELS = ('body', 'head', 'apple', 'magic_apple', 'static', 'orthogonal', 'diagonal', 'seeker', 'door')
+BODY, HEAD, APPLE, MAGIC, STATIC, ORTHOGONAL, DIAGONAL, SEEKER, DOOR = range(len(CHANNELS))
+
+
+def _mover_channel(obstacle):
+    if isinstance(obstacle, SeekerObstacle):
+        return SEEKER
+    if isinstance(obstacle, OrthogonalMovingObstacle):
+        return ORTHOGONAL
+    return DIAGONAL
+
+
+class OccupancyGrid:
+    """Occupancy counts per channel and cell, kept in sync with a Game by sync()."""
+
+    def __init__(self, width=None, height=None):
+        self.width = width or C.GRID_WIDTH
+        self.height = height or C.GRID_HEIGHT
+        self.planes = np.zeros((len(CHANNELS), self.height, self.width), np.uint8)
+        self.view = self.planes.view()
+        self.view.flags.writeable = False
+        self._snake = None
+        self._head = None
+        self._tail = None
+        self._length = 0
+        self._apple = None
+        self._static = {}    # id(obstacle) -> (obstacle, cells stamped); holding it keeps the id unique
+        self._magic = {}
+        self._movers = []    # (channel, cells) stamped on the last sync
+        self._door = None
+
+    def _add(self, channel, cells):
+        plane, w, h = self.planes[channel], self.width, self.height
+        for x, y in cells:
+            plane[y % h, x % w] += 1
+
+    def _remove(self, channel, cells):
+        plane, w, h = self.planes[channel], self.width, self.height
+        for x, y in cells:
+            plane[y % h, x % w] -= 1
+
+    def sync(self, game):
+        """Bring the planes up to date with `game`."""
+        self._sync_snake(game.snake)
+
+        apple = (game.apple.x, game.apple.y) if game.apple_visible else None
+        if apple != self._apple:
+            if self._apple is not None:
+                self._remove(APPLE, (self._apple,))
+            if apple is not None:
+                self._add(APPLE, (apple,))
+            self._apple = apple
+
+        self._sync_set(self._static, STATIC, game.obstacles, lambda ob: ob.cells)
+        self._sync_set(self._magic, MAGIC, game.magic_apples, lambda m: ((m.x, m.y),))
+
+        # Moving obstacles shift every tick: lift last tick's cells, stamp the current ones
+        for channel, cells in self._movers:
+            self._remove(channel, cells)
+        self._movers = [(_mover_channel(mo), mo.cells) for mo in game.moving_obstacles]
+        for channel, cells in self._movers:
+            self._add(channel, cells)
+
+        door = game.level_door
+        if door is not self._door:
+            if self._door is not None:
+                self._remove(DOOR, self._door.cells_list)
+            if door is not None:
+                self._add(DOOR, door.cells_list)
+            self._door = door
+
+    def _sync_snake(self, snake):
+        positions = snake.positions
+        head, length = positions[0], len(positions)
+        if snake is self._snake and head == self._head and length == self._length:
+            return   # did not move (manual control)
+        if (snake is self._snake and length > 1 and positions[1] == self._head
+                and length - self._length in (0, 1)):
+            # One step: the old head becomes body; the tail cell frees up unless growing
+            self._remove(HEAD, (self._head,))
+            self._add(HEAD, (head,))
+            self._add(BODY, (self._head,))
+            if length == self._length:
+                self._remove(BODY, (self._tail,))
+        else:
+            self.planes[BODY].fill(0)
+            self.planes[HEAD].fill(0)
+            self._add(BODY, positions[1:])
+            self._add(HEAD, (head,))
+        self._snake = snake
+        self._head = head
+        self._tail = positions[-1]
+        self._length = length
+
+    def _sync_set(self, tracked, channel, objects, cells_of):
+        """Stamp objects that appeared in `objects` and lift the ones that left it."""
+        if len(objects) == len(tracked) and all(id(ob) in tracked for ob in objects):
+            return
+        current = {id(ob): ob for ob in objects}
+        for key in [key for key in tracked if key not in current]:
+            self._remove(channel, tracked.pop(key)[1])
+        for key, ob in current.items():
+            if key not in tracked:
+                cells = list(cells_of(ob))
+                tracked[key] = (ob, cells)
+                self._add(channel, cells)
@@ -0,0 +1,134 @@
+"""
+Per-frame timings for the F3 overlay and F4 CSV dumps.
+
+FrameProfiler keeps the last C.PERF_HISTORY_FRAMES gameplay frames, one row
+per frame, with the milliseconds spent in each phase of Game.run():
+
+  events             handle_events()
+  autopilot          Autopilot / AsyncPlanner .drive() (main.py --autopilot)
+  update             update_game_state() (includes the two below)
+  update.world       ChunkWorld.update() in endless mode
+  update.mechanics   _update_mechanics_and_objects()
+  collisions         check_collisions()
+  draw               draw(), split per layer into draw.<layer> columns
+  autosave           _checkpoint()
+
+plus the entity counts passed to end_frame().  summary() gives the rolling
+average and p99 of every timing column; dump_csv() writes the raw rows.
+Every recorded phase is also passed to tracing, so --trace timelines show
+the same breakdown.
+"""
+
+import bisect
+import csv
+import os
+import time
+from collections import deque
+
+import constants as C
+import tracing
+
+
+class FrameProfiler:
+    """Ring buffer of per-frame phase timings and entity counts."""
+
+    def __init__(self, history=None):
+        self.frames = deque(maxlen=history or C.PERF_HISTORY_FRAMES)
+        self.columns = []           # timing columns, in first-seen order
+        self.count_columns = []     # entity count columns
+        self._current = {}
+        self._lap = 0.0
+        self._discard = False
+        self._summary = []
+        self._summary_age = C.PERF_SUMMARY_REFRESH
+        # Cumulative since start-up (metrics endpoint): frame count, total ms and
+        # a histogram of per-frame work time over C.METRICS_FRAME_BUCKETS_MS (+ overflow)
+        self.frames_total = 0
+        self.frame_ms_total = 0.0
+        self.frame_buckets = [0] * (len(C.METRICS_FRAME_BUCKETS_MS) + 1)
+
+    # ------------------------------------------------------------------ recording
+    def add(self, name, start):
+        """Charge the time since `start` (a perf_counter() value) to column `name`."""
+        end = time.perf_counter()
+        self._current[name] = self._current.get(name, 0.0) + (end - start) * 1000
+        tracing.complete(name, 'frame', start, end)
+
+    def lap_start(self):
+        self._lap = time.perf_counter()
+
+    def lap(self, layer):
+        """Charge the time since the previous lap to column 'draw.<layer>'."""
+        now = time.perf_counter()
+        name = 'draw.' + layer
+        self._current[name] = self._current.get(name, 0.0) + (now - self._lap) * 1000
+        tracing.complete(name, 'frame', self._lap, now)
+        self._lap = now
+
+    def discard(self):
+        """Drop the frame in progress, e.g. because a blocking menu ran inside it."""
+        self._discard = True
+
+    def end_frame(self, counts):
+        """Close the current frame; `counts` maps entity kind -> number alive."""
+        row, self._current = self._current, {}
+        if self._discard:
+            self._discard = False
+            return
+        frame_ms = sum(ms for name, ms in row.items() if '.' not in name)
+        self.frames_total += 1
+        self.frame_ms_total += frame_ms
+        self.frame_buckets[bisect.bisect_left(C.METRICS_FRAME_BUCKETS_MS, frame_ms)] += 1
+        for name in row:
+            if name not in self.columns:
+                self.columns.append(name)
+        for name in counts:
+            if name not in self.count_columns:
+                self.count_columns.append(name)
+        row.update(counts)
+        self.frames.append(row)
+        self._summary_age += 1
+
+    # ------------------------------------------------------------------ reporting
+    def summary(self):
+        """[(column, average ms, p99 ms)] over the buffered frames."""
+        n = len(self.frames)
+        if not n:
+            return []
+        result = []
+        for name in self.columns:
+            values = sorted(frame.get(name, 0.0) for frame in self.frames)
+            result.append((name, sum(values) / n, values[min(n - 1, int(n * 0.99))]))
+        return result
+
+    def debug_lines(self):
+        """Overlay text; the statistics are refreshed every C.PERF_SUMMARY_REFRESH frames."""
+        if self._summary_age >= C.PERF_SUMMARY_REFRESH:
+            self._summary = self.summary()
+            self._summary_age = 0
+        lines = [f'{"phase":<18}{"avg":>7}{"p99":>7}  ms ({len(self.frames)} frames)']
+        # Phases in the order they first ran, each followed by its sub-columns
+        group = {}
+        for name in self.columns:
+            group.setdefault(name.split('.')[0], len(group))
+        for name, avg, p99 in sorted(self._summary,
+                                     key=lambda s: (group[s[0].split('.')[0]], '.' in s[0])):
+            label = '  ' + name.split('.', 1)[1] if '.' in name else name
+            lines.append(f'{label:<18}{avg:7.2f}{p99:7.2f}')
+        if self.frames:
+            last = self.frames[-1]
+            lines.append('  '.join(f'{name} {last.get(name, 0)}' for name in self.count_columns))
+        return lines
+
+    def dump_csv(self, path=None):
+        """Write the buffered frames to CSV (default: a timestamped file in C.PERF_DUMP_DIR)."""
+        if path is None:
+            os.makedirs(C.PERF_DUMP_DIR, exist_ok=True)
+            path = os.path.join(C.PERF_DUMP_DIR, time.strftime('frames_%Y%m%d_%H%M%S.csv'))
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame'] + self.columns + self.count_columns)
+            for i, frame in enumerate(self.frames):
+                writer.writerow([i] + [f'{frame.get(name, 0.0):.3f}' for name in self.columns]
+                                + [frame.get(name, 0) for name in self.count_columns])
+        return path
@@ -0,0 +1,297 @@
+"""
+Autopilot planning in a worker process (main.py --autopilot async).
+
+AsyncPlanner has the same drive(game) / debug_lines() / report() interface
+as autopilot.Autopilot, so Game.run() calls it once per tick, but the search
+runs in a separate process and the game loop never waits longer than
+C.PLANNER_DEADLINE_MS for it:
+
+  1. drive() sends a compact snapshot of the board – snake cells, apple,
+     door, mover positions and velocities, and the static obstacle cells
+     only when they changed – to the worker, unless the previous snapshot
+     is still being planned.
+  2. It then waits for the answer until the deadline.  An answer is the
+     direction for this tick plus the rest of the planned path, keyed by
+     the cell the head will be on when each move is due.
+  3. If the deadline passes, the game steers by the last path received:
+     as long as the head is on one of its cells the next move is known.
+     Off the path it keeps its heading.  Late answers are still used –
+     their path carries on from where the snake then is.
+
+Only one snapshot is ever in flight, so the worker never works through a
+backlog of stale ones.  It is started with the 'spawn' method: the game
+process has a window, audio and loader threads that a forked copy must not
+inherit.  AsyncPlanner() waits until the worker has imported the planner
+and says it is ready, so the first ticks are not lost to its start-up.
+Wait times, worker planning times, missed deadlines and how each missed
+tick was steered show in the F3 overlay and in the exit summary.
+"""
+
+import math
+import os
+import traceback
+from multiprocessing import get_context
+from time import perf_counter
+
+import constants as C
+from batch_runner import Histogram, RunningStats
+
+
+# ---------------------------------------------------------------- worker side
+class _Cells:
+    """A static obstacle as far as the planner is concerned."""
+    __slots__ = ('cells',)
+
+    def __init__(self, cells):
+        self.cells = cells
+
+
+class _Mover:
+    __slots__ = ('float_x', 'float_y', 'dx', 'dy', 'shape')
+
+    def __init__(self, float_x, float_y, dx, dy, shape):
+        self.float_x, self.float_y, self.dx, self.dy, self.shape = float_x, float_y, dx, dy, shape
+
+    @property
+    def cells(self):
+        x, y = math.floor(self.float_x), math.floor(self.float_y)
+        return [(x + dx, y + dy) for dx, dy in self.shape]
+
+
+class _Snake:
+    __slots__ = ('positions', 'length', 'direction')
+
+
+class _Point:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+
+class _Door:
+    __slots__ = ('cells_list', 'exit_dir')
+
+    def __init__(self, cells_list, exit_dir):
+        self.cells_list, self.exit_dir = cells_list, exit_dir
+
+
+class PlanState:
+    """The parts of a Game the autopilot reads, rebuilt from snapshots in the worker."""
+
+    def __init__(self):
+        self.occupancy = None
+        self.snake = None
+        self.apple = _Point(0, 0)
+        self.apple_visible = False
+        self.level_door = None
+        self.level_exiting = False
+        self.obstacles = []
+        self.moving_obstacles = []
+        self.magic_apples = []   # not planned around; OccupancyGrid.sync() expects the list
+        self.active_buffs = {}
+        self._run = None
+
+    def load(self, snapshot):
+        (run, exiting, positions, length, direction, ghost, apple, door, movers, static) = snapshot
+        if run != self._run:   # a new game: the autopilot drops its plan when the snake object changes
+            self._run = run
+            self.snake = _Snake()
+        self.snake.positions = positions
+        self.snake.length = length
+        self.snake.direction = direction
+        self.level_exiting = exiting
+        self.active_buffs = {'ghost_mode': ghost} if ghost else {}
+        self.apple_visible = apple is not None
+        if apple is not None:
+            self.apple.x, self.apple.y = apple
+        self.level_door = _Door(*door) if door is not None else None
+        self.moving_obstacles = [_Mover(*mover) for mover in movers]
+        if static is not None:
+            self.obstacles = [_Cells(cells) for cells in static]
+
+
+def _planner_main(conn, board):
+    """Worker process: say 'ready', then answer (tick, snapshot) with (tick, route, decision ms, mode)."""
+    width, height, wall = board
+    if (C.GRID_WIDTH, C.GRID_HEIGHT) != (width, height):
+        C.set_board_size(width, height)   # spawned workers start from the default board
+    C.WALL_COLLISION = wall
+    from autopilot import Autopilot
+    autopilot = Autopilot()
+    state = PlanState()
+    try:
+        conn.send('ready')
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+            tick, snapshot = message
+            state.load(snapshot)
+            direction = autopilot(state)
+            route = autopilot.route()
+            if direction is not None:   # this tick's move, keyed by the head it was planned from
+                x, y = state.snake.positions[0]
+                route.insert(0, (y * width + x, direction))
+            conn.send((tick, route, autopilot.last_ms, autopilot.mode))
+    except (EOFError, OSError, KeyboardInterrupt):
+        pass   # the game went away
+    except Exception:
+        traceback.print_exc()
+    finally:
+        conn.close()
+
+
+# ---------------------------------------------------------------- game side
+class AsyncPlanner:
+    """Autopilot in a worker process with a per-tick deadline; see the module docstring."""
+
+    def __init__(self, deadline_ms=None, start_timeout=None):
+        self.deadline_ms = C.PLANNER_DEADLINE_MS if deadline_ms is None else deadline_ms
+        self.tick = 0
+        self.mode = 'starting'       # the worker's last decision (see Autopilot.mode)
+        self.counts = {'on_time': 0, 'late': 0, 'missed': 0, 'by_route': 0, 'unsteered': 0}
+        self.wait_us = RunningStats()     # time drive() held up the game loop, microseconds
+        self.wait_hist = Histogram()
+        self.worker_ms = RunningStats()   # decision time inside the worker
+        self.last_wait_ms = 0.0
+        self._route = {}             # cell -> direction, from the latest answer
+        self._pending = None         # tick of the snapshot the worker is planning
+        self._run = 0
+        self._run_start = 0
+        self._snake = None
+        self._static_key = None
+        os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')   # inherited by the worker
+        ctx = get_context('spawn')
+        self._conn, child = ctx.Pipe()
+        self._proc = ctx.Process(target=_planner_main, name='planner', daemon=True,
+                                 args=(child, (C.GRID_WIDTH, C.GRID_HEIGHT, C.WALL_COLLISION)))
+        self._proc.start()
+        child.close()
+        self._alive = True
+        self._wait_ready(C.PLANNER_START_TIMEOUT if start_timeout is None else start_timeout)
+
+    def _wait_ready(self, timeout):
+        try:
+            if self._conn.poll(timeout) and self._conn.recv() == 'ready':
+                return
+        except (EOFError, OSError):
+            pass
+        print(f'Warning: autopilot planner process did not start within {timeout:g} s; '
+              f'the snake is not steered')
+        self._alive = False
+        self._proc.terminate()
+        self._conn.close()
+
+    def drive(self, game):
+        """Steer `game` for this tick without blocking longer than the deadline."""
+        start = perf_counter()
+        self.tick += 1
+        if game.snake is not self._snake:   # new run: earlier plans are for another board
+            self._snake = game.snake
+            self._run += 1
+            self._run_start = self.tick
+            self._route = {}
+        answered = False
+        if self._alive:
+            self._receive(0)   # a late answer from an earlier tick
+            if self._pending is None:
+                self._send(game)
+            answered = self._receive(self.deadline_ms / 1000)
+        w = C.GRID_WIDTH
+        hx, hy = game.snake.get_head_position()
+        direction = self._route.get(hy * w + hx)
+        if not answered:
+            self.counts['missed'] += 1
+            self.counts['by_route' if direction is not None else 'unsteered'] += 1
+        if direction is not None:
+            game.steer(direction)
+        us = round((perf_counter() - start) * 1e6)
+        self.last_wait_ms = us / 1000
+        self.wait_us.add(us)
+        self.wait_hist.add(us)
+
+    def _send(self, game):
+        snake = game.snake
+        static = None
+        key = tuple(map(id, game.obstacles))
+        if key != self._static_key:   # obstacle cells travel only when they change
+            self._static_key = key
+            static = [ob.cells for ob in game.obstacles]
+        door = game.level_door
+        snapshot = (
+            self._run, game.level_exiting, list(snake.positions), snake.length, snake.direction,
+            game.active_buffs.get('ghost_mode', 0),
+            (game.apple.x, game.apple.y) if game.apple_visible else None,
+            (door.cells_list, door.exit_dir) if door is not None else None,
+            [(mo.float_x, mo.float_y, mo.dx, mo.dy, mo.shape) for mo in game.moving_obstacles],
+            static,
+        )
+        try:
+            self._conn.send((self.tick, snapshot))
+        except OSError:
+            self._lost()
+            return
+        self._pending = self.tick
+
+    def _receive(self, timeout):
+        """Take the worker's answer if it arrives within `timeout` seconds; True if it is
+        the answer for this tick."""
+        try:
+            if not self._conn.poll(timeout):
+                return False
+            tick, route, worker_ms, mode = self._conn.recv()
+        except (EOFError, OSError):
+            self._lost()
+            return False
+        self._pending = None
+        self.mode = mode
+        self.worker_ms.add(worker_ms)
+        if tick < self._run_start:
+            return False   # planned for the previous run
+        self._route = dict(route)
+        if tick == self.tick:
+            self.counts['on_time'] += 1
+            return True
+        self.counts['late'] += 1   # its first move is overdue, the rest may still apply
+        return False
+
+    def _lost(self):
+        if self._alive:
+            print('Warning: autopilot planner process stopped; the snake is no longer steered')
+        self._alive = False
+        self._route = {}
+
+    def close(self):
+        if not self._alive:
+            return
+        self._alive = False
+        try:
+            self._conn.send(None)
+        except OSError:
+            pass
+        self._proc.join(1.0)
+        if self._proc.is_alive():
+            self._proc.terminate()
+        self._conn.close()
+
+    # ---------------------------------------------------------------- reporting
+    def debug_lines(self):
+        """Text for the F3 overlay."""
+        counts = self.counts
+        return [f'planner {self.mode}  wait {self.last_wait_ms:.2f} ms (deadline {self.deadline_ms:g})  '
+                f'worker avg {self.worker_ms.mean:.2f} ms',
+                f'  on time {counts["on_time"]}  late {counts["late"]}  missed {counts["missed"]} '
+                f'(route {counts["by_route"]}, unsteered {counts["unsteered"]})']
+
+    def report(self):
+        """One-line summary for the exit message."""
+        if not self.wait_us.n:
+            return 'Planner: no ticks planned'
+        hist, counts = self.wait_hist, self.counts
+        return (f'Planner: {self.wait_us.n} ticks, game loop wait mean {self.wait_us.mean / 1000:.3f} ms, '
+                f'p99 {hist.quantile(0.99) / 1000:.3f}, max {self.wait_us.max / 1000:.3f} ms '
+                f'(deadline {self.deadline_ms:g} ms); worker mean {self.worker_ms.mean:.3f} ms, '
+                f'max {self.worker_ms.max:.3f} ms; {counts["missed"]} deadlines missed '
+                f'({counts["by_route"]} steered by the last route, {counts["unsteered"]} unsteered), '
+                f'{counts["late"]} late answers')
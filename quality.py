@@ -0,0 +1,68 @@
+"""
+Adaptive render quality.
+
+QualityGovernor is fed the update + draw time of every gameplay tick.  When
+QUALITY_DOWNGRADE_FRAMES ticks in a row go over FRAME_BUDGET_MS it steps one
+level down C.QUALITY_LEVELS – fewer particles and pulse rings, no per-pixel
+alpha effects, sparser death-screen ripples – and when QUALITY_UPGRADE_FRAMES
+ticks in a row leave comfortable headroom it steps back up.  The chosen level
+is written straight into the constants the effect classes already read.
+"""
+
+import constants as C
+
+
+class QualityGovernor:
+    """Sheds or restores visual effects to keep frame time within budget."""
+
+    def __init__(self, budget_ms=None):
+        self.budget_ms = C.FRAME_BUDGET_MS if budget_ms is None else budget_ms
+        self.level = 0
+        self.frame_ms = 0.0      # smoothed frame time (for display)
+        self.changes = 0         # level switches so far
+        self._over = 0
+        self._under = 0
+        self._apply()
+
+    @property
+    def enabled(self):
+        return self.budget_ms > 0
+
+    @property
+    def name(self):
+        return C.QUALITY_LEVELS[self.level][0]
+
+    def record(self, ms):
+        """Account one tick's update + draw time; may switch quality level."""
+        self.frame_ms += (ms - self.frame_ms) * 0.1
+        if not self.enabled:
+            return
+        if ms > self.budget_ms:
+            self._over += 1
+            self._under = 0
+            if self._over >= C.QUALITY_DOWNGRADE_FRAMES and self.level < len(C.QUALITY_LEVELS) - 1:
+                self._set_level(self.level + 1)
+        else:
+            self._over = 0
+            if ms < self.budget_ms * C.QUALITY_HEADROOM:
+                self._under += 1
+                if self._under >= C.QUALITY_UPGRADE_FRAMES and self.level > 0:
+                    self._set_level(self.level - 1)
+            else:
+                self._under = 0
+
+    def _set_level(self, level):
+        self.level = level
+        self.changes += 1
+        self._over = self._under = 0
+        self._apply()
+
+    def _apply(self):
+        _, C.PARTICLE_COUNT, C.PULSE_COUNT, C.ALPHA_EFFECTS, C.WAVE_SPAWN_INTERVAL = C.QUALITY_LEVELS[self.level]
+
+    def debug_lines(self):
+        budget = f'{self.budget_ms:.0f} ms' if self.enabled else 'off'
+        return [
+            f'quality: {self.name} ({self.level}/{len(C.QUALITY_LEVELS) - 1}), {self.changes} changes',
+            f'frame: {self.frame_ms:.1f} ms (budget {budget})',
+        ]
@@ -0,0 +1,415 @@
+"""
+Compact binary snapshots of a running game and a background autosaver.
+
+A snapshot covers the full simulation state (snake, apples, obstacles, buffs,
+level/door progress, run statistics and, in endless mode, the chunk world).  Purely visual state – particle
+effects, buff announcements, the death shockwave – is not saved; it simply
+restarts empty after a restore.
+
+Layout (little-endian):
+    header   : magic b'SNKS', format version (u16), crc32 of the payload (u32)
+    payload  : fixed scalar block followed by counted entity records
+
+Strings (buff / magic apple types, obstacle shapes, door walls) are stored as
+indices into the tables in constants.py, so bump SNAPSHOT_VERSION whenever
+one of those tables is reordered.
+"""
+
+import math
+import os
+import struct
+import threading
+import zlib
+
+import constants as C
+
+SNAPSHOT_MAGIC = b'SNKS'
+SNAPSHOT_VERSION = 4
+
+_HEADER = struct.Struct('<4sHI')
+
+# Game attributes stored as int32, in this exact order.
+_INT_FIELDS = (
+    'score', 'apples_eaten', 'time_alive', 'max_snake_length', 'distance_traveled',
+    'magic_apples_eaten', 'level', 'max_level_reached', 'frame_counter',
+    'base_speed', 'game_speed', 'combo_count', 'combo_timer', 'max_combo',
+    'current_streak', 'longest_streak', 'next_level', 'exit_segments_left',
+    'exit_consumed', 'exit_original_length', 'exit_door_fade', 'level_start_tick',
+    'entry_door_ticks',
+)
+# Game attributes stored as one bit each in a u16 flag word.
+_FLAG_FIELDS = (
+    'removing_static_obstacles', 'removing_orthogonal_obstacles',
+    'removing_diagonal_obstacles', 'removing_seeker_obstacles',
+    'level_clearing', 'level_exiting', 'apple_visible', 'manual_step',
+)
+
+_BOARD = struct.Struct('<ii')              # board width, height in cells
+_SCALARS = struct.Struct('<%diH' % len(_INT_FIELDS))
+_DIRECTION = struct.Struct('<Bbb')          # present, dx, dy
+_SNAKE = struct.Struct('<iddBiiI')          # length, float_x, float_y, exit_mode, exit_consumed, exit_original_n, n positions
+_COUNT = struct.Struct('<I')
+_APPLE = struct.Struct('<ii')
+_OBSTACLE = struct.Struct('<iiBi')          # x, y, shape index, lifespan (-1 = permanent)
+_MOVING = struct.Struct('<BddddBi')         # kind, float_x, float_y, dx, dy, shape index, lifespan
+_MAGIC = struct.Struct('<iiBdd')            # x, y, type index, lifespan, initial_lifespan
+_BUFF = struct.Struct('<Bi')                # type index, ticks / charges
+_DOOR = struct.Struct('<BBiii')             # present, wall index, x, y, tick
+_COOLDOWN = struct.Struct('<BIi')           # list (0 static, 1 moving), index, ticks
+
+_WALLS = ('top', 'bottom', 'left', 'right')
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot is truncated, corrupted or from another version."""
+
+
+class SnapshotMismatch(SnapshotError):
+    """Raised for an intact snapshot taken with another board size or world mode."""
+
+
+class _Reader:
+    """Sequential struct reader over a bytes payload."""
+    def __init__(self, data):
+        self.data = data
+        self.offset = 0
+
+    def take(self, fmt):
+        values = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def take_ints(self, count):
+        fmt = struct.Struct('<%di' % count)
+        return self.take(fmt)
+
+    def take_bytes(self, count):
+        if self.offset + count > len(self.data):
+            raise IndexError("block runs past end of payload")
+        chunk = bytes(self.data[self.offset:self.offset + count])
+        self.offset += count
+        return chunk
+
+
+def _moving_kind(mob):
+    # Imported lazily so save_state stays importable without pygame
+    from game_objects import OrthogonalMovingObstacle, SeekerObstacle
+    if isinstance(mob, SeekerObstacle):
+        return 2
+    if isinstance(mob, OrthogonalMovingObstacle):
+        return 1
+    return 0
+
+
+def _pack_door(door):
+    if door is None:
+        return _DOOR.pack(0, 0, 0, 0, 0)
+    return _DOOR.pack(1, _WALLS.index(door.wall), door.x, door.y, door.tick)
+
+
+def pack_entities(obstacles, moving_obstacles, magic_apples):
+    """Pack obstacle, moving obstacle and magic apple records into bytes.
+    Shared by snapshots and the endless world's evicted chunks."""
+    parts = [_COUNT.pack(len(obstacles))]
+    for ob in obstacles:
+        parts.append(_OBSTACLE.pack(ob.x, ob.y, C.OBSTACLE_SHAPES.index(ob.shape),
+                                    -1 if ob.lifespan is None else ob.lifespan))
+
+    parts.append(_COUNT.pack(len(moving_obstacles)))
+    for mob in moving_obstacles:
+        parts.append(_MOVING.pack(_moving_kind(mob), mob.float_x, mob.float_y, mob.dx, mob.dy,
+                                  C.OBSTACLE_SHAPES.index(mob.shape),
+                                  -1 if mob.lifespan is None else mob.lifespan))
+
+    parts.append(_COUNT.pack(len(magic_apples)))
+    for ma in magic_apples:
+        parts.append(_MAGIC.pack(ma.x, ma.y, C.MAGIC_APPLE_TYPES.index(ma.type),
+                                 ma.lifespan, ma.initial_lifespan))
+    return b''.join(parts)
+
+
+def _read_entities(reader):
+    from game_objects import (MagicApple, Obstacle, MovingObstacle,
+                              OrthogonalMovingObstacle, SeekerObstacle)
+    obstacles = []
+    for _ in range(reader.take(_COUNT)[0]):
+        x, y, shape_idx, lifespan = reader.take(_OBSTACLE)
+        ob = Obstacle(x, y, shape=C.OBSTACLE_SHAPES[shape_idx])
+        if lifespan >= 0:
+            ob.lifespan = lifespan
+        obstacles.append(ob)
+
+    moving_classes = (MovingObstacle, OrthogonalMovingObstacle, SeekerObstacle)
+    moving_obstacles = []
+    for _ in range(reader.take(_COUNT)[0]):
+        kind, fx, fy, dx, dy, shape_idx, lifespan = reader.take(_MOVING)
+        if kind == 1:
+            mob = OrthogonalMovingObstacle(int(fx), int(fy), shape=C.OBSTACLE_SHAPES[shape_idx])
+        else:
+            mob = moving_classes[kind](int(fx), int(fy))
+        mob.float_x, mob.float_y = fx, fy
+        mob.x, mob.y = math.floor(fx), math.floor(fy)
+        mob.dx, mob.dy = dx, dy
+        if lifespan >= 0:
+            mob.lifespan = lifespan
+        moving_obstacles.append(mob)
+
+    magic_apples = []
+    for _ in range(reader.take(_COUNT)[0]):
+        x, y, type_idx, lifespan, initial = reader.take(_MAGIC)
+        ma = MagicApple(x, y, force_type=C.MAGIC_APPLE_TYPES[type_idx])
+        ma.lifespan, ma.initial_lifespan = lifespan, initial
+        magic_apples.append(ma)
+    return obstacles, moving_obstacles, magic_apples
+
+
+def unpack_entities(data):
+    """Inverse of pack_entities(): returns (obstacles, moving_obstacles, magic_apples)."""
+    try:
+        return _read_entities(_Reader(data))
+    except (struct.error, IndexError) as e:
+        raise SnapshotError(f"entity block is corrupted: {e}") from e
+
+
+def snapshot(game):
+    """Serialize the simulation state of `game` into a versioned byte string."""
+    parts = [_BOARD.pack(C.GRID_WIDTH, C.GRID_HEIGHT)]
+    flags = 0
+    for bit, name in enumerate(_FLAG_FIELDS):
+        if getattr(game, name):
+            flags |= 1 << bit
+    parts.append(_SCALARS.pack(*[getattr(game, name) for name in _INT_FIELDS], flags))
+    if game.next_direction:
+        parts.append(_DIRECTION.pack(1, *game.next_direction))
+    else:
+        parts.append(_DIRECTION.pack(0, 0, 0))
+
+    # Snake
+    snake = game.snake
+    parts.append(_DIRECTION.pack(1, *snake.direction))
+    parts.append(_SNAKE.pack(
+        snake.length, snake.float_x, snake.float_y,
+        1 if snake.exit_mode else 0,
+        snake.exit_consumed,
+        snake.exit_original_n,
+        len(snake.positions),
+    ))
+    flat = [c for pos in snake.positions for c in pos]
+    parts.append(struct.pack('<%di' % len(flat), *flat))
+
+    parts.append(_APPLE.pack(game.apple.x, game.apple.y))
+
+    parts.append(pack_entities(game.obstacles, game.moving_obstacles, game.magic_apples))
+
+    # Active buffs
+    parts.append(_COUNT.pack(len(game.active_buffs)))
+    for key, value in game.active_buffs.items():
+        parts.append(_BUFF.pack(C.MAGIC_APPLE_TYPES.index(key), value))
+
+    # Portals
+    parts.append(_pack_door(game.level_door))
+    parts.append(_pack_door(game.entry_door))
+
+    # Per-obstacle hit cooldowns, keyed by list position instead of identity
+    static_index = {id(ob): i for i, ob in enumerate(game.obstacles)}
+    moving_index = {id(ob): i for i, ob in enumerate(game.moving_obstacles)}
+    cooldowns = []
+    for ob, ticks in game.obstacle_hit_cooldowns.items():
+        if id(ob) in static_index:
+            cooldowns.append(_COOLDOWN.pack(0, static_index[id(ob)], ticks))
+        elif id(ob) in moving_index:
+            cooldowns.append(_COOLDOWN.pack(1, moving_index[id(ob)], ticks))
+    parts.append(_COUNT.pack(len(cooldowns)))
+    parts.extend(cooldowns)
+
+    # Endless-mode chunk world (length 0 = fixed board)
+    world = game.world.to_bytes() if game.world is not None else b''
+    parts.append(_COUNT.pack(len(world)))
+    parts.append(world)
+
+    payload = b''.join(parts)
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, zlib.crc32(payload)) + payload
+
+
+def _read_door(reader):
+    from game_objects import LevelDoor
+    present, wall_idx, x, y, tick = reader.take(_DOOR)
+    if not present:
+        return None
+    wall = _WALLS[wall_idx]
+    return LevelDoor(wall, start_tick=tick, offset=x if wall in ('top', 'bottom') else y)
+
+
+def restore(game, data):
+    """Replace the simulation state of `game` with the contents of a snapshot.
+    Raises SnapshotError if the data cannot be used (SnapshotMismatch if it is fine but
+    for another board or mode); `game` is left untouched in that case."""
+    from game_objects import Snake, Apple
+    if len(data) < _HEADER.size:
+        raise SnapshotError("snapshot is truncated")
+    magic, version, crc = _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("not a snapshot file")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"unsupported snapshot version {version}")
+    payload = memoryview(data)[_HEADER.size:]
+    if zlib.crc32(payload) != crc:
+        raise SnapshotError("snapshot checksum mismatch")
+
+    try:
+        reader = _Reader(payload)
+        board = reader.take(_BOARD)
+        if board != (C.GRID_WIDTH, C.GRID_HEIGHT):
+            raise SnapshotMismatch(f"snapshot is for a {board[0]}x{board[1]} board")
+        *ints, flags = reader.take(_SCALARS)
+        has_next, ndx, ndy = reader.take(_DIRECTION)
+
+        _, sdx, sdy = reader.take(_DIRECTION)
+        length, float_x, float_y, exit_mode, exit_consumed, exit_original_n, n = reader.take(_SNAKE)
+        flat = reader.take_ints(n * 2)
+        snake = Snake()
+        snake.positions = [(flat[i], flat[i + 1]) for i in range(0, len(flat), 2)]
+        snake.length = length
+        snake.direction = (sdx, sdy)
+        snake.float_x, snake.float_y = float_x, float_y
+        if exit_mode:
+            snake.exit_mode = True
+            snake.exit_consumed = exit_consumed
+            snake.exit_original_n = exit_original_n
+
+        ax, ay = reader.take(_APPLE)
+        apple = Apple(ax, ay)
+
+        obstacles, moving_obstacles, magic_apples = _read_entities(reader)
+
+        active_buffs = {}
+        for _ in range(reader.take(_COUNT)[0]):
+            type_idx, value = reader.take(_BUFF)
+            active_buffs[C.MAGIC_APPLE_TYPES[type_idx]] = value
+
+        level_door = _read_door(reader)
+        entry_door = _read_door(reader)
+
+        cooldowns = {}
+        for _ in range(reader.take(_COUNT)[0]):
+            which, index, ticks = reader.take(_COOLDOWN)
+            cooldowns[(obstacles, moving_obstacles)[which][index]] = ticks
+
+        world_blob = reader.take_bytes(reader.take(_COUNT)[0])
+    except (struct.error, IndexError) as e:
+        raise SnapshotError(f"snapshot is corrupted: {e}") from e
+
+    if bool(world_blob) != C.ENDLESS_WORLD:
+        raise SnapshotMismatch("snapshot is from an endless run" if world_blob
+                               else "snapshot is not from an endless run")
+    world = None
+    if world_blob:
+        from world import ChunkWorld
+        world = ChunkWorld.from_bytes(world_blob)
+
+    # Everything decoded – commit to the game
+    for name, value in zip(_INT_FIELDS, ints):
+        setattr(game, name, value)
+    for bit, name in enumerate(_FLAG_FIELDS):
+        setattr(game, name, bool(flags & (1 << bit)))
+    game.next_direction = (ndx, ndy) if has_next else None
+    game.snake = snake
+    game.apple = apple
+    game.obstacles = obstacles
+    game.moving_obstacles = moving_obstacles
+    game.magic_apples = magic_apples
+    game.active_buffs = active_buffs
+    game.level_door = level_door
+    game.entry_door = entry_door
+    game.obstacle_hit_cooldowns = cooldowns
+    game.world = world
+    game.particle_effects = []
+    game.buff_announcements = []
+    game.death_pos = None
+    game.gameover = False
+    game.running = True
+    if game.camera is not None:
+        game.camera.center_on(*snake.get_head_position())
+
+
+class Autosaver:
+    """Writes snapshots to disk on a background thread.
+
+    The game thread hands over ready-made snapshot bytes with submit(); only the
+    newest pending snapshot is kept, so a slow disk never queues up work.  Files
+    are written to a temporary name and atomically renamed, so a crash mid-write
+    leaves the previous checkpoint intact."""
+
+    def __init__(self, path=C.AUTOSAVE_FILE):
+        self.path = path
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._pending = None
+        self._generation = 0   # bumped by clear() so in-flight writes are discarded
+        self._closed = False
+        self._thread = threading.Thread(target=self._worker, name='autosave', daemon=True)
+        self._thread.start()
+
+    def submit(self, data):
+        """Queue a snapshot for writing; replaces any snapshot not yet written."""
+        with self._cond:
+            self._pending = (self._generation, data)
+            self._cond.notify()
+
+    def save_now(self, data):
+        """Write a snapshot synchronously (used when the player quits)."""
+        with self._cond:
+            self._pending = None
+            generation = self._generation
+        self._write(generation, data)
+
+    def load(self):
+        """Return the bytes of the last checkpoint, or None if there is none."""
+        try:
+            with open(self.path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def clear(self):
+        """Forget the current run: drop pending writes and delete the checkpoint."""
+        with self._cond:
+            self._pending = None
+            self._generation += 1
+        with self._io_lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Warning: Could not remove autosave ({self.path}): {e}")
+
+    def close(self):
+        """Flush any pending snapshot and stop the worker thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                item, self._pending = self._pending, None
+                if item is None:
+                    return  # closed and nothing left to write
+            self._write(*item)
+
+    def _write(self, generation, data):
+        with self._io_lock:
+            if generation != self._generation:
+                return  # run was cleared after this snapshot was taken
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"Warning: Could not write autosave ({self.path}): {e}")
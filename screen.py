@@ -4,42 +4,111 @@ import random
 import constants as C # Use absolute import
 
 class Screen:
-    """ Handles screen drawing and updates """
-    def __init__(self, width=C.SCREEN_WIDTH, height=C.SCREEN_HEIGHT, caption='Snake Game'):
+    """ Handles screen drawing and updates.
+
+    Everything is drawn onto `surface`, a fixed width × height logical canvas.
+    When the window has another size the canvas is presented by one nearest-
+    neighbour scale blit per frame – by the largest whole factor that fits, or
+    shrunk to fit if the window is smaller – and letterboxed in the middle.
+    Mouse positions must go through to_logical() before hit-testing.
+
+    With headless=True no window is opened at all: the canvas is a plain
+    offscreen Surface and update() presents nothing (benchmarks, bots), so no
+    video driver is needed (SDL's dummy driver is fine).  pixels() exposes
+    that canvas to NumPy without copying, and gray_cells() is a cell-level
+    greyscale frame that skips drawing altogether. """
+    def __init__(self, width=C.SCREEN_WIDTH, height=C.SCREEN_HEIGHT, caption='Snake Game',
+                 window_size=None, fullscreen=False, headless=False):
         self.width = width
         self.height = height
-        self.surface = pygame.display.set_mode((width, height))
-        pygame.display.set_caption(caption)
-        try:
-            self.font           = pygame.font.SysFont('Arial', 22, bold=True)
-            self.font_regular   = pygame.font.SysFont('Arial', 22)
-            self.title_font     = pygame.font.SysFont('Arial', 52, bold=True)
-            self.score_font     = pygame.font.SysFont('Arial', 28, bold=True)
-            self.hs_title_font  = pygame.font.SysFont('Arial', 22, bold=True)
-            self.hs_entry_font  = pygame.font.SysFont('Arial', 19)
-            self.input_font     = pygame.font.SysFont('Arial', 22)
-            self.prompt_font    = pygame.font.SysFont('Arial', 18)
-            self.buff_font      = pygame.font.SysFont('Arial', 17, bold=True)
-            self.hud_font       = pygame.font.SysFont('Arial', 22, bold=True)
-        except pygame.error:
-            self.font           = pygame.font.Font(None, 28)
-            self.font_regular   = pygame.font.Font(None, 28)
-            self.title_font     = pygame.font.Font(None, 64)
-            self.score_font     = pygame.font.Font(None, 34)
-            self.hs_title_font  = pygame.font.Font(None, 28)
-            self.hs_entry_font  = pygame.font.Font(None, 24)
-            self.input_font     = pygame.font.Font(None, 28)
-            self.prompt_font    = pygame.font.Font(None, 23)
-            self.buff_font      = pygame.font.Font(None, 22)
-            self.hud_font       = pygame.font.Font(None, 28)
-        # Keep old names so legacy call sites (pause, death animation) still work
-        self.game_over_font   = self.title_font
-        self.high_score_font  = self.hs_entry_font
+        self.surface = None
+        if headless:
+            self.window = None
+            self._window_size = (width, height)
+            self.surface = pygame.Surface((width, height))
+            self.scale = 1
+            self.offset = (0, 0)
+            self._present_target = None
+        else:
+            pygame.display.init()   # only the display – font and mixer start lazily in AssetManager
+            if fullscreen:
+                window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            else:
+                window = pygame.display.set_mode(window_size or (width, height), pygame.RESIZABLE)
+            self._configure_window(window)
+            pygame.display.set_caption(caption)
+        # Fonts arrive from the AssetManager via set_fonts(); until then only
+        # draw_loading() may be used
+        self.fonts_ready = False
+        self._message_fonts = {}   # size -> Font for draw_message_at_x_y
         # Ripple wave state for the death screen animation
         self._waves = []      # list of [cx, cy, radius]
         self._wave_tick = 0
         # Color-invert buff flag – set each frame by Game.draw()
         self.invert_mode = False
+        # Hard-edged darkness mask used when C.ALPHA_EFFECTS is off (built on first use)
+        self._dark_mask = None
+        self._dark_mask_radius = None
+        self._frame = None        # NumPy buffer behind a headless canvas, once pixels() asked for it
+        self._gray_levels = None
+
+    # ------------------------------------------------------------------ presentation
+    def _configure_window(self, window):
+        """Recompute scale and letterbox for the current window; called on start-up and resize."""
+        self.window = window
+        self._window_size = ww, wh = window.get_size()
+        scale = min(ww / self.width, wh / self.height)
+        if scale >= 1:
+            scale = int(scale)   # whole-pixel upscale keeps every cell sharp
+        sw, sh = max(1, int(self.width * scale)), max(1, int(self.height * scale))
+        self.scale = scale
+        self.offset = ((ww - sw) // 2, (wh - sh) // 2)
+        # Carry the current frame over to the new canvas: overlays such as pause
+        # draw on top of whatever the canvas holds
+        old = self.surface
+        if (sw, sh) == (ww, wh) == (self.width, self.height):
+            # Window matches the canvas: draw straight into it, no present blit at all
+            self.surface = window
+            self._present_target = None
+            if old is not None and old is not window:
+                window.blit(old, (0, 0))
+            return
+        if old is None or old is window:
+            self.surface = pygame.Surface((self.width, self.height)).convert()
+            if old is not None:
+                self.surface.blit(old, (0, 0))
+        window.fill((0, 0, 0))   # letterbox bars are drawn once, not per frame
+        self._present_target = window.subsurface(pygame.Rect(self.offset, (sw, sh)))
+
+    def to_logical(self, pos):
+        """Map a window pixel (e.g. event.pos) to canvas coordinates."""
+        return (int((pos[0] - self.offset[0]) / self.scale),
+                int((pos[1] - self.offset[1]) / self.scale))
+
+    def mouse_pos(self):
+        """Current mouse position in canvas coordinates."""
+        return self.to_logical(pygame.mouse.get_pos())
+
+    # ------------------------------------------------------------------ fonts / loading
+    def set_fonts(self, assets):
+        """Take the preloaded fonts from an AssetManager (attribute per C.FONTS key)."""
+        for name, spec in C.FONTS.items():
+            if spec[4]:
+                setattr(self, name, assets.font(name))
+        # Keep old names so legacy call sites (pause, death animation) still work
+        self.game_over_font   = self.title_font
+        self.high_score_font  = self.hs_entry_font
+        self.fonts_ready = True
+
+    def draw_loading(self, progress):
+        """Minimal first frame shown while assets load: a text-free progress bar."""
+        self.surface.fill(C.BACKGROUND_COLOR)
+        bar = pygame.Rect(C.SCREEN_WIDTH // 4, C.SCREEN_HEIGHT // 2 - 6, C.SCREEN_WIDTH // 2, 12)
+        pygame.draw.rect(self.surface, C.PANEL_BORDER_COLOR, bar, 1)
+        fill = bar.inflate(-4, -4)
+        fill.width = int(fill.width * max(0.0, min(1.0, progress)))
+        if fill.width:
+            pygame.draw.rect(self.surface, C.LOADING_BAR_COLOR, fill)
 
     # ------------------------------------------------------------------ helpers
     def _alpha_surface(self, w, h, color_rgba):
@@ -72,6 +141,42 @@ class Screen:
         s = self._alpha_surface(rect.width + pad_x * 2, rect.height + pad_y * 2, (0, 0, 0, 160))
         self.surface.blit(s, (rect.x - pad_x, rect.y - pad_y))
 
+    # ------------------------------------------------------------------ observations
+    def pixels(self):
+        """The headless canvas as a live (height, width, 3) uint8 RGB array.
+
+        The first call moves the canvas onto a NumPy buffer (pygame.image.frombuffer),
+        so the array *is* the surface's memory: every later draw shows up in it with
+        no copy and no surface lock – unlike surfarray.pixels3d(), whose view keeps
+        the surface locked and would make the next blit fail."""
+        if self.window is not None:
+            raise RuntimeError('Screen.pixels() needs a headless Screen')
+        if self._frame is None:
+            import numpy as np
+            self._frame = np.zeros((self.height, self.width, 4), np.uint8)
+            canvas = pygame.image.frombuffer(self._frame, (self.width, self.height), 'RGBX')
+            canvas.blit(self.surface, (0, 0))
+            self.surface = canvas
+        return self._frame[:, :, :3]
+
+    def gray_cells(self, planes, scale=1, out=None):
+        """Greyscale frame straight from occupancy planes (occupancy.CHANNELS order):
+        one pixel per board cell (scale x scale with scale > 1), shaded by
+        C.GRAY_CELL_LEVELS.  Nothing is drawn – no HUD, particles, darkness or
+        pygame at all – so it costs a few array operations per frame."""
+        import numpy as np
+        from occupancy import CHANNELS
+        if self._gray_levels is None:
+            levels = [C.GRAY_CELL_LEVELS[name] for name in CHANNELS]
+            self._gray_levels = np.array(levels, np.uint8)[:, None, None]
+        cells = np.where(planes > 0, self._gray_levels, 0).max(axis=0)
+        if scale > 1:
+            cells = cells.repeat(scale, axis=0).repeat(scale, axis=1)
+        if out is None:
+            return cells
+        out[...] = cells
+        return out
+
     # ------------------------------------------------------------------ gameplay HUD
     def clear(self):
         if self.invert_mode:
@@ -85,8 +190,8 @@ class Screen:
         for y in range(0, C.SCREEN_HEIGHT, C.GRID_SIZE):
             pygame.draw.line(self.surface, grid_color, (0, y), (C.SCREEN_WIDTH, y))
 
-    def draw_element(self, element):
-        element.draw(self.surface)
+    def draw_element(self, element, camera=None):
+        element.draw(self.surface, camera)
 
     def draw_score_and_level(self, score, level, combo=0, combo_timer=0):
         """Score + level on a single semi-transparent HUD bar.
@@ -136,6 +241,9 @@ class Screen:
 
     def apply_darkness(self, head_pixel_pos):
         """Overlay a fully-opaque dark mask with a soft-edged circle of light around head_pixel_pos."""
+        if not C.ALPHA_EFFECTS:
+            self._apply_hard_darkness(head_pixel_pos)
+            return
         mask = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         mask.fill((0, 0, 12, 255))   # completely opaque everywhere outside the lit circle
         cx, cy = head_pixel_pos
@@ -145,6 +253,31 @@ class Screen:
             pygame.draw.circle(mask, (0, 0, 12, alpha), (cx, cy), r + extra)
         self.surface.blit(mask, (0, 0))
 
+    def _apply_hard_darkness(self, head_pixel_pos):
+        """Cheap darkness for reduced quality: a cached colorkeyed mask with a hard-edged hole."""
+        r = C.DARKNESS_RADIUS
+        if self._dark_mask is None or self._dark_mask_radius != r:
+            # Twice the screen size, so the hole can be centred anywhere with a single blit
+            size = (self.width * 2, self.height * 2)
+            self._dark_mask = pygame.Surface(size, 0, self.surface)   # canvas pixel format, no convert()
+            self._dark_mask.fill((0, 0, 12))
+            pygame.draw.circle(self._dark_mask, (255, 0, 255), (self.width, self.height), r)
+            self._dark_mask.set_colorkey((255, 0, 255))
+            self._dark_mask_radius = r
+        cx, cy = head_pixel_pos
+        self.surface.blit(self._dark_mask, (cx - self.width, cy - self.height))
+
+    def draw_debug_overlay(self, lines):
+        """F3 debug text in the bottom-left corner on a translucent panel."""
+        font = self.debug_font
+        line_h = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 12
+        height = line_h * len(lines) + 8
+        top = self.height - height - 4
+        self.surface.blit(self._alpha_surface(width, height, (0, 0, 0, 170)), (4, top))
+        for i, line in enumerate(lines):
+            self.surface.blit(font.render(line, True, C.DEBUG_OVERLAY_COLOR), (10, top + 4 + i * line_h))
+
     def draw_buffs(self, active_buffs):
         """Active buff pills in the top-right corner with a coloured background."""
         if not active_buffs:
@@ -270,31 +403,33 @@ class Screen:
         self.surface.blit(prompt_surf, prompt_surf.get_rect(center=C.INPUT_PROMPT_POS))
 
         # Box background
-        box_fill = self._alpha_surface(C.INPUT_BOX_RECT.width, C.INPUT_BOX_RECT.height,
-                                       (20, 20, 20, 220))
-        self.surface.blit(box_fill, C.INPUT_BOX_RECT)
+        box = pygame.Rect(C.INPUT_BOX_RECT)
+        box_fill = self._alpha_surface(box.width, box.height, (20, 20, 20, 220))
+        self.surface.blit(box_fill, box)
 
         # Border – accent colour when active
         border_color = (100, 160, 255) if active else (80, 80, 80)
-        pygame.draw.rect(self.surface, border_color, C.INPUT_BOX_RECT, 2)
+        pygame.draw.rect(self.surface, border_color, box, 2)
 
         # Typed text
-        text_x = C.INPUT_BOX_RECT.x + 8
+        text_x = box.x + 8
         text_surf = self.input_font.render(current_text, True, C.TEXT_COLOR)
         self.surface.blit(text_surf,
-                          text_surf.get_rect(midleft=(text_x, C.INPUT_BOX_RECT.centery)))
+                          text_surf.get_rect(midleft=(text_x, box.centery)))
 
-        # Blinking cursor – visible for the first half of every 500 ms blink cycle
-        if active and (pygame.time.get_ticks() // 500) % 2 == 0:
+        # Blinking cursor – toggles every CURSOR_BLINK_MS
+        if active and (pygame.time.get_ticks() // C.CURSOR_BLINK_MS) % 2 == 0:
             cursor_x = text_x + text_surf.get_width() + 2
             cursor_h = self.input_font.get_height() - 4
-            cursor_y = C.INPUT_BOX_RECT.centery - cursor_h // 2
+            cursor_y = box.centery - cursor_h // 2
             pygame.draw.rect(self.surface, C.TEXT_COLOR,
                              pygame.Rect(cursor_x, cursor_y, 2, cursor_h))
 
     # ------------------------------------------------------------------ misc text
     def draw_message_at_x_y(self, message, x, y, size):
-        font = pygame.font.SysFont('Arial', size)
+        font = self._message_fonts.get(size)
+        if font is None:
+            font = self._message_fonts[size] = pygame.font.SysFont('Arial', size)
         surf = font.render(message, True, C.TEXT_COLOR)
         self.surface.blit(surf, surf.get_rect(center=(x, y)))
 
@@ -358,7 +493,7 @@ class Screen:
         # Pulsing buttons
         pulse = int(160 + 80 * math.sin(tick * 0.18))
         btn_w, btn_h, gap = 154, 34, 16
-        mouse = pygame.mouse.get_pos()
+        mouse = self.mouse_pos()
 
         # ESC – Yes, quit
         qr     = pygame.Rect(cx - gap // 2 - btn_w, cy + 4, btn_w, btn_h)
@@ -380,6 +515,44 @@ class Screen:
 
         return qr, sr  # (quit_rect, resume_rect)
 
+    def draw_resume_prompt(self, tick, level, score):
+        """Overlay offering to continue an autosaved run. Returns (resume_rect, new_game_rect)."""
+        cx, cy = C.SCREEN_WIDTH // 2, C.SCREEN_HEIGHT // 2
+
+        self.draw_overlay(alpha=160)
+
+        panel = pygame.Rect(cx - 178, cy - 84, 356, 168)
+        self._panel(panel, (10, 10, 28, 240), C.PANEL_BORDER_COLOR)
+
+        self._shadow_text(self.score_font, 'Resume last run?', C.GAMEOVER_SCORE_COLOR, (cx, cy - 54))
+        info = self.prompt_font.render(f'Level {level}   \u2022   Score {score}', True, C.TEXT_DIM_COLOR)
+        self.surface.blit(info, info.get_rect(center=(cx, cy - 20)))
+
+        # Pulsing buttons
+        pulse = int(160 + 80 * math.sin(tick * 0.18))
+        btn_w, btn_h, gap = 154, 34, 16
+        mouse = self.mouse_pos()
+
+        # ENTER – Resume
+        rr     = pygame.Rect(cx - gap // 2 - btn_w, cy + 18, btn_w, btn_h)
+        rr_hot = rr.collidepoint(mouse)
+        self._panel(rr, (0, 55, 0, 240) if rr_hot else (0, 30, 0, 220))
+        pygame.draw.rect(self.surface, (0, 255, 0) if rr_hot else (0, pulse, 0), rr, 2)
+        rs = self.prompt_font.render('ENTER   Resume', True,
+                                     (160, 255, 160) if rr_hot else (80, pulse, 80))
+        self.surface.blit(rs, rs.get_rect(center=rr.center))
+
+        # ESC – New game
+        nr     = pygame.Rect(cx + gap // 2, cy + 18, btn_w, btn_h)
+        nr_hot = nr.collidepoint(mouse)
+        self._panel(nr, (70, 0, 0, 240) if nr_hot else (30, 0, 0, 220))
+        pygame.draw.rect(self.surface, (220, 0, 0) if nr_hot else (pulse // 2, 0, 0), nr, 2)
+        ns = self.prompt_font.render('ESC   New Game', True,
+                                     (255, 100, 100) if nr_hot else (pulse // 2 + 60, 60, 60))
+        self.surface.blit(ns, ns.get_rect(center=nr.center))
+
+        return rr, nr  # (resume_rect, new_game_rect)
+
     def draw_bottom_message(self, message, size):
         font = pygame.font.SysFont('Arial', size)
         surf = font.render(message, True, C.PROMPT_COLOR)
@@ -497,7 +670,7 @@ class Screen:
         cy    = 512
         btn_h = 36
         btn_w = 170
-        mouse = pygame.mouse.get_pos()
+        mouse = self.mouse_pos()
 
         # ENTER – Restart
         er      = pygame.Rect(C.SCREEN_WIDTH // 2 - btn_w - 16, cy - btn_h // 2, btn_w, btn_h)
@@ -604,4 +777,11 @@ class Screen:
         self.surface.blit(hint, hint.get_rect(center=(cx, 400)))
 
     def update(self):
+        if self.window is None:
+            return   # headless: nothing to present
+        window = pygame.display.get_surface()
+        if window is not self.window or window.get_size() != self._window_size:
+            self._configure_window(window)   # window was resized (VIDEORESIZE)
+        if self._present_target is not None:
+            pygame.transform.scale(self.surface, self._present_target.get_size(), self._present_target)
         pygame.display.update()
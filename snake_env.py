@@ -0,0 +1,125 @@
+"""
+Gym-style environment around a headless Game, for external agents.
+
+    env = SnakeEnv(seed=1)
+    obs, info = env.reset()
+    while True:
+        obs, reward, terminated, truncated, info = env.step(action)   # 0 up, 1 down, 2 left, 3 right
+        if terminated or truncated:
+            obs, info = env.reset()
+
+The call signatures follow the Gymnasium API without depending on it.  An
+observation is a dict:
+
+  grid      (len(occupancy.CHANNELS), H, W) uint8 – body, head, apple, magic
+            apple, static, orthogonal, diagonal, seeker, door.  A read-only
+            view of the game's OccupancyGrid, which Game.step() updates in
+            place: the same array every step, never rebuilt or copied.
+  scalars   float32 vector in SCALARS order: ticks (charges for the shield,
+            moves for manual control) left on each buff, then the combo count,
+            combo timer, level and tick speed.  Also updated in place.
+  pixels    only with pixels='rgb': the rendered 600x600 frame as a live
+            (height, width, 3) uint8 view of the offscreen canvas
+            (Screen.pixels()); with pixels='gray': a (H, W) – or scaled by
+            gray_scale – greyscale cell image from Screen.gray_cells(), which
+            skips rendering, HUD and particles entirely.
+
+Copy what has to outlive the next step.  The reward is the score
+gained during the step.  Actions None or -1 keep the current heading.
+"""
+
+import os
+import random
+
+import numpy as np
+
+import constants as C
+from occupancy import OccupancyGrid
+
+ACTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))   # up, down, left, right
+BUFFS = tuple(k for k in C.MAGIC_APPLE_TYPES if k not in ('shrink', 'spawn_enemies'))   # instant effects
+SCALARS = BUFFS + ('combo', 'combo_timer', 'level', 'game_speed')
+
+
+class SnakeEnv:
+    """reset()/step() wrapper around Game(headless=True)."""
+
+    def __init__(self, start_level=1, seed=None, max_steps=None, pixels=None, gray_scale=1):
+        if C.ENDLESS_WORLD:
+            raise ValueError('SnakeEnv needs a bounded board, not the endless world')
+        if pixels not in (None, 'rgb', 'gray'):
+            raise ValueError(f"pixels must be None, 'rgb' or 'gray', not {pixels!r}")
+        os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+        from game import Game   # imported late: pygame is only needed once an env is made
+        # frame_budget_ms=0: the quality governor must not change what rendered frames look like
+        self.game = Game(start_level=start_level, seed=seed, autosave=False, headless=True,
+                         frame_budget_ms=0)
+        self.game.occupancy = OccupancyGrid()
+        self.max_steps = max_steps   # steps before an episode is truncated (None = never)
+        self.steps = 0
+        self.pixels = pixels
+        self.scalars = np.zeros(len(SCALARS), np.float32)
+        self.observation = {'grid': self.game.occupancy.view, 'scalars': self.scalars}
+        if pixels == 'rgb':
+            self.observation['pixels'] = self.game.screen.pixels()
+        elif pixels == 'gray':
+            self.gray_scale = gray_scale
+            self.observation['pixels'] = np.zeros(
+                (C.GRID_HEIGHT * gray_scale, C.GRID_WIDTH * gray_scale), np.uint8)
+
+    def reset(self, seed=None):
+        """Start a new episode; returns (obs, info)."""
+        game = self.game
+        if seed is not None:
+            random.seed(seed)
+            game.seed = seed
+        game.reset()
+        game.occupancy.sync(game)
+        self.steps = 0
+        self._update_scalars()
+        if self.pixels == 'rgb':
+            game.draw()
+        self._update_gray()
+        return self.observation, self._info()
+
+    def step(self, action):
+        """Advance one tick; returns (obs, reward, terminated, truncated, info)."""
+        game = self.game
+        if not game.running:
+            raise RuntimeError('SnakeEnv.step() after the episode ended; call reset() first')
+        if action is not None and action >= 0:
+            game.steer(ACTIONS[action])
+        before = game.score
+        running = game.step(render=self.pixels == 'rgb')
+        self.steps += 1
+        self._update_scalars()
+        self._update_gray()
+        truncated = running and self.max_steps is not None and self.steps >= self.max_steps
+        return self.observation, game.score - before, not running, truncated, self._info()
+
+    def _update_gray(self):
+        if self.pixels == 'gray':
+            self.game.screen.gray_cells(self.game.occupancy.planes, self.gray_scale,
+                                        out=self.observation['pixels'])
+
+    def _update_scalars(self):
+        game = self.game
+        values = self.scalars
+        buffs = game.active_buffs
+        for i, key in enumerate(BUFFS):
+            values[i] = buffs.get(key, 0)
+        n = len(BUFFS)
+        values[n] = game.combo_count
+        values[n + 1] = game.combo_timer
+        values[n + 2] = game.level
+        values[n + 3] = game.game_speed
+
+    def _info(self):
+        game = self.game
+        return {
+            'score': game.score,
+            'apples': game.apples_eaten,
+            'level': game.level,
+            'length': len(game.snake.positions),
+            'ticks': game.time_alive,
+        }
@@ -0,0 +1,81 @@
+"""
+On-disk cache of sound assets transcoded to the mixer's native PCM format.
+
+mixer.Sound(path) decodes MP3s and resamples WAVs on every launch.  The first
+time a file is loaded its decoded samples (Sound.get_raw()) are written to
+PCM_CACHE_DIR; later launches mmap that file and build the Sound straight from
+the buffer, skipping decoding and resampling.
+
+Cache files are named after the SHA-1 of the source file plus the mixer
+settings (frequency, sample format, channels), so editing a sound or changing
+the mixer configuration simply misses the cache.  Pre-populate it with
+
+    python sound_cache.py
+"""
+
+import hashlib
+import mmap
+import os
+
+import pygame
+from pygame import mixer
+
+import constants as C
+
+# Lookups since start-up, for the metrics endpoint
+stats = {'hits': 0, 'misses': 0}
+
+
+def _cache_path(path, mixer_format):
+    with open(path, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    freq, size, channels = mixer_format
+    return os.path.join(C.PCM_CACHE_DIR, f'{digest}_{freq}_{size}_{channels}.pcm')
+
+
+def load_sound(path):
+    """mixer.Sound for `path`, served from the PCM cache when possible.
+    Raises pygame.error like mixer.Sound() if the source cannot be decoded."""
+    mixer_format = mixer.get_init()
+    if mixer_format is None:
+        return mixer.Sound(path)   # no mixer settings to key on – nothing to cache
+    cached = _cache_path(path, mixer_format)
+    try:
+        with open(cached, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            sound = mixer.Sound(buffer=data)   # copies the samples; the map can close
+        stats['hits'] += 1
+        return sound
+    except (OSError, ValueError):
+        pass   # cache miss (ValueError: empty file cannot be mapped)
+    stats['misses'] += 1
+    sound = mixer.Sound(path)
+    _store(cached, sound.get_raw())
+    return sound
+
+
+def _store(cached, raw):
+    tmp = cached + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        with open(tmp, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp, cached)
+    except OSError as e:
+        print(f"Warning: Could not write PCM cache file ({cached}): {e}")
+
+
+def transcode_all():
+    """Fill the cache for every sound in C.SOUNDS under the current mixer settings."""
+    for key, (path, *_) in C.SOUNDS.items():
+        if path is None:
+            continue
+        try:
+            load_sound(path)
+        except pygame.error as e:
+            print(f"Warning: Could not transcode sound '{key}' ({path}): {e}")
+
+
+if __name__ == '__main__':
+    mixer.init()
+    transcode_all()
+    print(f'PCM cache ready in {C.PCM_CACHE_DIR} for mixer settings {mixer.get_init()}')
@@ -0,0 +1,106 @@
+"""
+Start-up profiling (main.py --profile-startup).
+
+StartupProfiler records named milestones from process start to the first
+interactive frame and, once install() has been called, the time spent
+importing every module afterwards – the same self / cumulative split that
+`python -X importtime` prints, but collected inside the game so it can be
+reported next to the milestones.
+"""
+
+import sys
+import time
+
+
+class _TimedLoader:
+    """Wraps a module loader and times exec_module()."""
+
+    def __init__(self, loader, timer, name):
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        stack = self._timer.stack
+        stack.append(0.0)   # time spent in nested imports
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            total = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += total
+            self._timer.imports.append((self._name, total - nested, total, len(stack)))
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class _ImportTimer:
+    """sys.meta_path hook: resolves specs through the other finders and times their loaders."""
+
+    def __init__(self):
+        self.imports = []   # (module, self seconds, cumulative seconds, nesting depth), in completion order
+        self.stack = []
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self, name)
+        return spec
+
+
+class StartupProfiler:
+    """Milestones and import times from construction to the first frame."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = []       # (label, seconds since start)
+        self._timer = None
+
+    def install(self):
+        """Start timing imports; call before the heavy modules (pygame, game) are imported."""
+        if self._timer is None:
+            self._timer = _ImportTimer()
+            sys.meta_path.insert(0, self._timer)
+
+    def uninstall(self):
+        if self._timer is not None and self._timer in sys.meta_path:
+            sys.meta_path.remove(self._timer)
+
+    def mark(self, label):
+        self.marks.append((label, time.perf_counter() - self.start))
+
+    def elapsed(self, label):
+        """Seconds from start to milestone `label`, or None if it was never reached."""
+        for name, t in self.marks:
+            if name == label:
+                return t
+        return None
+
+    def report(self, top=15):
+        """Milestones plus the slowest imports by self time, as printable lines."""
+        lines = ['startup milestones:']
+        prev = 0.0
+        for label, t in self.marks:
+            lines.append(f'  {label:<24}{t * 1000:9.1f} ms  (+{(t - prev) * 1000:.1f})')
+            prev = t
+        if self._timer is not None and self._timer.imports:
+            imports = self._timer.imports
+            lines.append(f'imports: {len(imports)} modules, '
+                         f'{sum(i[1] for i in imports) * 1000:.1f} ms total')
+            lines.append(f'  {"self ms":>9}{"cumul ms":>10}  module')
+            for name, own, cumulative, _ in sorted(imports, key=lambda i: i[1], reverse=True)[:top]:
+                lines.append(f'  {own * 1000:9.1f}{cumulative * 1000:10.1f}  {name}')
+        return lines
@@ -0,0 +1,65 @@
+"""Snapshot round trips and restore errors: python -m pytest tests"""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import constants as C
+import save_state
+from game import Game
+
+
+def _endless_round_trip(seed):
+    C.set_endless_world(True)
+    try:
+        game = Game(seed=seed, autosave=False, headless=True)
+        for _ in range(60):
+            if not game.step(render=False):
+                break
+        data = save_state.snapshot(game)
+        copy = Game(autosave=False, headless=True)
+        save_state.restore(copy, data)
+        return game, copy
+    finally:
+        C.set_endless_world(False)
+
+
+def test_negative_endless_seed():
+    game, copy = _endless_round_trip(-5)
+    assert copy.world.seed == game.world.seed == -5
+    assert list(copy.snake.positions) == list(game.snake.positions)
+
+
+def test_int64_bounds():
+    for seed in (-2**63, 2**63 - 1):
+        _, copy = _endless_round_trip(seed)
+        assert copy.world.seed == seed
+
+
+def test_board_and_mode_mismatch():
+    game = Game(seed=1, autosave=False, headless=True)
+    data = save_state.snapshot(game)
+    C.set_board_size(C.GRID_WIDTH + 2, C.GRID_HEIGHT)
+    try:
+        with pytest.raises(save_state.SnapshotMismatch):
+            save_state.restore(Game(autosave=False, headless=True), data)
+    finally:
+        C.set_board_size(C.GRID_WIDTH - 2, C.GRID_HEIGHT)
+    _, copy = _endless_round_trip(3)
+    endless = save_state.snapshot(copy)
+    with pytest.raises(save_state.SnapshotMismatch):
+        save_state.restore(Game(autosave=False, headless=True), endless)
+
+
+def test_corrupt_snapshot_is_not_a_mismatch():
+    data = bytearray(save_state.snapshot(Game(seed=1, autosave=False, headless=True)))
+    data[-1] ^= 0xFF
+    with pytest.raises(save_state.SnapshotError) as info:
+        save_state.restore(Game(autosave=False, headless=True), bytes(data))
+    assert not isinstance(info.value, save_state.SnapshotMismatch)
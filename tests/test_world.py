@@ -0,0 +1,33 @@
+"""Endless-world chunk generation: python -m pytest tests"""
+
+import os
+import random
+import sys
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import constants as C
+from game import Game
+
+
+def test_chunks_depend_only_on_the_seed():
+    def chunks(global_seed):
+        C.set_endless_world(True)
+        try:
+            game = Game(seed=11, autosave=False, headless=True)
+            game.obstacles, game.moving_obstacles, game.magic_apples = [], [], []
+            random.seed(global_seed)
+            for cx in range(4, 8):
+                for cy in range(4, 8):
+                    game.world._generate((cx, cy), game)
+            return ([(o.x, o.y, o.dx, o.dy, tuple(o.shape)) for o in game.moving_obstacles],
+                    [(a.x, a.y, a.type, a.lifespan) for a in game.magic_apples])
+        finally:
+            C.set_endless_world(False)
+
+    movers, apples = chunks(1)
+    assert movers and apples
+    assert chunks(2) == (movers, apples)
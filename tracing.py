@@ -0,0 +1,133 @@
+"""
+Opt-in timeline tracing (main.py --trace FILE).
+
+While enabled, spans are recorded into a ring buffer of at most
+C.TRACE_BUFFER_EVENTS events and written on exit in the Chrome trace-event
+JSON format, which chrome://tracing, Perfetto (ui.perfetto.dev) and
+speedscope all open.  Sources:
+
+  * every Game.run() phase and draw layer (fed by perf.FrameProfiler), plus
+    one 'frame' span per loop iteration including the clock.tick() sleep,
+  * level transitions and high-score I/O (@traced), and
+  * font / sound loads on the asset worker thread.
+
+When tracing is off every hook is a single global check, and the ring buffer
+bounds both memory and the cost of writing the file when the game exits.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import constants as C
+
+_tracer = None   # the active Tracer, or None when tracing is off
+
+
+class Tracer:
+    """Ring buffer of complete ('X') trace events."""
+
+    def __init__(self, capacity=None):
+        self.events = deque(maxlen=capacity or C.TRACE_BUFFER_EVENTS)
+        self.dropped = 0
+        self.threads = {}           # thread ident -> thread name
+        self._origin = time.perf_counter()
+
+    def complete(self, name, cat, start, end, args=None):
+        """Record a span between two perf_counter() values."""
+        tid = threading.get_ident()
+        if tid not in self.threads:
+            self.threads[tid] = threading.current_thread().name
+        if len(self.events) == self.events.maxlen:
+            self.dropped += 1
+        self.events.append((name, cat, start, end, tid, args))
+
+    def to_json(self):
+        pid = os.getpid()
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                  for tid, name in self.threads.items()]
+        origin = self._origin
+        for name, cat, start, end, tid, args in self.events:
+            event = {'name': name, 'cat': cat, 'ph': 'X', 'pid': pid, 'tid': tid,
+                     'ts': round((start - origin) * 1e6, 1), 'dur': round((end - start) * 1e6, 1)}
+            if args:
+                event['args'] = args
+            events.append(event)
+        return {'traceEvents': events, 'displayTimeUnit': 'ms',
+                'otherData': {'dropped_events': self.dropped}}
+
+    def write(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_json(), f)
+
+
+def enable(capacity=None):
+    """Start recording (replaces any running tracer)."""
+    global _tracer
+    _tracer = Tracer(capacity)
+    return _tracer
+
+
+def disable():
+    global _tracer
+    _tracer = None
+
+
+def enabled():
+    return _tracer is not None
+
+
+def write(path):
+    """Write the recorded events to `path`; returns the number written (0 when tracing is off)."""
+    if _tracer is None:
+        return 0
+    try:
+        _tracer.write(path)
+    except OSError as e:
+        print(f"Warning: could not write trace file {path}: {e}")
+        return 0
+    return len(_tracer.events)
+
+
+def complete(name, cat, start, end=None, args=None):
+    """Record a span that started at perf_counter() value `start` (ends now by default)."""
+    if _tracer is not None:
+        _tracer.complete(name, cat, start, time.perf_counter() if end is None else end, args)
+
+
+class span:
+    """Context manager form: `with tracing.span('reset', 'level'): ...`."""
+    __slots__ = ('name', 'cat', 'start')
+
+    def __init__(self, name, cat='game'):
+        self.name = name
+        self.cat = cat
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        complete(self.name, self.cat, self.start)
+        return False
+
+
+def traced(name=None, cat='game'):
+    """Decorator recording a span around every call of the function."""
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                complete(label, cat, start)
+        return wrapper
+    return decorate
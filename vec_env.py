@@ -0,0 +1,554 @@
+"""
+Batched snake engine: N independent games held in NumPy arrays and advanced in
+lockstep, one step() call per tick for the whole batch.
+
+    engine = BatchedSnakeEngine(4096, seed=1)
+    reward, done = engine.step(actions)    # actions: (N,) 0 up, 1 down, 2 left, 3 right, -1 keep
+
+State, indexed by game along the first axis:
+
+  body, head, count, length    snake as a ring buffer of cells, body[head] is the head
+  occ                          (N, H, W) snake segments per cell
+  static                       (N, H, W) static obstacle cells
+  mover_pos, mover_vel         (N, VEC_MAX_MOVERS, 2) moving obstacles in cells / cells per tick
+  mover_kind, mover_shape      index into OBSTACLE_KINDS (0 = free slot) and C.OBSTACLE_SHAPES
+  apple, magic, magic_kind     magic_kind is an index into C.MAGIC_APPLE_TYPES, -1 = none
+  buffs                        (N, len(BUFFS)) ticks left, charges for the shield
+
+A tick follows Game.update_game_state, _update_mechanics_and_objects and
+check_collisions: turn, move (self and wall deaths), buff and combo timers,
+obstacle motion bouncing off the body and static blocks, magic apple expiry,
+then apple, magic apple, static and moving obstacle collisions with shield
+charges and hit cooldowns.  Levels advance in place on the apple thresholds
+like in the endless world – there is no door and nothing is cleared.
+
+Simplified against Game:
+  * at most one magic apple at a time; tick speed, manual control, colour
+    invert and darkness apples only score (they change pacing or drawing)
+  * seekers don't push each other apart
+  * one static-obstacle hit cooldown per game instead of one per obstacle
+"""
+
+import numpy as np
+
+import constants as C
+
+DIRECTIONS = np.array([(0, -1), (0, 1), (-1, 0), (1, 0)], np.int64)   # up, down, left, right
+OBSTACLE_KINDS = ('static', 'orthogonal', 'diagonal', 'seeker')
+STATIC, ORTHOGONAL, DIAGONAL, SEEKER = range(4)
+BUFFS = ('ghost_mode', 'no_grow', 'double_score', 'freeze_obstacles', 'shield')
+GHOST, NO_GROW, DOUBLE, FREEZE, SHIELD = range(len(BUFFS))   # SHIELD last: all before it are timed
+
+MAGIC_INDEX = {name: i for i, name in enumerate(C.MAGIC_APPLE_TYPES)}
+# magic apple -> (buffs column, value it sets)
+MAGIC_BUFFS = [
+    (MAGIC_INDEX['ghost_mode'],       GHOST,   C.BUFF_DURATION_GHOST),
+    (MAGIC_INDEX['no_grow'],          NO_GROW, C.BUFF_DURATION_NO_GROW),
+    (MAGIC_INDEX['double_score'],     DOUBLE,  C.BUFF_DURATION_DOUBLE_SCORE),
+    (MAGIC_INDEX['freeze_obstacles'], FREEZE,  C.BUFF_DURATION_FREEZE),
+    (MAGIC_INDEX['shield'],           SHIELD,  C.SHIELD_HITS),
+]
+# freeze_obstacles with nothing to freeze grants one of these instead (magic_apple_logic)
+FREEZE_FALLBACK = np.array([MAGIC_INDEX[k] for k in
+                            ('ghost_mode', 'no_grow', 'double_score', 'shield', 'decrease_tick_speed')])
+
+THRESHOLDS = np.array([C.LEVEL_2_APPLES, C.LEVEL_3_APPLES, C.LEVEL_4_APPLES, C.LEVEL_5_APPLES])
+
+# C.OBSTACLE_SHAPES padded to a fixed cell count; SHAPE_USED masks the padding
+SHAPE_CELLS = max(len(s) for s in C.OBSTACLE_SHAPES)
+SHAPE_OFFSETS = np.zeros((len(C.OBSTACLE_SHAPES), SHAPE_CELLS, 2), np.int64)
+SHAPE_USED = np.zeros((len(C.OBSTACLE_SHAPES), SHAPE_CELLS), bool)
+for _i, _shape in enumerate(C.OBSTACLE_SHAPES):
+    SHAPE_OFFSETS[_i, :len(_shape)] = _shape
+    SHAPE_USED[_i, :len(_shape)] = True
+SHAPE_P = np.array(C.OBSTACLE_SHAPE_WEIGHTS, float) / sum(C.OBSTACLE_SHAPE_WEIGHTS)
+SINGLE = C.OBSTACLE_SHAPES.index([(0, 0)])
+
+
+class BatchedSnakeEngine:
+    """N snake games stepped together; see the module docstring for the array layout."""
+
+    def __init__(self, n, width=None, height=None, start_level=1, seed=None, autoreset=True):
+        self.n = n
+        self.width = width or C.GRID_WIDTH
+        self.height = height or C.GRID_HEIGHT
+        self.start_level = start_level
+        self.autoreset = autoreset
+        self.rng = np.random.default_rng(seed)
+        w, h, m = self.width, self.height, C.VEC_MAX_MOVERS
+        self.cap = w * h + 1   # ring size; a ghost snake can overlap itself, so length is capped too
+
+        self.body = np.zeros((n, self.cap, 2), np.int16)
+        self.head = np.zeros(n, np.int64)
+        self.count = np.zeros(n, np.int64)       # segments on the board (len(Snake.positions))
+        self.length = np.zeros(n, np.int64)      # target length (Snake.length)
+        self.direction = np.zeros((n, 2), np.int64)
+        self.occ = np.zeros((n, h, w), np.uint8)
+        self.static = np.zeros((n, h, w), bool)
+        self._occ = self.occ.reshape(n, -1)      # per-game views indexed by y * width + x
+        self._static = self.static.reshape(n, -1)
+        self._flat_occ = self.occ.reshape(-1)    # whole-batch views: game * width * height + cell
+        self._flat_static = self.static.reshape(-1)
+
+        self.mover_pos = np.zeros((n, m, 2))
+        self.mover_vel = np.zeros((n, m, 2))
+        self.mover_kind = np.zeros((n, m), np.int8)
+        self.mover_shape = np.zeros((n, m), np.int8)
+        self.mover_cooldown = np.zeros((n, m), np.int16)
+        self.static_cooldown = np.zeros(n, np.int16)
+        self._mover_pos = self.mover_pos.reshape(-1, 2)   # indexed by game * VEC_MAX_MOVERS + slot
+        self._mover_vel = self.mover_vel.reshape(-1, 2)
+        self._mover_kind = self.mover_kind.reshape(-1)
+        self._mover_shape = self.mover_shape.reshape(-1)
+
+        self.apple = np.zeros((n, 2), np.int64)
+        self.magic = np.zeros((n, 2), np.int64)
+        self.magic_kind = np.full(n, -1, np.int8)
+        self.magic_life = np.zeros(n)
+        self.buffs = np.zeros((n, len(BUFFS)), np.int32)
+
+        self.score = np.zeros(n, np.int64)
+        self.apples = np.zeros(n, np.int64)
+        self.magic_eaten = np.zeros(n, np.int64)
+        self.level = np.zeros(n, np.int64)
+        self.combo = np.zeros(n, np.int64)
+        self.combo_timer = np.zeros(n, np.int64)
+        self.ticks = np.zeros(n, np.int64)
+        self.done = np.zeros(n, bool)
+        self.final_score = np.zeros(n, np.int64)   # score of the last finished game in each slot
+        self.episodes = 0                          # finished games over the engine's lifetime
+        self.reset()
+
+    # ------------------------------------------------------------ queries
+    def _heads(self, rows):
+        cells = self.body[rows, self.head[rows]]
+        return cells[:, 0].astype(np.int64), cells[:, 1].astype(np.int64)
+
+    def heads(self):
+        """(N, 2) head cells."""
+        return self.body[np.arange(self.n), self.head].astype(np.int64)
+
+    def positions(self, i):
+        """Snake cells of game i, head first (like Snake.positions)."""
+        idx = (self.head[i] - np.arange(self.count[i])) % self.cap
+        return [tuple(int(v) for v in cell) for cell in self.body[i, idx]]
+
+    # ------------------------------------------------------------ reset
+    def reset(self, rows=None):
+        """Start fresh games in `rows` (all by default)."""
+        rows = np.arange(self.n) if rows is None else np.asarray(rows, np.int64)
+        if not len(rows):
+            return
+        w, h = self.width, self.height
+        length = C.SNAKE_START_LENGTH
+        sx, sy = w // 2, h // 2
+        i = np.arange(length)
+        xs, ys = np.full(length, sx), (sy - i) % h
+
+        self.occ[rows] = 0
+        self.static[rows] = False
+        self.body[rows[:, None], length - 1 - i] = np.stack([xs, ys], axis=1)
+        self._occ[rows[:, None], ys * w + xs] = 1
+        self.head[rows] = length - 1
+        self.count[rows] = length
+        self.length[rows] = length
+        self.direction[rows] = C.SNAKE_START_DIR
+
+        self.mover_kind[rows] = 0
+        self.mover_vel[rows] = 0
+        self.mover_cooldown[rows] = 0
+        self.static_cooldown[rows] = 0
+        self.magic_kind[rows] = -1
+        self.buffs[rows] = 0
+
+        self.score[rows] = 0
+        self.apples[rows] = THRESHOLDS[self.start_level - 2] if self.start_level > 1 else 0
+        self.magic_eaten[rows] = 0
+        self.level[rows] = self.start_level
+        self.combo[rows] = 0
+        self.combo_timer[rows] = 0
+        self.ticks[rows] = 0
+        self.done[rows] = False
+        self._place_apples(rows)
+
+    # ------------------------------------------------------------ spawning
+    def _free(self, rows, x, y, shape, min_dist):
+        """Whether every cell of `shape` anchored at (x, y) is on the board, clear of
+        snake, obstacles and apples, and at least min_dist (Manhattan) from the head."""
+        w, h = self.width, self.height
+        hx, hy = self._heads(rows)
+        ok = np.ones(len(rows), bool)
+        g, s = np.nonzero(self.mover_kind[rows] > 0)
+        mover_cells = None
+        if len(g):
+            # cells covered by moving obstacles, as (row in `rows`, cell) keys
+            keys = []
+            f = rows[g] * C.VEC_MAX_MOVERS + s
+            base = np.floor(self._mover_pos[f]).astype(np.int64)
+            shp = self._mover_shape[f]
+            for j in range(SHAPE_CELLS):
+                used = SHAPE_USED[shp, j]
+                cx = (base[used, 0] + SHAPE_OFFSETS[shp[used], j, 0]) % w
+                cy = (base[used, 1] + SHAPE_OFFSETS[shp[used], j, 1]) % h
+                keys.append(g[used] * (w * h) + cy * w + cx)
+            mover_cells = np.concatenate(keys)
+        magic = self.magic_kind[rows] >= 0
+        for j in range(SHAPE_CELLS):
+            px = x + SHAPE_OFFSETS[shape, j, 0]
+            py = y + SHAPE_OFFSETS[shape, j, 1]
+            inside = (px < w) & (py < h)
+            cell = np.where(inside, py * w + px, 0)
+            free = (inside & (self._occ[rows, cell] == 0) & ~self._static[rows, cell]
+                    & ~((px == self.apple[rows, 0]) & (py == self.apple[rows, 1]))
+                    & ~(magic & (px == self.magic[rows, 0]) & (py == self.magic[rows, 1]))
+                    & (np.abs(px - hx) + np.abs(py - hy) >= min_dist))
+            if mover_cells is not None:
+                free &= ~np.isin(np.arange(len(rows)) * (w * h) + cell, mover_cells)
+            ok &= ~SHAPE_USED[shape, j] | free
+        return ok
+
+    def _sample(self, rows, shape, min_dist):
+        """Random free anchors for `shape` in each game of `rows` (see _free).
+        Returns x, y and a mask of the games where one was found."""
+        k = len(rows)
+        x = np.zeros(k, np.int64)
+        y = np.zeros(k, np.int64)
+        found = np.zeros(k, bool)
+        pending = np.arange(k)
+        for _ in range(C.VEC_SPAWN_TRIES):
+            cx = self.rng.integers(0, self.width, len(pending))
+            cy = self.rng.integers(0, self.height, len(pending))
+            ok = self._free(rows[pending], cx, cy, shape[pending], min_dist)
+            hit = pending[ok]
+            x[hit], y[hit] = cx[ok], cy[ok]
+            found[hit] = True
+            pending = pending[~ok]
+            if not len(pending):
+                break
+        return x, y, found
+
+    def _place_apples(self, rows):
+        """Move the apple of each game in `rows` to a free cell (Apple.respawn)."""
+        if not len(rows):
+            return
+        w = self.width
+        x, y, found = self._sample(rows, np.full(len(rows), SINGLE), 0)
+        self.apple[rows[found], 0] = x[found]
+        self.apple[rows[found], 1] = y[found]
+        for g in rows[~found]:
+            # crowded board: pick uniformly among the free cells instead of sampling blindly
+            cells = np.arange(w * self.height)
+            free = cells[self._free(np.full(len(cells), g), cells % w, cells // w,
+                                    np.full(len(cells), SINGLE), 0)]
+            if len(free):
+                cell = self.rng.choice(free)
+                self.apple[g] = (cell % w, cell // w)
+
+    def _spawn_magic(self, rows):
+        if not len(rows):
+            return
+        x, y, found = self._sample(rows, np.full(len(rows), SINGLE), C.MIN_OBSTACLE_SPAWN_DISTANCE)
+        rows = rows[found]
+        self.magic[rows, 0] = x[found]
+        self.magic[rows, 1] = y[found]
+        self.magic_kind[rows] = self.rng.integers(0, len(C.MAGIC_APPLE_TYPES), len(rows))
+        self.magic_life[rows] = C.MAGIC_APPLE_LIFESPAN * (1 + self.rng.uniform(-0.5, 0.5, len(rows)))
+
+    def _spawn_obstacles(self, rows, kinds):
+        """Add one obstacle of kinds[i] (index into OBSTACLE_KINDS) to game rows[i].
+        `rows` must not repeat.  Games whose board or mover slots are full get none."""
+        if not len(rows):
+            return
+        w = self.width
+        shaped = (kinds == STATIC) | (kinds == ORTHOGONAL)
+        shape = np.where(shaped, self.rng.choice(len(SHAPE_P), len(rows), p=SHAPE_P), SINGLE)
+        x, y, found = self._sample(rows, shape, C.MIN_OBSTACLE_SPAWN_DISTANCE)
+
+        put = found & (kinds == STATIC)
+        for j in range(SHAPE_CELLS):
+            u = put & SHAPE_USED[shape, j]
+            cx = x[u] + SHAPE_OFFSETS[shape[u], j, 0]
+            cy = y[u] + SHAPE_OFFSETS[shape[u], j, 1]
+            self._static[rows[u], cy * w + cx] = True
+
+        new = np.flatnonzero(found & (kinds != STATIC))
+        free = self.mover_kind[rows[new]] == 0
+        new = new[free.any(axis=1)]
+        if not len(new):
+            return
+        r = rows[new]
+        slot = np.argmax(self.mover_kind[r] == 0, axis=1)
+        kind = kinds[new]
+        self.mover_kind[r, slot] = kind
+        self.mover_shape[r, slot] = shape[new]
+        self.mover_pos[r, slot, 0] = x[new]
+        self.mover_pos[r, slot, 1] = y[new]
+        self.mover_cooldown[r, slot] = 0
+        self.mover_vel[r, slot] = self._launch_velocity(kind)
+
+    def _launch_velocity(self, kind):
+        """Initial (dx, dy) per new mover, as the obstacle classes pick them."""
+        k = len(kind)
+        rng = self.rng
+        sign = rng.choice([-1.0, 1.0], (k, 2))
+        # diagonal: one random speed on both axes
+        vel = sign * rng.uniform(C.MOVING_OBSTACLE_SPEED, C.MOVING_OBSTACLE_SPEED_MAX, (k, 1))
+        # orthogonal: base speed along one random axis
+        ortho = kind == ORTHOGONAL
+        axis = rng.integers(0, 2, k)
+        vel[ortho] = 0.0
+        vel[ortho, axis[ortho]] = sign[ortho, 0] * C.MOVING_OBSTACLE_SPEED
+        # seeker: random heading at seeker speed
+        seek = kind == SEEKER
+        angle = rng.uniform(0, 2 * np.pi, k)
+        vel[seek, 0] = np.cos(angle[seek]) * C.SEEKER_OBSTACLE_SPEED
+        vel[seek, 1] = np.sin(angle[seek]) * C.SEEKER_OBSTACLE_SPEED
+        return vel
+
+    def _level_kinds(self, rows):
+        """Obstacle kind an apple spawns on each game's level (level 5 mixes all four)."""
+        level = self.level[rows]
+        return np.where(level >= 5, self.rng.integers(0, 4, len(rows)), np.minimum(level, 4) - 1)
+
+    # ------------------------------------------------------------ moving obstacles
+    def _touches(self, g, pos, shape, hx, hy):
+        """Whether each mover (game g, anchor pos, shape) overlaps a static cell or a snake
+        segment other than the head at (hx, hy).  Like Game's pygame rects, a cell only
+        reaches into the next column / row once it is a whole pixel across."""
+        w, h = self.width, self.height
+        base = g * (w * h)
+        x0 = np.floor(pos[:, 0]).astype(np.int64)
+        y0 = np.floor(pos[:, 1]).astype(np.int64)
+        spill_x = np.floor((pos[:, 0] - x0) * C.GRID_SIZE) >= 1
+        spill_y = np.floor((pos[:, 1] - y0) * C.GRID_SIZE) >= 1
+        hit = np.zeros(len(g), bool)
+        for j in range(SHAPE_CELLS):
+            k = np.flatnonzero(SHAPE_USED[shape, j])
+            bx = x0[k] + SHAPE_OFFSETS[shape[k], j, 0]
+            by = y0[k] + SHAPE_OFFSETS[shape[k], j, 1]
+            for ox, oy in ((0, 0), (1, 0), (0, 1), (1, 1)):
+                sel = np.ones(len(k), bool)
+                if ox:
+                    sel &= spill_x[k]
+                if oy:
+                    sel &= spill_y[k]
+                cx, cy = bx + ox, by + oy
+                sel &= (cx >= 0) & (cx < w) & (cy >= 0) & (cy < h)
+                kk, cx, cy = k[sel], cx[sel], cy[sel]
+                idx = base[kk] + cy * w + cx
+                on_head = (cx == hx[kk]) & (cy == hy[kk])
+                hit[kk[(self._flat_occ[idx] > on_head) | self._flat_static[idx]]] = True
+        return hit
+
+    def _move_obstacles(self, rows):
+        """MovingObstacle / SeekerObstacle.update for every mover of the games in `rows`."""
+        g, s = np.nonzero(self.mover_kind[rows] > 0)
+        if not len(g):
+            return
+        w, h = self.width, self.height
+        hx, hy = self._heads(rows)
+        hx, hy = hx[g], hy[g]
+        g = rows[g]
+        f = g * C.VEC_MAX_MOVERS + s
+        pos = self._mover_pos[f]
+        vel = self._mover_vel[f]
+
+        # seekers steer toward the head before moving
+        seek = self._mover_kind[f] == SEEKER
+        if seek.any():
+            tx, ty = hx - pos[:, 0], hy - pos[:, 1]
+            dist = np.hypot(tx, ty)
+            seek &= dist > 0
+            dist = np.where(seek, dist, 1.0)
+            spd = C.SEEKER_OBSTACLE_SPEED
+            turn = np.minimum(C.SEEKER_TURN_RATE_MAX, C.SEEKER_TURN_RATE_SCALE / dist)
+            vx = vel[:, 0] + (tx / dist * spd - vel[:, 0]) * turn
+            vy = vel[:, 1] + (ty / dist * spd - vel[:, 1]) * turn
+            cur = np.hypot(vx, vy)
+            seek &= cur > 0
+            cur = np.where(seek, cur, 1.0)
+            vel[:, 0] = np.where(seek, vx / cur * spd, vel[:, 0])
+            vel[:, 1] = np.where(seek, vy / cur * spd, vel[:, 1])
+
+        pos += vel
+        for axis, size in ((0, w), (1, h)):
+            p = pos[:, axis]
+            if C.WALL_COLLISION:
+                low, high = p < 0, p > size - 1
+                pos[:, axis] = np.where(low, 0, np.where(high, size - 1, p))
+                vel[:, axis] = np.where(low | high, -vel[:, axis], vel[:, axis])
+            else:
+                pos[:, axis] = np.where(p < 0, p + size, np.where(p >= size, p - size, p))
+
+        # bouncing off the body or a static block reverses and nudges the mover
+        bounce = self._touches(g, pos, self._mover_shape[f], hx, hy)
+        vel[bounce] = -vel[bounce]
+        pos[bounce] += vel[bounce] * 0.1
+        self._mover_pos[f] = pos
+        self._mover_vel[f] = vel
+
+    def _mover_hits(self, rows, hx, hy):
+        """First mover overlapping each game's head (ignoring ones on cooldown).
+        Returns the games hit and the slot that hit them."""
+        g, s = np.nonzero((self.mover_kind[rows] > 0) & (self.mover_cooldown[rows] == 0))
+        if not len(g):
+            return rows[:0], s
+        grid = C.GRID_SIZE
+        f = rows[g] * C.VEC_MAX_MOVERS + s
+        pos = np.floor(self._mover_pos[f] * grid)
+        shape = self._mover_shape[f]
+        hx, hy = hx[g] * grid, hy[g] * grid
+        touch = np.zeros(len(g), bool)
+        for j in range(SHAPE_CELLS):
+            px = pos[:, 0] + SHAPE_OFFSETS[shape, j, 0] * grid
+            py = pos[:, 1] + SHAPE_OFFSETS[shape, j, 1] * grid
+            touch |= SHAPE_USED[shape, j] & (np.abs(px - hx) < grid) & (np.abs(py - hy) < grid)
+        g, s = g[touch], s[touch]
+        first = np.unique(g, return_index=True)[1]   # np.nonzero is row-major: lowest slot first
+        return rows[g[first]], s[first]
+
+    # ------------------------------------------------------------ collisions
+    def _eat_apples(self, rows, reward):
+        self.combo[rows] += 1
+        self.combo_timer[rows] = C.COMBO_WINDOW
+        mult = np.minimum(self.combo[rows], C.COMBO_MAX_MULT)
+        gained = np.where(self.buffs[rows, DOUBLE] > 0, 2, 1) * mult
+        self.score[rows] += gained
+        reward[rows] += gained
+        self.apples[rows] += 1
+        grow = rows[self.buffs[rows, NO_GROW] == 0]
+        self.length[grow] = np.minimum(self.length[grow] + 1, self.cap - 1)
+        self._spawn_obstacles(rows, self._level_kinds(rows))
+        self._place_apples(rows)
+        lucky = self.rng.random(len(rows)) < C.MAGIC_APPLE_SPAWN_PROBABILITY
+        self._spawn_magic(rows[lucky & (self.magic_kind[rows] < 0)])
+        self.level[rows] = np.maximum(self.level[rows],
+                                      1 + (self.apples[rows, None] >= THRESHOLDS).sum(axis=1))
+
+    def _eat_magic(self, rows, reward):
+        kind = self.magic_kind[rows].astype(np.int64)
+        self.score[rows] += 5
+        reward[rows] += 5
+        self.length[rows] = np.minimum(self.length[rows] + 1, self.cap - 1)
+        self.magic_kind[rows] = -1
+        self.magic_eaten[rows] += 1
+
+        lone = (kind == MAGIC_INDEX['freeze_obstacles']) & ~np.any(self.mover_kind[rows] > 0, axis=1)
+        kind[lone] = FREEZE_FALLBACK[self.rng.integers(0, len(FREEZE_FALLBACK), lone.sum())]
+        for magic, column, value in MAGIC_BUFFS:
+            self.buffs[rows[kind == magic], column] = value
+        for g in rows[kind == MAGIC_INDEX['shrink']]:
+            self._shrink(g)
+        swarm = rows[kind == MAGIC_INDEX['spawn_enemies']]
+        for _ in range(C.BUFF_SPAWN_ENEMIES_COUNT if len(swarm) else 0):
+            # kinds the player has met: static on level 1, up to seekers from level 4
+            self._spawn_obstacles(swarm, self.rng.integers(0, np.minimum(self.level[swarm], 4)))
+
+    def _shrink(self, g):
+        """Halve snake g from the tail (minimum: start length)."""
+        target = max(C.SNAKE_START_LENGTH, int(self.count[g]) // 2)
+        if target < self.count[g]:
+            idx = (self.head[g] - np.arange(target, self.count[g])) % self.cap
+            cells = self.body[g, idx].astype(np.int64)
+            np.subtract.at(self._occ[g], cells[:, 1] * self.width + cells[:, 0], 1)
+            self.count[g] = target
+        self.length[g] = target
+
+    def _obstacle_hit(self, rows, ended):
+        """Absorb a hit with a shield charge or end the game. Returns the survivors mask."""
+        shielded = self.buffs[rows, SHIELD] > 0
+        self.buffs[rows[shielded], SHIELD] -= 1
+        ended[rows[~shielded]] = True
+        return shielded
+
+    # ------------------------------------------------------------ tick
+    def step(self, actions=None):
+        """Advance every running game one tick.
+
+        actions: (N,) directions (0 up, 1 down, 2 left, 3 right, -1 keep going); None
+        keeps every heading.  Returns (reward, done): score gained this tick and the
+        games that ended on it.  With autoreset those restart before step() returns
+        and their last score is in final_score; otherwise they stay frozen until reset()."""
+        w, h = self.width, self.height
+        reward = np.zeros(self.n, np.int64)
+        ended = np.zeros(self.n, bool)
+        rows = np.flatnonzero(~self.done)
+
+        # --- turn; reversing onto the neck is ignored (Snake.change_direction)
+        if actions is not None:
+            a = np.asarray(actions)[rows]
+            turn = a >= 0
+            new = DIRECTIONS[np.where(turn, a, 0)]
+            turn &= np.any(new != -self.direction[rows], axis=1)
+            self.direction[rows[turn]] = new[turn]
+
+        # --- move: insert the head, then drop the tail unless growing (Snake.move)
+        hx, hy = self._heads(rows)
+        hx = hx + self.direction[rows, 0]
+        hy = hy + self.direction[rows, 1]
+        if C.WALL_COLLISION:
+            dead = (hx < 0) | (hx >= w) | (hy < 0) | (hy >= h)
+            hx, hy = np.clip(hx, 0, w - 1), np.clip(hy, 0, h - 1)
+        else:
+            dead = np.zeros(len(rows), bool)
+            hx, hy = hx % w, hy % h
+        cell = hy * w + hx
+        dead |= (self.buffs[rows, GHOST] == 0) & (self._occ[rows, cell] > 0)
+        ended[rows[dead]] = True
+        rows, hx, hy, cell = rows[~dead], hx[~dead], hy[~dead], cell[~dead]
+
+        head = (self.head[rows] + 1) % self.cap
+        self.head[rows] = head
+        self.body[rows, head, 0] = hx
+        self.body[rows, head, 1] = hy
+        self._occ[rows, cell] += 1
+        self.count[rows] += 1
+        over = rows[self.count[rows] > self.length[rows]]
+        tail = self.body[over, (self.head[over] - self.count[over] + 1) % self.cap].astype(np.int64)
+        self._occ[over, tail[:, 1] * w + tail[:, 0]] -= 1
+        self.count[over] -= 1
+
+        # --- timers: buffs (the shield counts charges, not ticks) and the combo window
+        self.buffs[rows, :SHIELD] = np.maximum(self.buffs[rows, :SHIELD] - 1, 0)
+        timer = self.combo_timer[rows]
+        self.combo[rows[timer == 1]] = 0
+        self.combo_timer[rows] = np.maximum(timer - 1, 0)
+        self.ticks[rows] += 1
+
+        # --- mechanics: obstacles (unless frozen), magic apple lifespan, hit cooldowns
+        self._move_obstacles(rows[self.buffs[rows, FREEZE] == 0])
+        magic = rows[self.magic_kind[rows] >= 0]
+        self.magic_life[magic] -= 1
+        self.magic_kind[magic[self.magic_life[magic] <= 0]] = -1
+        self.mover_cooldown[rows] = np.maximum(self.mover_cooldown[rows] - 1, 0)
+        self.static_cooldown[rows] = np.maximum(self.static_cooldown[rows] - 1, 0)
+
+        # --- collisions, in check_collisions order
+        eat = (hx == self.apple[rows, 0]) & (hy == self.apple[rows, 1])
+        if eat.any():
+            self._eat_apples(rows[eat], reward)
+        eat = ((self.magic_kind[rows] >= 0)
+               & (hx == self.magic[rows, 0]) & (hy == self.magic[rows, 1]))
+        if eat.any():
+            self._eat_magic(rows[eat], reward)
+
+        solid = self.buffs[rows, GHOST] == 0
+        hit = solid & (self.static_cooldown[rows] == 0) & self._static[rows, cell]
+        if hit.any():
+            hit = rows[hit]
+            self.static_cooldown[hit[self._obstacle_hit(hit, ended)]] = C.OBSTACLE_HIT_COOLDOWN
+        check = solid & ~ended[rows]
+        hit, slot = self._mover_hits(rows[check], hx[check], hy[check])
+        if len(hit):
+            ok = self._obstacle_hit(hit, ended)
+            self.mover_cooldown[hit[ok], slot[ok]] = C.OBSTACLE_HIT_COOLDOWN
+
+        # --- finished games
+        finished = np.flatnonzero(ended)
+        if len(finished):
+            self.final_score[finished] = self.score[finished]
+            self.episodes += len(finished)
+            self.done[finished] = True
+            if self.autoreset:
+                self.reset(finished)
+        return reward, ended
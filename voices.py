@@ -0,0 +1,117 @@
+"""
+Mixer voice management.
+
+Every sound belongs to a category in C.VOICE_CATEGORIES.  A category owns a
+pool of reserved mixer channels, so a burst of one kind of sound (say
+obstacle removal at high game speed) can never starve the others and the
+number of voices the mixer mixes stays bounded.  On top of that each sound is
+
+  * coalesced – a repeat within the category's window is merged into the
+    voice that just started instead of stacking a second identical one, and
+  * rate limited – at most N plays per second per sound.
+
+stats() reports what was played, merged, dropped and cut off, per category.
+"""
+
+import time
+from collections import deque
+
+from pygame import mixer
+
+import constants as C
+
+
+class _Pool:
+    __slots__ = ('channels', 'coalesce', 'max_per_sec', 'started',
+                 'played', 'coalesced', 'rate_limited', 'stolen')
+
+    def __init__(self, channels, coalesce_ms, max_per_sec):
+        self.channels = channels
+        self.coalesce = coalesce_ms / 1000.0
+        self.max_per_sec = max_per_sec
+        self.started = {}          # channel index -> start time of its current voice
+        self.played = 0
+        self.coalesced = 0
+        self.rate_limited = 0
+        self.stolen = 0
+
+
+class VoiceManager:
+    """Routes Sound playback through per-category reserved channel pools."""
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._pools = None           # built on first play, once the mixer is up
+        self._last_play = {}         # sound key -> time of the last accepted play
+        self._recent = {}            # sound key -> deque of play times within the last second
+
+    def _setup(self):
+        """Reserve a contiguous block of channels per category."""
+        total = sum(spec[0] for spec in C.VOICE_CATEGORIES.values())
+        if mixer.get_num_channels() < total + C.VOICE_FREE_CHANNELS:
+            mixer.set_num_channels(total + C.VOICE_FREE_CHANNELS)
+        mixer.set_reserved(total)   # Sound.play() / find_channel() never pick these
+        self._pools = {}
+        index = 0
+        for category, (count, coalesce_ms, max_per_sec) in C.VOICE_CATEGORIES.items():
+            channels = [mixer.Channel(i) for i in range(index, index + count)]
+            self._pools[category] = _Pool(channels, coalesce_ms, max_per_sec)
+            index += count
+
+    def play(self, key, sound):
+        """Play `sound` (registered as `key` in C.SOUNDS). Returns True if a voice started."""
+        if self._pools is None:
+            if mixer.get_init() is None:
+                return False
+            self._setup()
+        pool = self._pools[C.SOUNDS[key][3]]
+        now = self._clock()
+
+        # Coalesce: the same sound just started – the existing voice covers this trigger
+        last = self._last_play.get(key)
+        if last is not None and now - last < pool.coalesce:
+            pool.coalesced += 1
+            return False
+
+        # Rate limit: at most max_per_sec plays of this sound in any one-second window
+        recent = self._recent.setdefault(key, deque())
+        while recent and now - recent[0] >= 1.0:
+            recent.popleft()
+        if len(recent) >= pool.max_per_sec:
+            pool.rate_limited += 1
+            return False
+
+        # Pick an idle channel in the pool, otherwise cut off the oldest voice
+        slot = None
+        for i, channel in enumerate(pool.channels):
+            if not channel.get_busy():
+                slot = i
+                break
+        if slot is None:
+            slot = min(pool.started, key=pool.started.get)
+            pool.stolen += 1
+        pool.channels[slot].play(sound)
+        pool.started[slot] = now
+        pool.played += 1
+        self._last_play[key] = now
+        recent.append(now)
+        return True
+
+    def stats(self):
+        """{category: {'played', 'coalesced', 'rate_limited', 'stolen', 'busy'}}.
+
+        Safe after the mixer has shut down (main.py prints it once run() returned);
+        busy is 0 then."""
+        if self._pools is None:
+            return {}
+        mixing = mixer.get_init() is not None
+        return {
+            category: {
+                'played': pool.played,
+                'coalesced': pool.coalesced,
+                'rate_limited': pool.rate_limited,
+                'stolen': pool.stolen,
+                'busy': sum(1 for ch in pool.channels if ch.get_busy()) if mixing else 0,
+            }
+            for category, pool in self._pools.items()
+        }
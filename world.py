@@ -0,0 +1,218 @@
+"""
+Chunked, procedurally generated world for endless mode (--endless).
+
+The unbounded board is split into CHUNK_SIZE × CHUNK_SIZE chunks.  Only the
+chunks within CHUNK_ACTIVE_RADIUS of the chunk holding the snake head are
+"active": their obstacles and magic apples live in the Game's normal lists
+and are simulated every tick.  Everything else is either
+
+  * never visited – regenerated on demand from the world seed, or
+  * evicted       – packed into a compact byte blob (save_state.pack_entities)
+                    and kept in an LRU store of at most CHUNK_MAX_STORED chunks.
+
+Chunks that fall out of the LRU store are simply regenerated from the seed if
+the snake ever returns, so memory and per-tick cost stay bounded no matter how
+far the snake travels.
+"""
+
+import random
+import struct
+from collections import OrderedDict
+
+import constants as C
+import save_state
+
+_BLOB_HEADER = struct.Struct('<B')          # 1 = chunk content has been generated
+_WORLD_HEADER = struct.Struct('<qiiI')      # seed (any int64, --seed may be negative), centre chunk x/y, stored chunk count
+_STORED_CHUNK = struct.Struct('<iiI')       # chunk x, chunk y, blob length
+
+
+class ChunkWorld:
+    """Streams chunks of the endless world in and out around the snake head."""
+
+    def __init__(self, seed, head):
+        self.seed = seed
+        self.center = self.chunk_of(*head)
+        self.active = set()             # chunk keys currently simulated
+        self.stored = OrderedDict()     # chunk key -> evicted blob, oldest first
+        self._sweep_timer = 0
+        # Counters (exposed for the debug overlay / metrics)
+        self.generated = 0              # chunks built from the seed
+        self.restored = 0               # chunks loaded back from an evicted blob
+        self.evicted = 0                # chunks packed away
+        self.dropped = 0                # blobs discarded by the LRU cap
+
+    # ------------------------------------------------------------------ geometry
+    @staticmethod
+    def chunk_of(gx, gy):
+        """Chunk key containing board cell (gx, gy); floats are floored."""
+        return int(gx // C.CHUNK_SIZE), int(gy // C.CHUNK_SIZE)
+
+    def wanted_chunks(self):
+        cx, cy = self.center
+        r = C.CHUNK_ACTIVE_RADIUS
+        return {(cx + dx, cy + dy) for dx in range(-r, r + 1) for dy in range(-r, r + 1)}
+
+    def active_bounds(self):
+        """(x0, y0, x1, y1) cell bounds of the active area, x1/y1 exclusive."""
+        cx, cy = self.center
+        r = C.CHUNK_ACTIVE_RADIUS
+        return ((cx - r) * C.CHUNK_SIZE, (cy - r) * C.CHUNK_SIZE,
+                (cx + r + 1) * C.CHUNK_SIZE, (cy + r + 1) * C.CHUNK_SIZE)
+
+    # ------------------------------------------------------------------ streaming
+    def update(self, game, force=False):
+        """Called once per tick.  Re-balances the active set when the head changes
+        chunk, and every CHUNK_SWEEP_INTERVAL ticks evicts movers that wandered off."""
+        center = self.chunk_of(*game.snake.get_head_position())
+        self._sweep_timer += 1
+        if not force and center == self.center and self._sweep_timer < C.CHUNK_SWEEP_INTERVAL:
+            return
+        self._sweep_timer = 0
+        self.center = center
+        wanted = self.wanted_chunks()
+
+        # Pack away everything whose chunk is no longer active
+        outgoing = {}
+        game.obstacles = self._split(game.obstacles, wanted, outgoing, 0,
+                                     lambda ob: (ob.x, ob.y))
+        game.moving_obstacles = self._split(game.moving_obstacles, wanted, outgoing, 1,
+                                            lambda mob: (mob.float_x, mob.float_y))
+        game.magic_apples = self._split(game.magic_apples, wanted, outgoing, 2,
+                                        lambda ma: (ma.x, ma.y))
+        for key in self.active - wanted:
+            outgoing.setdefault(key, ([], [], []))
+        for key, groups in outgoing.items():
+            for ob in groups[0] + groups[1]:
+                game.obstacle_hit_cooldowns.pop(ob, None)
+            self._store(key, groups, generated=key in self.active)
+
+        # Bring in chunks that just became active
+        for key in wanted - self.active:
+            self._load(key, game)
+        self.active = wanted
+
+        # The single normal apple always lives inside the active area
+        x0, y0, x1, y1 = self.active_bounds()
+        if not (x0 <= game.apple.x < x1 and y0 <= game.apple.y < y1):
+            game.apple.respawn(game._get_occupied_positions(), bounds=(x0, y0, x1, y1))
+
+    def _split(self, entities, wanted, outgoing, slot, pos):
+        """Return the entities inside `wanted` chunks; file the rest under outgoing[key][slot]."""
+        keep = []
+        for ent in entities:
+            key = self.chunk_of(*pos(ent))
+            if key in wanted:
+                keep.append(ent)
+            else:
+                outgoing.setdefault(key, ([], [], []))[slot].append(ent)
+        return keep
+
+    def _store(self, key, groups, generated):
+        """Pack entities into the chunk's blob, merging with anything already stored there."""
+        if key in self.stored:
+            blob = self.stored.pop(key)
+            was_generated = _BLOB_HEADER.unpack_from(blob)[0]
+            old = save_state.unpack_entities(blob[_BLOB_HEADER.size:])
+            groups = tuple(o + n for o, n in zip(old, groups))
+            generated = generated or was_generated
+        self.stored[key] = _BLOB_HEADER.pack(1 if generated else 0) + save_state.pack_entities(*groups)
+        self.evicted += 1
+        while len(self.stored) > C.CHUNK_MAX_STORED:
+            self.stored.popitem(last=False)
+            self.dropped += 1
+
+    def _load(self, key, game):
+        blob = self.stored.pop(key, None)
+        generated = False
+        if blob is not None:
+            generated = _BLOB_HEADER.unpack_from(blob)[0]
+            obstacles, moving, magic = save_state.unpack_entities(blob[_BLOB_HEADER.size:])
+            game.obstacles.extend(obstacles)
+            game.moving_obstacles.extend(moving)
+            game.magic_apples.extend(magic)
+            self.restored += 1
+        if not generated:
+            self._generate(key, game)
+
+    # ------------------------------------------------------------------ generation
+    def _generate(self, key, game):
+        """Deterministically populate a chunk from (seed, chunk key).
+        Difficulty grows with the chunk's ring distance from the origin."""
+        from game_objects import (Obstacle, MovingObstacle, OrthogonalMovingObstacle,
+                                  SeekerObstacle, MagicApple)
+        self.generated += 1
+        cx, cy = key
+        ring = max(abs(cx), abs(cy))
+        if ring < C.CHUNK_SAFE_RING:
+            return   # keep the starting area clear
+        rng = random.Random(f'{self.seed}:{cx}:{cy}')
+        x0, y0 = cx * C.CHUNK_SIZE, cy * C.CHUNK_SIZE
+        occupied = set(game._get_occupied_positions())
+        occupied.add((game.apple.x, game.apple.y))
+
+        def free_cells(shape, x, y):
+            cells = [(x + dx, y + dy) for (dx, dy) in shape]
+            if any(c in occupied for c in cells):
+                return None
+            return cells
+
+        # Static obstacles
+        lo, hi = C.CHUNK_STATIC_OBSTACLES
+        for _ in range(rng.randint(lo, hi + ring // 2)):
+            shape = rng.choices(C.OBSTACLE_SHAPES, weights=C.OBSTACLE_SHAPE_WEIGHTS, k=1)[0]
+            x = x0 + rng.randrange(C.CHUNK_SIZE - 1)
+            y = y0 + rng.randrange(C.CHUNK_SIZE - 1)
+            cells = free_cells(shape, x, y)
+            if cells:
+                game.obstacles.append(Obstacle(x, y, shape=shape))
+                occupied.update(cells)
+
+        # Moving enemies unlock ring by ring, mirroring the level order
+        kinds = [k for k, unlock in C.CHUNK_MOVING_UNLOCK_RING.items() if ring >= unlock]
+        if kinds:
+            lo, hi = C.CHUNK_MOVING_OBSTACLES
+            for _ in range(rng.randint(lo, hi)):
+                kind = rng.choice(kinds)
+                x = x0 + rng.randrange(C.CHUNK_SIZE - 1)
+                y = y0 + rng.randrange(C.CHUNK_SIZE - 1)
+                if kind == 'orthogonal':
+                    shape = rng.choices(C.OBSTACLE_SHAPES, weights=C.OBSTACLE_SHAPE_WEIGHTS, k=1)[0]
+                    if free_cells(shape, x, y):
+                        game.moving_obstacles.append(OrthogonalMovingObstacle(x, y, shape=shape, rng=rng))
+                elif free_cells([(0, 0)], x, y):
+                    cls = SeekerObstacle if kind == 'seeker' else MovingObstacle
+                    game.moving_obstacles.append(cls(x, y, rng=rng))
+
+        # Occasional magic apple
+        if rng.random() < C.CHUNK_MAGIC_APPLE_PROBABILITY:
+            x = x0 + rng.randrange(C.CHUNK_SIZE)
+            y = y0 + rng.randrange(C.CHUNK_SIZE)
+            if (x, y) not in occupied:
+                game.magic_apples.append(MagicApple(x, y, force_type=rng.choice(C.MAGIC_APPLE_TYPES), rng=rng))
+
+    # ------------------------------------------------------------------ persistence
+    def to_bytes(self):
+        """Serialize the seed and evicted chunks (active entities are saved with the game)."""
+        parts = [_WORLD_HEADER.pack(self.seed, self.center[0], self.center[1], len(self.stored))]
+        for (cx, cy), blob in self.stored.items():
+            parts.append(_STORED_CHUNK.pack(cx, cy, len(blob)))
+            parts.append(blob)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuild a world written by to_bytes(); raises save_state.SnapshotError when corrupted."""
+        try:
+            seed, cx, cy, count = _WORLD_HEADER.unpack_from(data)
+            offset = _WORLD_HEADER.size
+            world = cls(seed, (cx * C.CHUNK_SIZE, cy * C.CHUNK_SIZE))
+            for _ in range(count):
+                kx, ky, length = _STORED_CHUNK.unpack_from(data, offset)
+                offset += _STORED_CHUNK.size
+                world.stored[(kx, ky)] = bytes(data[offset:offset + length])
+                offset += length
+        except struct.error as e:
+            raise save_state.SnapshotError(f"world block is corrupted: {e}") from e
+        world.active = world.wanted_chunks()
+        return world